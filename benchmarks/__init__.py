@@ -0,0 +1,12 @@
+"""
+Benchmarks de performance sur données synthétiques (10k à 10M sessions).
+
+Cas couverts : chargement du dataset consolidé, filtrage par période et
+KPI du tableau de bord, scoring ML unitaire et par lot, consolidation
+journalière, contexte SOC du LLM, figures Plotly. Les temps de référence
+sont dans `benchmarks/baselines.json`.
+
+    python -m benchmarks.run                          # 10k, 100k, 1M
+    python -m benchmarks.run --scales 10k,10M --cases score_batch
+    python -m benchmarks.run --update-baselines       # après un gain voulu
+"""
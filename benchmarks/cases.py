@@ -0,0 +1,206 @@
+"""
+Cas mesurés par la suite de benchmarks.
+
+Chaque cas prépare ses entrées à partir d'un `Workload` (données
+synthétiques d'un volume donné, générées une fois et partagées entre les
+cas) et retourne la fonction chronométrée. Seul l'appel de cette fonction
+est mesuré.
+"""
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import synthetic
+from secureops.consolidation import consolidate
+from secureops.kpi_index import KpiRangeIndex
+from secureops.rollups import build_rollups, rollup_range
+from secureops.soc_context import SocContextBuilder
+from secureops.storage import read_table
+
+# Colonnes lues par le tableau de bord (ui.data.DASHBOARD_COLUMNS, sans importer Streamlit)
+DASHBOARD_COLUMNS = [
+    "date", "total_sessions", "anomalies_detected", "high_risk_sessions", "critical_incidents",
+    "total_incidents", "total_tickets", "avg_incident_duration_days", "p95_resolution_minutes",
+    "avg_ip_reputation",
+]
+
+# Écart toléré par défaut avant de signaler une régression (temps / référence)
+DEFAULT_THRESHOLD = 1.5
+
+PERIOD_QUERIES = 50
+SINGLE_ROW_CALLS = 100
+
+
+class Workload:
+    """Données synthétiques d'un volume de sessions, construites à la demande"""
+
+    def __init__(self, n_sessions):
+        self.n_sessions = n_sessions
+        self.days = synthetic.days_for(n_sessions)
+        self._dir = None
+        self._cache = {}
+
+    @property
+    def store_dir(self):
+        """Store Parquet synthétique (sources + table consolidée)"""
+        if self._dir is None:
+            self._dir = Path(tempfile.mkdtemp(prefix=f"secureops-bench-{self.n_sessions}-"))
+            synthetic.write_store(self._dir, self.n_sessions)
+            consolidate(processed_dir=self._dir, full=True)
+        return self._dir
+
+    def get(self, name, build):
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    def consolidated(self):
+        return self.get("consolidated", lambda: read_table(
+            "consolidated_soc", columns=DASHBOARD_COLUMNS, processed_dir=self.store_dir))
+
+    def features(self):
+        return self.get("features", lambda: synthetic.session_features(self.n_sessions))
+
+    def pipeline(self):
+        def load():
+            from secureops.model_registry import ModelRegistry
+            return ModelRegistry().active().pipeline
+        return self.get("pipeline", load)
+
+    def periods(self):
+        """Périodes aléatoires (début, fin) couvrant l'historique"""
+        def build():
+            rng = np.random.default_rng(0)
+            end = synthetic.END_DATE
+            starts = end - pd.to_timedelta(rng.integers(7, self.days, PERIOD_QUERIES), unit="D")
+            return [(s, s + pd.Timedelta(days=int(d))) for s, d in
+                    zip(starts, rng.integers(7, 365, PERIOD_QUERIES))]
+        return self.get("periods", build)
+
+    def close(self):
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+        self._cache.clear()
+
+
+class Case:
+    """Cas de benchmark : `setup(workload)` retourne la fonction chronométrée"""
+
+    def __init__(self, name, setup, description, scaled=True, calls=1, threshold=DEFAULT_THRESHOLD):
+        self.name = name
+        self.setup = setup
+        self.description = description
+        # Cas indépendant du volume : mesuré au plus petit volume seulement
+        self.scaled = scaled
+        # Appels par mesure : le temps reporté est ramené à un appel
+        self.calls = calls
+        self.threshold = threshold
+
+
+# =====================================================================
+# CAS
+# =====================================================================
+def _load_consolidated(w):
+    store = w.store_dir
+    return lambda: read_table("consolidated_soc", columns=DASHBOARD_COLUMNS, processed_dir=store)
+
+
+def _kpi_index_build(w):
+    df = w.consolidated()
+    metrics = [c for c in DASHBOARD_COLUMNS if c != "date"]
+    return lambda: KpiRangeIndex(df, metrics)
+
+
+def _period_kpis(w):
+    index = KpiRangeIndex(w.consolidated(), [c for c in DASHBOARD_COLUMNS if c != "date"])
+    periods = w.periods()
+
+    def run():
+        for start, end in periods:
+            lo, hi = index.bounds(start, end)
+            for m in ("anomalies_detected", "high_risk_sessions", "critical_incidents", "total_tickets"):
+                index.sum(m, lo, hi)
+            index.mean("avg_incident_duration_days", lo, hi)
+    return run
+
+
+def _period_filter_mask(w):
+    # Filtrage par masque booléen (chemin de l'export CSV et des pages sans index)
+    df = w.consolidated()
+    periods = w.periods()
+
+    def run():
+        for start, end in periods:
+            period = df[(df["date"] >= start) & (df["date"] <= end)]
+            period[["anomalies_detected", "high_risk_sessions", "critical_incidents", "total_tickets"]].sum()
+            period["avg_incident_duration_days"].mean()
+    return run
+
+
+def _score_single(w):
+    pipeline = w.pipeline()
+    session = w.features().iloc[0].to_dict()
+
+    def run():
+        for _ in range(SINGLE_ROW_CALLS):
+            pipeline.decision_function(session)
+    return run
+
+
+def _score_batch(w):
+    pipeline = w.pipeline()
+    features = w.features()
+    return lambda: pipeline.decision_function(features)
+
+
+def _consolidation(w):
+    store = w.store_dir
+    return lambda: consolidate(processed_dir=store, full=True)
+
+
+def _groq_context(w):
+    store = w.store_dir
+    daily = w.consolidated()
+
+    def run():
+        # Construction à froid : KPI glissants + lecture des sources + rendu borné
+        builder = SocContextBuilder()
+        builder.update_kpis(daily)
+        builder.refresh_sources(processed_dir=store)
+        return builder.render()
+    return run
+
+
+def _plotly_figures(w):
+    from ui.dashboard import anomalies_figure, multi_figure, risk_figure, trend_figure
+
+    df = w.consolidated()
+    rollups = build_rollups(df)
+    trend_df, trend_grain = rollup_range(rollups, df["date"].min(), df["date"].max())
+    chart_df, _ = rollup_range(rollups, synthetic.END_DATE - pd.Timedelta(days=89), synthetic.END_DATE)
+
+    def run():
+        trend_figure(trend_df, trend_grain)
+        anomalies_figure(chart_df)
+        risk_figure(chart_df)
+        multi_figure(chart_df)
+    return run
+
+
+CASES = [
+    Case("load_consolidated_data", _load_consolidated, "Lecture de consolidated_soc (colonnes du tableau de bord)"),
+    Case("kpi_index_build", _kpi_index_build, "Construction de l'index KPI (préfixes + sparse tables)"),
+    Case("period_kpis_index", _period_kpis, f"{PERIOD_QUERIES} périodes : bornes + KPI via l'index",
+         threshold=2.0),
+    Case("period_kpis_mask", _period_filter_mask, f"{PERIOD_QUERIES} périodes : masque booléen + sommes"),
+    Case("score_single", _score_single, "decision_function sur une session (dict)", scaled=False,
+         calls=SINGLE_ROW_CALLS, threshold=2.0),
+    Case("score_batch", _score_batch, "decision_function sur toutes les sessions"),
+    Case("consolidation", _consolidation, "Consolidation journalière complète (lecture, agrégats, écriture)"),
+    Case("groq_context", _groq_context, "Contexte SOC du LLM construit à froid"),
+    Case("plotly_figures", _plotly_figures, "Figures du tableau de bord (tendance, anomalies, risque, multi)",
+         threshold=2.0),
+]
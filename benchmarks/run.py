@@ -0,0 +1,170 @@
+"""
+Exécution de la suite et comparaison aux références.
+
+Chaque cas est mesuré à chaque volume demandé : une exécution d'échauffement
+(sauf si elle dépasse déjà le budget), puis des répétitions jusqu'à
+`--repeat` ou au budget de temps. Le temps retenu est la médiane. Un cas
+est en régression si son temps dépasse `seuil x référence` ; le code de
+sortie vaut alors 1 (utilisable en CI).
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.cases import CASES, Workload
+
+BASELINES_PATH = Path(__file__).resolve().parent / "baselines.json"
+
+DEFAULT_SCALES = "10k,100k,1M"
+DEFAULT_REPEAT = 5
+# Budget de mesure par cas et par volume (secondes)
+TIME_BUDGET_S = 3.0
+
+
+def parse_scale(label):
+    """'10k' -> 10 000, '1M' -> 1 000 000"""
+    label = label.strip()
+    factor = {"k": 1_000, "K": 1_000, "m": 1_000_000, "M": 1_000_000}.get(label[-1])
+    return int(float(label[:-1]) * factor) if factor else int(label)
+
+
+def scale_label(n):
+    if n >= 1_000_000 and n % 1_000_000 == 0:
+        return f"{n // 1_000_000}M"
+    if n >= 1_000 and n % 1_000 == 0:
+        return f"{n // 1_000}k"
+    return str(n)
+
+
+def measure(fn, repeat=DEFAULT_REPEAT, budget_s=TIME_BUDGET_S):
+    """Médiane des temps d'exécution (secondes)"""
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    if first >= budget_s:
+        return first, 1
+
+    samples, spent = [], first
+    while len(samples) < repeat and (not samples or spent < budget_s):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+        spent += samples[-1]
+    return statistics.median(samples), len(samples)
+
+
+def load_baselines(path=BASELINES_PATH):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"meta": {}, "results": {}}
+
+
+def save_baselines(baselines, path=BASELINES_PATH):
+    baselines["meta"] = {
+        "updated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+    }
+    Path(path).write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def run(scales, cases, repeat=DEFAULT_REPEAT, budget_s=TIME_BUDGET_S, baselines=None, on_result=None):
+    """[{case, scale, seconds, runs, baseline, ratio, regression}]"""
+    results = (baselines or {}).get("results", {})
+    rows = []
+    for i, n in enumerate(sorted(scales)):
+        workload = Workload(n)
+        try:
+            for case in cases:
+                if not case.scaled and i > 0:
+                    continue
+                label = scale_label(n) if case.scaled else "-"
+                fn = case.setup(workload)
+                seconds, runs = measure(fn, repeat, budget_s)
+                seconds /= case.calls
+                baseline = results.get(case.name, {}).get(label)
+                ratio = seconds / baseline if baseline else None
+                row = {
+                    "case": case.name, "scale": label, "seconds": seconds, "runs": runs,
+                    "baseline": baseline, "ratio": ratio,
+                    "regression": ratio is not None and ratio > case.threshold,
+                }
+                rows.append(row)
+                if on_result is not None:
+                    on_result(row)
+        finally:
+            workload.close()
+    return rows
+
+
+def _format_seconds(seconds):
+    if seconds is None:
+        return "—"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _print_row(row):
+    ratio = f"x{row['ratio']:.2f}" if row["ratio"] is not None else "nouveau"
+    flag = "❌ RÉGRESSION" if row["regression"] else ""
+    print(f"{row['case']:<24} {row['scale']:>5} {_format_seconds(row['seconds']):>10} "
+          f"({row['runs']}x)  réf. {_format_seconds(row['baseline']):>10}  {ratio:>8} {flag}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks SecureOps (données synthétiques)")
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help="Volumes de sessions, ex. 10k,100k,1M,10M")
+    parser.add_argument("--cases", default=None, help="Cas à exécuter (noms séparés par des virgules)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--budget", type=float, default=TIME_BUDGET_S, help="Budget de mesure par cas (s)")
+    parser.add_argument("--update-baselines", action="store_true",
+                        help="Enregistre les temps mesurés comme nouvelles références")
+    parser.add_argument("--list", action="store_true", help="Liste les cas")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for case in CASES:
+            print(f"{case.name:<24} seuil x{case.threshold:<4} {case.description}")
+        return 0
+
+    cases = CASES
+    if args.cases:
+        names = set(args.cases.split(","))
+        unknown = names - {c.name for c in CASES}
+        if unknown:
+            parser.error(f"Cas inconnus : {', '.join(sorted(unknown))}")
+        cases = [c for c in CASES if c.name in names]
+
+    scales = [parse_scale(s) for s in args.scales.split(",")]
+    baselines = load_baselines()
+    print(f"🏁 {len(cases)} cas x volumes {', '.join(scale_label(n) for n in sorted(scales))}")
+    rows = run(scales, cases, args.repeat, args.budget, baselines, on_result=_print_row)
+
+    if args.update_baselines:
+        for row in rows:
+            baselines["results"].setdefault(row["case"], {})[row["scale"]] = row["seconds"]
+        save_baselines(baselines)
+        print(f"\n💾 Références mises à jour : {BASELINES_PATH}")
+        return 0
+
+    regressions = [r for r in rows if r["regression"]]
+    if regressions:
+        print(f"\n❌ {len(regressions)} régression(s) au-delà du seuil")
+        return 1
+    print("\n✅ Aucune régression")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
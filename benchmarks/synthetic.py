@@ -0,0 +1,126 @@
+"""
+Données synthétiques aux schémas du store, à volume choisi.
+
+Les distributions imitent les tables traitées (sessions réseau, incidents,
+tickets) sans chercher le réalisme statistique : les benchmarks mesurent
+des volumes, pas la qualité de détection. Les générateurs sont déterministes
+(graine fixe) pour que deux exécutions mesurent le même travail.
+"""
+import numpy as np
+import pandas as pd
+
+from secureops.features import derive_features
+from secureops.storage import coerce, table_path, write_table
+
+SEED = 0
+END_DATE = pd.Timestamp("2025-12-31")
+
+# Historique couvert selon le volume : ~2 000 sessions / jour, borné à [90 j, 10 ans]
+SESSIONS_PER_DAY = 2_000
+MIN_DAYS = 90
+MAX_DAYS = 3_650
+
+# Sessions générées et écrites par blocs : mémoire bornée jusqu'à 10M sessions
+CHUNK_SESSIONS = 1_000_000
+
+# Colonnes de intrusion_processed lues par la consolidation et le contexte LLM
+STORE_SESSION_COLUMNS = ["session_id", "anomaly", "high_risk_session", "packet_size", "ip_reputation_score",
+                         "risk_level", "risk_drivers", "event_date"]
+
+# Volumes des autres sources, relatifs aux sessions
+INCIDENTS_PER_SESSION = 0.05
+TICKETS_PER_SESSION = 0.1
+
+MODEL_FEATURES = [
+    "packet_size", "login_attempts_count", "failed_logins_count",
+    "session_duration_seconds", "ip_reputation_score", "unusual_time_access",
+]
+
+
+def days_for(n_sessions):
+    return int(np.clip(n_sessions // SESSIONS_PER_DAY, MIN_DAYS, MAX_DAYS))
+
+
+def _event_dates(rng, n, days):
+    return _to_dates(np.sort(rng.integers(0, days, n)), days)
+
+
+def _to_dates(offsets, days):
+    return END_DATE - pd.to_timedelta(days - 1 - offsets, unit="D")
+
+
+def session_features(n, seed=SEED):
+    """Colonnes d'entrée du modèle (scoring)"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "packet_size": rng.integers(64, 1500, n, dtype=np.int32),
+        "login_attempts_count": rng.poisson(4, n).astype(np.int32),
+        "failed_logins_count": rng.poisson(1.5, n).astype(np.int32),
+        "session_duration_seconds": rng.exponential(800, n),
+        "ip_reputation_score": rng.beta(4, 3, n),
+        "unusual_time_access": rng.random(n) < 0.15,
+    })
+
+
+def sessions(n, days=None, seed=SEED, first_id=0, offsets=None):
+    """Sessions au schéma intrusion_processed (features SOC dérivées comme à l'ingestion)"""
+    rng = np.random.default_rng(seed + 1)
+    days = days or days_for(n)
+    df = session_features(n, seed)
+    df["encryption_used"] = rng.choice(["AES", "DES", "No"], n, p=[0.5, 0.3, 0.2])
+    df = derive_features(df)
+    df["session_id"] = "SID_" + pd.Series(np.arange(first_id, first_id + n)).astype(str)
+    df["anomaly"] = (rng.random(n) < 0.15).astype(np.int8)
+    df["event_date"] = _event_dates(rng, n, days) if offsets is None else _to_dates(offsets, days)
+    return df
+
+
+def incidents(n, days, seed=SEED):
+    rng = np.random.default_rng(seed + 2)
+    return pd.DataFrame({
+        "incident_id": np.arange(n, dtype=np.int64),
+        "breach_type": rng.choice(["Hacking/IT Incident", "Unauthorized Access/Disclosure",
+                                   "Theft", "Loss", "Improper Disposal"], n),
+        "critical_incident": (rng.random(n) < 0.2).astype(np.int8),
+        "incident_duration_days": rng.exponential(3, n),
+        "event_date": _event_dates(rng, n, days),
+    })
+
+
+def tickets(n, days, seed=SEED):
+    rng = np.random.default_rng(seed + 3)
+    return pd.DataFrame({
+        "Ticket ID": "T" + pd.Series(np.arange(n)).astype(str),
+        "resolution_time_minutes": rng.gamma(2, 90, n),
+        "event_date": _event_dates(rng, n, days),
+    })
+
+
+def write_store(directory, n_sessions, seed=SEED):
+    """Écrit les trois tables sources dans `directory` ; retourne le nombre de jours couverts"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    days = days_for(n_sessions)
+    # Dates triées sur l'ensemble des sessions, découpées ensuite par bloc
+    offsets = np.sort(np.random.default_rng(seed).integers(0, days, n_sessions))
+    path = table_path("intrusion_processed", directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = None
+    try:
+        for start in range(0, n_sessions, CHUNK_SESSIONS):
+            stop = min(start + CHUNK_SESSIONS, n_sessions)
+            chunk = sessions(stop - start, days, seed + start, first_id=start, offsets=offsets[start:stop])
+            table = pa.Table.from_pandas(coerce(chunk[STORE_SESSION_COLUMNS], "intrusion_processed"),
+                                         schema=writer.schema if writer else None, preserve_index=False)
+            writer = writer or pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    del offsets
+    write_table(incidents(max(1, int(n_sessions * INCIDENTS_PER_SESSION)), days, seed),
+                "incidents_processed", directory)
+    write_table(tickets(max(1, int(n_sessions * TICKETS_PER_SESSION)), days, seed),
+                "tickets_processed", directory)
+    return days
@@ -0,0 +1,3 @@
+"""
+Briques réutilisables de la plateforme SOC SecureOps (scoring ML, données, jobs).
+"""
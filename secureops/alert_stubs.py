@@ -0,0 +1,97 @@
+"""
+Puits d'alertes locaux pour les tests : serveur SMTP et webhook minimalistes.
+
+Chaque alerte reçue est affichée sur la sortie standard :
+    python -m secureops.alert_stubs [--smtp-port 1025] [--webhook-port 8765]
+"""
+import argparse
+import json
+import socketserver
+import threading
+from email import message_from_bytes
+from email.policy import default
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Sous-ensemble de SMTP suffisant pour smtplib (EHLO, MAIL, RCPT, DATA, QUIT)"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        self.reply("220 secureops-stub SMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250 secureops-stub")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = b""
+                for chunk in iter(self.rfile.readline, b""):
+                    if chunk in (b".\r\n", b".\n"):
+                        break
+                    data += chunk[1:] if chunk.startswith(b"..") else chunk
+                message = message_from_bytes(data, policy=default)
+                print(f"📧 [SMTP] {message['Subject']} -> {message['To']}", flush=True)
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class _SmtpServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            text = json.loads(body).get("text", "")
+        except ValueError:
+            text = body.decode("utf-8", "replace")
+        print(f"🔔 [WEBHOOK {self.path}] {text}", flush=True)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(smtp_port=1025, webhook_port=8765, host="localhost"):
+    """Démarre les deux serveurs dans des threads ; retourne (smtp, webhook)"""
+    smtp = _SmtpServer((host, smtp_port), _SmtpHandler)
+    webhook = ThreadingHTTPServer((host, webhook_port), _WebhookHandler)
+    for server in (smtp, webhook):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return smtp, webhook
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Puits SMTP / webhook locaux pour les alertes SOC")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--smtp-port", type=int, default=1025)
+    parser.add_argument("--webhook-port", type=int, default=8765)
+    args = parser.parse_args()
+
+    serve(args.smtp_port, args.webhook_port, args.host)
+    print(f"✅ SMTP sur {args.host}:{args.smtp_port} | webhook sur http://{args.host}:{args.webhook_port}/")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+"""
+Moteur d'alertes à seuils sur le flux de sessions.
+
+- Compteurs glissants par seaux (`WindowCounter`) : chaque événement met à
+  jour l'état en O(1) amorti, quelle que soit la taille de la fenêtre.
+- Règles (`AlertRule`) : alerte quand le nombre d'événements de la fenêtre
+  atteint le seuil. Déduplication : une seule alerte tant que la condition
+  dure ; la règle est réarmée quand le compteur repasse sous le seuil, et
+  ne peut pas se redéclencher avant la fin du délai de réarmement.
+- Livraison asynchrone (`AlertDispatcher`) : file bornée + thread dédié
+  vers des puits interchangeables (SMTP, webhook). Une file pleine fait
+  perdre des alertes (comptées), jamais ralentir le flux.
+- `SessionMonitor` : thread qui lit dans le store les seules sessions
+  arrivées depuis le dernier passage et les soumet au moteur.
+
+Le temps des règles est celui des événements (`event_date` des sessions),
+pas l'horloge murale : un lot ingéré en retard est compté à ses dates.
+Les sessions du store ne sont datées qu'au jour près (date du fichier ou
+`--event-date` à l'ingestion) : fenêtres et seuils se raisonnent en jours.
+Les lectures d'état (`snapshot`) ne modifient jamais les compteurs.
+
+Puits locaux de test : python -m secureops.alert_stubs
+"""
+import json
+import queue
+import smtplib
+import threading
+import time
+import urllib.request
+from collections import deque
+from email.message import EmailMessage
+
+import numpy as np
+
+from secureops.storage import PROCESSED_DIR, read_table, table_mtime
+
+DAY_S = 24 * 3600
+DEFAULT_WINDOW_S = DAY_S
+DEFAULT_COOLDOWN_S = DAY_S
+WINDOW_BUCKETS = 60
+HISTORY_SIZE = 200
+DISPATCH_QUEUE_SIZE = 1000
+MONITOR_POLL_S = 5.0
+
+
+# =====================================================================
+# FENÊTRES GLISSANTES
+# =====================================================================
+class WindowCounter:
+    """Somme glissante sur `window_s` secondes, par seaux de `window_s / buckets`"""
+
+    def __init__(self, window_s, buckets=WINDOW_BUCKETS):
+        self.window_s = window_s
+        self.bucket_s = window_s / buckets
+        self._buckets = [0] * buckets
+        self._current = None
+        self._total = 0
+
+    def _advance(self, bucket):
+        size = len(self._buckets)
+        if self._current is None or bucket - self._current >= size:
+            self._buckets = [0] * size
+            self._total = 0
+        else:
+            # Seaux sortis de la fenêtre : chacun n'est vidé qu'une fois
+            for b in range(self._current + 1, bucket + 1):
+                self._total -= self._buckets[b % size]
+                self._buckets[b % size] = 0
+        self._current = bucket
+
+    def add(self, ts, count=1):
+        bucket = int(ts // self.bucket_s)
+        if self._current is None or bucket > self._current:
+            self._advance(bucket)
+        elif bucket <= self._current - len(self._buckets):
+            return  # trop ancien : hors fenêtre
+        self._buckets[bucket % len(self._buckets)] += count
+        self._total += count
+
+    def total(self, ts=None):
+        """Somme de la fenêtre qui finit à `ts` (défaut : dernier seau alimenté), en lecture seule"""
+        if ts is None or self._current is None:
+            return self._total
+        bucket = int(ts // self.bucket_s)
+        size = len(self._buckets)
+        if bucket <= self._current:
+            return self._total
+        if bucket - self._current >= size:
+            return 0
+        # Seaux qui sortiraient de la fenêtre à `ts` ; l'état n'avance qu'avec `add`
+        expired = range(self._current - size + 1, bucket - size + 1)
+        return self._total - sum(self._buckets[b % size] for b in expired)
+
+
+# =====================================================================
+# RÈGLES & MOTEUR
+# =====================================================================
+class AlertRule:
+    """Seuil sur le nombre d'événements `column` (0/1 ou compte) dans la fenêtre"""
+
+    def __init__(self, name, column, label, threshold, severity="ÉLEVÉ",
+                 window_s=DEFAULT_WINDOW_S, cooldown_s=DEFAULT_COOLDOWN_S):
+        self.name = name
+        self.column = column
+        self.label = label
+        self.threshold = threshold
+        self.severity = severity
+        self.cooldown_s = cooldown_s
+        self.counter = WindowCounter(window_s)
+        self.armed = True
+        self.last_fired = None
+
+    @property
+    def window_s(self):
+        return self.counter.window_s
+
+    def check(self, ts):
+        """Alerte (dict) si le seuil vient d'être atteint, sinon None"""
+        count = self.counter.total(ts)
+        if not self.threshold or count < self.threshold:
+            self.armed = True
+            return None
+        if not self.armed:
+            return None  # condition déjà signalée : dédupliquée
+        if self.last_fired is not None and ts - self.last_fired < self.cooldown_s:
+            return None
+        self.armed = False
+        self.last_fired = ts
+        return {
+            "rule": self.name,
+            "label": self.label,
+            "severity": self.severity,
+            "count": int(count),
+            "threshold": self.threshold,
+            "window_s": self.window_s,
+            "ts": ts,
+        }
+
+
+def default_rules(anomalies=1500, high_risk=6000, window_s=DEFAULT_WINDOW_S):
+    """
+    Règles des ⚙️ Paramètres : anomalies et sessions à haut risque. Seuils
+    par défaut juste au-dessus du volume d'une journée du jeu de référence
+    (~1 400 anomalies, ~5 400 sessions à haut risque sur ~9 500).
+    """
+    return [
+        AlertRule("anomalies", "anomaly", "Anomalies détectées", anomalies, "CRITIQUE", window_s),
+        AlertRule("high_risk", "high_risk_session", "Sessions à haut risque", high_risk, "ÉLEVÉ", window_s),
+    ]
+
+
+def format_window(window_s):
+    """Durée de fenêtre lisible : en jours dès qu'elle en compte un nombre entier"""
+    if window_s >= DAY_S and window_s % DAY_S == 0:
+        return f"{window_s // DAY_S:g} j"
+    return f"{window_s / 60:g} min"
+
+
+def format_alert(alert):
+    window = format_window(alert["window_s"])
+    return (f"🚨 [{alert['severity']}] {alert['label']} : {alert['count']} sur {window} "
+            f"(seuil {alert['threshold']})")
+
+
+class AlertEngine:
+    """Évalue les règles à chaque événement ; alertes transmises au dispatcher"""
+
+    def __init__(self, rules, dispatcher=None, history_size=HISTORY_SIZE):
+        self.rules = {rule.name: rule for rule in rules}
+        self.dispatcher = dispatcher
+        self.history = deque(maxlen=history_size)
+        self.events = 0
+        # Instant du dernier événement observé (temps des événements)
+        self.last_ts = None
+        self._lock = threading.Lock()
+
+    def configure(self, thresholds=None, window_s=None, cooldown_s=None):
+        """Modifie seuils / fenêtre / réarmement ; une nouvelle fenêtre repart de zéro"""
+        with self._lock:
+            for name, threshold in (thresholds or {}).items():
+                self.rules[name].threshold = threshold
+            for rule in self.rules.values():
+                if window_s is not None and window_s != rule.window_s:
+                    rule.counter = WindowCounter(window_s)
+                    rule.armed = True
+                if cooldown_s is not None:
+                    rule.cooldown_s = cooldown_s
+
+    def observe(self, ts, counts, events=1):
+        """Ajoute `counts` ({colonne: nombre}) à l'instant `ts` ; retourne les alertes émises"""
+        fired = []
+        with self._lock:
+            self.events += events
+            self.last_ts = ts if self.last_ts is None else max(self.last_ts, ts)
+            for rule in self.rules.values():
+                count = counts.get(rule.column, 0)
+                if count:
+                    rule.counter.add(ts, count)
+                alert = rule.check(ts)
+                if alert is not None:
+                    self.history.append(alert)
+                    fired.append(alert)
+        if self.dispatcher is not None:
+            for alert in fired:
+                self.dispatcher.submit(alert)
+        return fired
+
+    def process_event(self, event, ts=None):
+        """Une session (mapping colonne -> valeur)"""
+        ts = time.time() if ts is None else ts
+        return self.observe(ts, {rule.column: event.get(rule.column, 0) or 0 for rule in self.rules.values()})
+
+    def process_frame(self, df, ts=None, ts_col=None):
+        """
+        Lot de sessions, agrégé par seau de temps avant évaluation.
+
+        Sans `ts_col`, le lot entier est daté de son arrivée (`ts`, défaut
+        maintenant) : une seule mise à jour par règle quel que soit le volume.
+        """
+        columns = sorted({rule.column for rule in self.rules.values()} & set(df.columns))
+        if df.empty:
+            return []
+        if ts_col is None:
+            ts = time.time() if ts is None else ts
+            counts = {c: int(df[c].sum()) for c in columns}
+            return self.observe(ts, counts, events=len(df))
+
+        # Datation par événement : sommes par seau (le plus fin des règles), dans l'ordre
+        bucket_s = min(rule.counter.bucket_s for rule in self.rules.values())
+        stamps = df[ts_col].to_numpy(dtype="datetime64[ns]").astype(np.int64) / 1e9
+        buckets = np.floor(stamps / bucket_s).astype(np.int64)
+        order = np.argsort(buckets, kind="stable")
+        buckets = buckets[order]
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        sums = {c: np.add.reduceat(df[c].to_numpy()[order].astype(np.int64), starts) for c in columns}
+        sizes = np.diff(np.r_[starts, len(buckets)])
+        fired = []
+        for i, bucket in enumerate(buckets[starts]):
+            fired += self.observe(bucket * bucket_s, {c: int(sums[c][i]) for c in columns}, events=int(sizes[i]))
+        return fired
+
+    def snapshot(self, ts=None):
+        """
+        État à l'instant `ts` (défaut : dernier événement observé) : par règle
+        (compte, seuil, armée) + alertes récentes. Lecture seule.
+        """
+        with self._lock:
+            ts = self.last_ts if ts is None else ts
+            rules = {
+                name: {"label": rule.label, "count": int(rule.counter.total(ts)), "threshold": rule.threshold,
+                       "window_s": rule.window_s, "armed": rule.armed, "last_fired": rule.last_fired}
+                for name, rule in self.rules.items()
+            }
+            return {"events": self.events, "last_ts": self.last_ts, "rules": rules,
+                    "history": list(self.history)}
+
+
+# =====================================================================
+# LIVRAISON
+# =====================================================================
+class SmtpSink:
+    """E-mail via un serveur SMTP (local par défaut : python -m secureops.alert_stubs)"""
+
+    name = "email"
+
+    def __init__(self, host="localhost", port=1025, sender="soc@secureops.local",
+                 recipients=("soc-team@secureops.local",), timeout=5):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = list(recipients)
+        self.timeout = timeout
+
+    def send(self, alert):
+        message = EmailMessage()
+        message["Subject"] = f"[SecureOps SOC] {alert['severity']} - {alert['label']}"
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        message.set_content(format_alert(alert) + "\n\n" + json.dumps(alert, ensure_ascii=False, indent=2))
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            smtp.send_message(message)
+
+
+class WebhookSink:
+    """POST JSON au format webhook Slack ({"text": ...}, + l'alerte détaillée)"""
+
+    name = "slack"
+
+    def __init__(self, url="http://localhost:8765/slack", timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, alert):
+        body = json.dumps({"text": format_alert(alert), "alert": alert}, ensure_ascii=False).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class AlertDispatcher:
+    """File bornée + thread de livraison ; l'échec d'un puits n'affecte pas les autres"""
+
+    def __init__(self, sinks=(), max_queue=DISPATCH_QUEUE_SIZE):
+        self.sinks = list(sinks)
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._counters = {"queued": 0, "dropped": 0}
+        self._per_sink = {}
+        self._thread = threading.Thread(target=self._worker, name="alert-dispatch", daemon=True)
+        self._thread.start()
+
+    def set_sinks(self, sinks):
+        with self._lock:
+            self.sinks = list(sinks)
+
+    def submit(self, alert):
+        """Met l'alerte en file sans bloquer ; False si la file est pleine"""
+        try:
+            self._queue.put_nowait(alert)
+        except queue.Full:
+            with self._lock:
+                self._counters["dropped"] += 1
+            return False
+        with self._lock:
+            self._counters["queued"] += 1
+        return True
+
+    def join(self):
+        """Attend la livraison des alertes en file"""
+        self._queue.join()
+
+    def _worker(self):
+        while True:
+            alert = self._queue.get()
+            try:
+                with self._lock:
+                    sinks = list(self.sinks)
+                for sink in sinks:
+                    try:
+                        sink.send(alert)
+                        outcome, error = "delivered", None
+                    except Exception as e:
+                        outcome, error = "failed", f"{type(e).__name__}: {e}"
+                    with self._lock:
+                        stats = self._per_sink.setdefault(sink.name, {"delivered": 0, "failed": 0, "last_error": None})
+                        stats[outcome] += 1
+                        if error:
+                            stats["last_error"] = error
+            finally:
+                self._queue.task_done()
+
+    def stats(self):
+        with self._lock:
+            snapshot = dict(self._counters)
+            snapshot["pending"] = self._queue.qsize()
+            snapshot["sinks"] = {name: dict(s) for name, s in self._per_sink.items()}
+        return snapshot
+
+
+# =====================================================================
+# FLUX DE SESSIONS
+# =====================================================================
+class SessionMonitor:
+    """
+    Soumet au moteur les sessions arrivées dans le store depuis le dernier passage.
+
+    Le fichier n'est relu que si sa date de modification change, à partir de
+    la dernière `event_date` vue ; les sessions de cette date déjà traitées
+    sont écartées par identifiant. Les sessions présentes au démarrage ne
+    déclenchent pas d'alerte.
+    """
+
+    COLUMNS = ["session_id", "anomaly", "high_risk_session", "event_date"]
+
+    def __init__(self, engine, name="intrusion_processed", poll_s=MONITOR_POLL_S, processed_dir=PROCESSED_DIR):
+        self.engine = engine
+        self.name = name
+        self.poll_s = poll_s
+        self.processed_dir = processed_dir
+        self.watermark = None
+        self.sessions = 0
+        self.last_poll = None
+        self._seen = set()
+        self._mtime = None
+        self._primed = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _file_mtime(self):
+        return table_mtime(self.name, self.processed_dir)
+
+    def _prime(self):
+        """Point de départ : sessions déjà présentes dans le store"""
+        self._mtime = self._file_mtime()
+        self._primed = True
+        if self._mtime is None:
+            return
+        dates = read_table(self.name, columns=["event_date"], processed_dir=self.processed_dir)["event_date"]
+        if dates.notna().any():
+            self.watermark = dates.max()
+            ids = read_table(self.name, columns=["session_id"], filters=[("event_date", "==", self.watermark)],
+                             processed_dir=self.processed_dir)["session_id"]
+            self._seen = set(ids.astype(str))
+
+    def poll(self):
+        """Traite les nouvelles sessions ; retourne leur nombre"""
+        self.last_poll = time.time()
+        if not self._primed:
+            self._prime()
+            return 0
+        mtime = self._file_mtime()
+        if mtime is None or mtime == self._mtime:
+            return 0
+        self._mtime = mtime
+        filters = [("event_date", ">=", self.watermark)] if self.watermark is not None else None
+        rows = read_table(self.name, columns=self.COLUMNS, filters=filters, processed_dir=self.processed_dir)
+        if self.watermark is not None:
+            ids = rows["session_id"].astype(str)
+            rows = rows[~((rows["event_date"] == self.watermark) & ids.isin(self._seen))]
+        if rows.empty:
+            return 0
+
+        # Fenêtres en temps d'événement : un lot en retard est daté de ses sessions
+        self.engine.process_frame(rows, ts_col="event_date")
+        self.sessions += len(rows)
+        latest = rows["event_date"].max()
+        at_latest = rows.loc[rows["event_date"] == latest, "session_id"].astype(str)
+        if self.watermark is not None and latest == self.watermark:
+            self._seen.update(at_latest)
+        else:
+            self._seen = set(at_latest)
+        self.watermark = latest
+        return len(rows)
+
+    def _loop(self):
+        while True:
+            try:
+                self.poll()
+            except Exception:
+                pass
+            if self._stop.wait(self.poll_s):
+                return
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="alert-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
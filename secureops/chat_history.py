@@ -0,0 +1,177 @@
+"""
+Historique de conversation de l'assistant SOC, borné en mémoire.
+
+Les échanges sont écrits dans SQLite (consultables page par page) ; la
+session Streamlit ne garde qu'un tampon circulaire des derniers échanges.
+Les échanges qui sortent du tampon sont condensés dans un résumé glissant,
+de taille bornée, envoyé au LLM comme contexte de conversation.
+"""
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+HISTORY_PATH = Path(__file__).resolve().parent.parent / ".cache" / "chat_history.sqlite"
+
+DEFAULT_BUFFER_SIZE = 10
+DEFAULT_PAGE_SIZE = 10
+
+# Bornes du contexte de conversation envoyé au LLM (en caractères)
+SUMMARY_MAX_CHARS = 1500
+RECENT_TURNS_IN_PROMPT = 4
+RECENT_TURN_MAX_CHARS = 400
+QUESTION_MAX_CHARS = 160
+ANSWER_MAX_CHARS = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS turns (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    conversation TEXT NOT NULL,
+    role TEXT NOT NULL,
+    message TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS turns_conversation ON turns (conversation, id);
+CREATE TABLE IF NOT EXISTS summaries (
+    conversation TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    folded_turns INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def _shorten(text, max_chars):
+    text = " ".join(text.split())
+    return text if len(text) <= max_chars else text[:max_chars - 1].rstrip() + "…"
+
+
+class ChatStore:
+    """Échanges de toutes les conversations (SQLite, partagé entre sessions)"""
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def append(self, conversation, role, message, created_at=None):
+        created_at = created_at or time.time()
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO turns (conversation, role, message, created_at) VALUES (?, ?, ?, ?)",
+                (conversation, role, message, created_at)
+            )
+            return cursor.lastrowid
+
+    def count(self, conversation):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM turns WHERE conversation = ?", (conversation,)).fetchone()[0]
+
+    def page(self, conversation, page=0, page_size=DEFAULT_PAGE_SIZE):
+        """Page `page` (0 = plus récente) : [(id, role, message, created_at)], du plus récent au plus ancien"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT id, role, message, created_at FROM turns WHERE conversation = ? "
+                "ORDER BY id DESC LIMIT ? OFFSET ?",
+                (conversation, page_size, page * page_size)
+            ).fetchall()
+
+    def summary(self, conversation):
+        """(résumé, nombre d'échanges condensés)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT summary, folded_turns FROM summaries WHERE conversation = ?", (conversation,)
+            ).fetchone()
+        return row if row is not None else ("", 0)
+
+    def save_summary(self, conversation, summary, folded_turns):
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (conversation, summary, folded_turns, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (conversation, summary, folded_turns, time.time())
+            )
+
+    def clear(self, conversation):
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM turns WHERE conversation = ?", (conversation,))
+            conn.execute("DELETE FROM summaries WHERE conversation = ?", (conversation,))
+
+
+class ChatSession:
+    """
+    Conversation d'un analyste : tampon circulaire des derniers échanges
+    + résumé glissant des plus anciens.
+    """
+
+    def __init__(self, store, conversation, buffer_size=DEFAULT_BUFFER_SIZE):
+        self.store = store
+        self.conversation = conversation
+        self.buffer = deque(reversed(store.page(conversation, 0, buffer_size)), maxlen=buffer_size)
+        self.summary, self.folded_turns = store.summary(conversation)
+
+    def __len__(self):
+        return self.store.count(self.conversation)
+
+    def add(self, role, message):
+        created_at = time.time()
+        turn_id = self.store.append(self.conversation, role, message, created_at)
+        if len(self.buffer) == self.buffer.maxlen:
+            self._fold(self.buffer[0])
+        self.buffer.append((turn_id, role, message, created_at))
+
+    def _fold(self, turn):
+        """Condense un échange sortant du tampon dans le résumé (borné)"""
+        _, role, message, _ = turn
+        if role == "user":
+            line = f"- Q: {_shorten(message, QUESTION_MAX_CHARS)}"
+        else:
+            # Première ligne non vide de la réponse = synthèse
+            first = next((l for l in message.splitlines() if l.strip()), "")
+            line = f"  R: {_shorten(first, ANSWER_MAX_CHARS)}"
+
+        lines = self.summary.splitlines() + [line]
+        # Au-delà de la borne : les échanges les plus anciens sortent du résumé
+        while len("\n".join(lines)) > SUMMARY_MAX_CHARS and len(lines) > 1:
+            lines.pop(0)
+        self.summary = "\n".join(lines)
+        self.folded_turns += 1
+        self.store.save_summary(self.conversation, self.summary, self.folded_turns)
+
+    def recent(self, n=None):
+        """Derniers échanges du tampon, du plus récent au plus ancien"""
+        turns = list(reversed(self.buffer))
+        return turns if n is None else turns[:n]
+
+    def prompt_context(self):
+        """Contexte de conversation pour le LLM (taille bornée quelle que soit la durée)"""
+        parts = []
+        if self.summary:
+            parts.append(f"📝 ÉCHANGES ANTÉRIEURS ({self.folded_turns} messages, résumé):\n{self.summary}")
+        recent = list(self.buffer)[-RECENT_TURNS_IN_PROMPT:]
+        if recent:
+            lines = [
+                f"- {'Analyste' if role == 'user' else 'Assistant'}: {_shorten(message, RECENT_TURN_MAX_CHARS)}"
+                for _, role, message, _ in recent
+            ]
+            parts.append("💬 DERNIERS ÉCHANGES:\n" + "\n".join(lines))
+        return "\n\n".join(parts)
+
+    def clear(self):
+        self.store.clear(self.conversation)
+        self.buffer.clear()
+        self.summary, self.folded_turns = "", 0
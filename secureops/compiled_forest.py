@@ -0,0 +1,223 @@
+"""
+Évaluateur compilé de l'Isolation Forest.
+
+Tous les arbres sont aplatis dans des tableaux NumPy contigus (feature,
+seuil, enfant gauche, correction de longueur de chemin aux feuilles). Le parcours
+se fait pour tout un bloc de sessions et tous les arbres à la fois, sans le
+coût fixe d'un appel sklearn. Les scores sont identiques à
+`IsolationForest.decision_function`.
+
+Compilation d'un modèle :
+    python -m secureops.compiled_forest models/isolation_forest.pkl models/isolation_forest.npz
+"""
+import argparse
+import hashlib
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Nombre de sessions parcourues ensemble (borne la mémoire : bloc x arbres)
+BLOCK_SIZE = 256
+
+
+class CompiledForest:
+    """Forêt d'isolation sous forme de tableaux plats, chargeable depuis un .npz"""
+
+    def __init__(self, feature, threshold, child, leaf_value, roots,
+                 n_features, max_depth, denominator, offset, source_digest=""):
+        self.feature = np.ascontiguousarray(feature, dtype=np.intp)
+        self.threshold = np.ascontiguousarray(threshold, dtype=np.float64)
+        self.child = np.ascontiguousarray(child, dtype=np.intp)
+        self.leaf_value = np.ascontiguousarray(leaf_value, dtype=np.float64)
+        self.roots = np.ascontiguousarray(roots, dtype=np.intp)
+        self.n_features = int(n_features)
+        self.max_depth = int(max_depth)
+        self.denominator = float(denominator)
+        self.offset = float(offset)
+        # Empreinte du .pkl d'origine : permet de détecter un .npz périmé
+        self.source_digest = str(source_digest)
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        """Aplatit un `IsolationForest` entraîné"""
+        from sklearn.ensemble._iforest import _average_path_length
+
+        # sklearn ne sous-échantillonne les colonnes que si max_features < n_features
+        subsample = forest._max_features != forest.n_features_in_
+
+        features, thresholds, children, values, roots = [], [], [], [], []
+        base = 0
+        max_depth = 0
+        for est, est_features in zip(forest.estimators_, forest.estimators_features_):
+            tree = est.tree_
+
+            # Renumérotation en largeur : les deux enfants d'un nœud sont
+            # consécutifs (droite = gauche + 1), un seul tableau suffit
+            order = [0]
+            for node in order:
+                if tree.children_left[node] != -1:
+                    order += [tree.children_left[node], tree.children_right[node]]
+            order = np.asarray(order)
+            new_id = np.empty_like(order)
+            new_id[order] = np.arange(order.size)
+
+            is_leaf = tree.children_left[order] == -1
+            feat = np.where(is_leaf, 0, tree.feature[order])
+            if subsample:
+                feat = np.asarray(est_features)[feat]
+
+            # Les feuilles bouclent sur elles-mêmes (seuil infini) : le parcours
+            # fait un nombre fixe d'étapes sans test de fin
+            child = np.where(is_leaf, np.arange(order.size), new_id[np.where(is_leaf, 0, tree.children_left[order])])
+            threshold = np.where(is_leaf, np.inf, tree.threshold[order])
+
+            # Même correction que sklearn : profondeur + c(n_feuille) - 1
+            depths = tree.compute_node_depths()[order]
+            value = np.where(
+                is_leaf,
+                depths + _average_path_length(tree.n_node_samples[order]) - 1.0,
+                0.0,
+            )
+
+            features.append(feat)
+            thresholds.append(threshold)
+            children.append(child + base)
+            values.append(value)
+            roots.append(base)
+            max_depth = max(max_depth, tree.max_depth)
+            base += order.size
+
+        denominator = len(forest.estimators_) * _average_path_length([forest._max_samples])[0]
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            child=np.concatenate(children),
+            leaf_value=np.concatenate(values),
+            roots=np.asarray(roots),
+            n_features=forest.n_features_in_,
+            max_depth=max_depth,
+            denominator=denominator,
+            offset=forest.offset_,
+        )
+
+    # -----------------------------------------------------------------
+    # Scoring
+    # -----------------------------------------------------------------
+    def _path_lengths(self, X):
+        """Somme des longueurs de chemin sur tous les arbres, pour un bloc"""
+        n, n_trees = X.shape[0], self.roots.size
+        flat = X.ravel()
+        row_base = (np.arange(n, dtype=np.intp) * self.n_features)[:, None]
+
+        # Tampons réutilisés à chaque niveau : pas d'allocation dans la boucle
+        nodes = np.broadcast_to(self.roots, (n, n_trees)).copy()
+        idx = np.empty((n, n_trees), dtype=np.intp)
+        values = np.empty((n, n_trees), dtype=np.float32)
+        thresholds = np.empty((n, n_trees), dtype=np.float64)
+        go_right = np.empty((n, n_trees), dtype=bool)
+
+        for _ in range(self.max_depth):
+            np.take(self.feature, nodes, out=idx)
+            idx += row_base
+            np.take(flat, idx, out=values)
+            np.take(self.threshold, nodes, out=thresholds)
+            # sklearn : x <= seuil -> gauche, sinon droite
+            np.greater(values, thresholds, out=go_right)
+            np.take(self.child, nodes, out=nodes)
+            nodes += go_right
+        return self.leaf_value[nodes].sum(axis=1)
+
+    def score_samples(self, X):
+        # Même précision que sklearn : les arbres comparent des float32
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"{X.shape[1]} colonnes reçues, {self.n_features} attendues")
+        if not np.isfinite(X).all():
+            raise ValueError("Valeurs manquantes ou infinies dans les sessions à scorer")
+
+        depths = np.empty(X.shape[0], dtype=np.float64)
+        for start in range(0, X.shape[0], BLOCK_SIZE):
+            stop = start + BLOCK_SIZE
+            depths[start:stop] = self._path_lengths(X[start:stop])
+
+        if self.denominator == 0:
+            return -np.ones_like(depths)
+        return -(2 ** (-depths / self.denominator))
+
+    def decision_function(self, X):
+        return self.score_samples(X) - self.offset
+
+    def predict(self, X):
+        """Convention sklearn : -1 = anomalie, 1 = normal"""
+        return np.where(self.decision_function(X) < 0, -1, 1)
+
+    # -----------------------------------------------------------------
+    # Persistance
+    # -----------------------------------------------------------------
+    def save(self, path):
+        # Index stockés en entiers compacts, élargis au chargement
+        np.savez(
+            path,
+            feature=self.feature.astype(np.int16),
+            threshold=self.threshold,
+            child=self.child.astype(np.int32),
+            leaf_value=self.leaf_value,
+            roots=self.roots.astype(np.int32),
+            meta=np.array([self.n_features, self.max_depth, self.denominator, self.offset]),
+            source_digest=np.array(self.source_digest),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            n_features, max_depth, denominator, offset = data["meta"]
+            return cls(
+                feature=data["feature"],
+                threshold=data["threshold"],
+                child=data["child"],
+                leaf_value=data["leaf_value"],
+                roots=data["roots"],
+                n_features=n_features,
+                max_depth=max_depth,
+                denominator=denominator,
+                offset=offset,
+                source_digest=data["source_digest"].item() if "source_digest" in data else "",
+            )
+
+
+def file_digest(path):
+    """SHA-256 d'un fichier (quelques ms pour un modèle de quelques Mo)"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def main():
+    import joblib
+
+    parser = argparse.ArgumentParser(description="Compile un IsolationForest (.pkl) en tableaux NumPy (.npz)")
+    parser.add_argument("source", nargs="?", default="models/isolation_forest.pkl")
+    parser.add_argument("target", nargs="?", default="models/isolation_forest.npz")
+    args = parser.parse_args()
+
+    forest = joblib.load(args.source)
+    compiled = CompiledForest.from_sklearn(forest)
+    compiled.source_digest = file_digest(args.source)
+    compiled.save(args.target)
+
+    # Contrôle d'équivalence sur des sessions aléatoires
+    X = np.random.default_rng(0).normal(size=(2000, forest.n_features_in_))
+    max_diff = np.abs(compiled.decision_function(X) - forest.decision_function(X)).max()
+
+    start = time.perf_counter()
+    CompiledForest.load(args.target)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    print(f"✅ {args.target} : {len(compiled.feature):,} nœuds, {len(compiled.roots)} arbres")
+    print(f"   Taille : {Path(args.source).stat().st_size / 1e6:.2f} Mo -> {Path(args.target).stat().st_size / 1e6:.2f} Mo")
+    print(f"   Chargement : {load_ms:.1f} ms | écart max vs sklearn : {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
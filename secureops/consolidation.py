@@ -0,0 +1,250 @@
+"""
+Consolidation SOC incrémentale (KPI journaliers).
+
+Reprend l'« ÉTAPE 4 — CHARGEMENT CONSOLIDÉ » du notebook 01_eda_secureops :
+agrégation journalière des intrusions, incidents et tickets, puis fusion en
+une ligne par jour dans la table `consolidated_soc`.
+
+Un watermark (dernière date consolidée) est conservé à côté du store : un
+rafraîchissement réagrège le jour du watermark (des sessions ont pu y
+arriver depuis) et les jours suivants, puis remplace (upsert) ces jours
+dans la table consolidée.
+
+Rafraîchissement quotidien :
+    python -m secureops.consolidation
+Reprise à partir d'une date (données arrivées en retard) :
+    python -m secureops.consolidation --since 2025-12-01
+Reconstruction complète :
+    python -m secureops.consolidation --full
+"""
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from secureops.storage import PROCESSED_DIR, read_table, table_exists, table_path, write_table
+
+WATERMARK_FILE = "consolidated_soc.watermark.json"
+
+# Colonnes lues dans chaque source (projection sur le store)
+SOURCE_COLUMNS = {
+    "intrusion_processed": ["session_id", "anomaly", "high_risk_session", "packet_size",
+                            "ip_reputation_score", "event_date"],
+    "incidents_processed": ["incident_id", "critical_incident", "incident_duration_days", "event_date"],
+    "tickets_processed": ["Ticket ID", "resolution_time_minutes", "event_date"],
+}
+
+# KPI produits par chaque source
+SOURCE_KPIS = {
+    "intrusion_processed": ["total_sessions", "anomalies_detected", "high_risk_sessions",
+                            "avg_packet_size", "avg_ip_reputation"],
+    "incidents_processed": ["total_incidents", "critical_incidents", "avg_incident_duration_days",
+                            "critical_incident_rate"],
+    "tickets_processed": ["total_tickets", "avg_resolution_minutes", "p95_resolution_minutes"],
+}
+
+CONSOLIDATED_COLUMNS = ["date"] + [c for kpis in SOURCE_KPIS.values() for c in kpis]
+
+# KPI de comptage : NaN -> 0 après fusion
+FILL_ZERO_COLS = [
+    "total_sessions", "anomalies_detected", "high_risk_sessions",
+    "total_incidents", "critical_incidents", "total_tickets"
+]
+
+
+# =====================================================================
+# AGRÉGATIONS JOURNALIÈRES
+# =====================================================================
+def _event_day(df):
+    return pd.to_datetime(df["event_date"], errors="coerce").dt.normalize().rename("date")
+
+
+def aggregate_intrusion_daily(df):
+    return df.groupby(_event_day(df)).agg(
+        total_sessions=("session_id", "count"),
+        anomalies_detected=("anomaly", "sum"),
+        high_risk_sessions=("high_risk_session", "sum"),
+        avg_packet_size=("packet_size", "mean"),
+        avg_ip_reputation=("ip_reputation_score", "mean")
+    ).reset_index()
+
+
+def aggregate_incidents_daily(df):
+    daily = df.groupby(_event_day(df)).agg(
+        total_incidents=("incident_id", "count"),
+        critical_incidents=("critical_incident", "sum"),
+        avg_incident_duration_days=("incident_duration_days", "mean")
+    ).reset_index()
+    daily["critical_incident_rate"] = (
+        daily["critical_incidents"] / daily["total_incidents"]
+    ).replace([np.inf, -np.inf], np.nan)
+    return daily
+
+
+def _p95(values):
+    values = values.dropna()
+    return np.nanpercentile(values, 95) if values.shape[0] > 0 else np.nan
+
+
+def aggregate_tickets_daily(df):
+    return df.groupby(_event_day(df)).agg(
+        total_tickets=("Ticket ID", "count"),
+        avg_resolution_minutes=("resolution_time_minutes", "mean"),
+        p95_resolution_minutes=("resolution_time_minutes", _p95)
+    ).reset_index()
+
+
+AGGREGATORS = {
+    "intrusion_processed": aggregate_intrusion_daily,
+    "incidents_processed": aggregate_incidents_daily,
+    "tickets_processed": aggregate_tickets_daily,
+}
+
+
+def merge_daily(frames):
+    """Fusion externe des KPI journaliers par date (une ligne par jour)"""
+    consolidated = None
+    for daily in frames:
+        consolidated = daily if consolidated is None else consolidated.merge(daily, on="date", how="outer")
+
+    # Source sans évènement sur la période : ses KPI valent 0 / NaN
+    consolidated = consolidated.reindex(columns=CONSOLIDATED_COLUMNS)
+    for c in FILL_ZERO_COLS:
+        consolidated[c] = consolidated[c].fillna(0).astype(int)
+    return consolidated.sort_values("date").reset_index(drop=True)
+
+
+# =====================================================================
+# WATERMARK
+# =====================================================================
+def read_watermark(processed_dir=PROCESSED_DIR):
+    path = os.path.join(processed_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return pd.Timestamp(json.load(f)["last_date"])
+
+
+def write_watermark(last_date, processed_dir=PROCESSED_DIR):
+    path = os.path.join(processed_dir, WATERMARK_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({
+            "last_date": pd.Timestamp(last_date).strftime("%Y-%m-%d"),
+            "updated_at": datetime.now().isoformat(timespec="seconds")
+        }, f, indent=2)
+    os.replace(tmp, path)
+
+
+# =====================================================================
+# JOB DE CONSOLIDATION
+# =====================================================================
+def _read_existing(processed_dir):
+    try:
+        return read_table("consolidated_soc", processed_dir=processed_dir)
+    except FileNotFoundError:
+        return None
+
+
+def consolidate(processed_dir=PROCESSED_DIR, full=False, since=None, export_csv=False):
+    """
+    Réagrège les jours à partir du watermark (ou de `since`), inclus, et les
+    remplace dans `consolidated_soc`. Retourne un rapport {jours, lignes lues, watermark...}.
+    """
+    start = time.perf_counter()
+    existing = None if full else _read_existing(processed_dir)
+
+    # `lower` : premier jour réagrégé (inclus)
+    if full:
+        lower = None
+    elif since is not None:
+        lower = pd.Timestamp(since).normalize()
+    else:
+        lower = read_watermark(processed_dir)
+        if lower is None and existing is not None and not existing.empty:
+            lower = existing["date"].max()
+
+    # Jour du watermark relu en entier : son agrégat est recalculé puis remplacé
+    filters = [("event_date", ">=", lower)] if lower is not None else None
+
+    frames, rows_read, missing_sources = [], {}, []
+    for name, aggregate in AGGREGATORS.items():
+        if not table_exists(name, processed_dir):
+            missing_sources.append(name)
+            continue
+        source = read_table(name, columns=SOURCE_COLUMNS[name], filters=filters,
+                            processed_dir=processed_dir)
+        rows_read[name] = len(source)
+        if not source.empty:
+            frames.append(aggregate(source))
+
+    report = {"lower_bound": lower, "rows_read": rows_read, "days": 0,
+              "missing_sources": missing_sources}
+    if not frames:
+        report["seconds"] = time.perf_counter() - start
+        report["watermark"] = lower
+        return report
+
+    new_rows = merge_daily(frames)
+
+    # Source absente (ex. export ITSM non fourni) : on conserve ses KPI déjà consolidés
+    previous = existing if existing is not None else _read_existing(processed_dir)
+    carried = [c for name in missing_sources for c in SOURCE_KPIS[name]]
+    if previous is not None and carried:
+        carried = [c for c in carried if c in previous.columns]
+        keep = previous[["date"] + carried]
+        # Jours de la fenêtre recalculée où la source absente avait des valeurs
+        keep = keep[keep[carried].fillna(0).ne(0).any(axis=1)]
+        if lower is not None:
+            keep = keep[keep["date"] >= lower]
+        new_rows = new_rows.drop(columns=[c for c in carried if c in new_rows.columns])
+        new_rows = merge_daily([new_rows, keep])
+
+    # Upsert : les jours recalculés remplacent les anciennes lignes
+    if existing is not None and not existing.empty:
+        untouched = existing[~existing["date"].isin(new_rows["date"])]
+        consolidated = pd.concat([untouched, new_rows], ignore_index=True)
+    else:
+        consolidated = new_rows
+    consolidated = consolidated.sort_values("date").reset_index(drop=True)
+
+    write_table(consolidated, "consolidated_soc", processed_dir)
+    if export_csv:
+        consolidated.to_csv(table_path("consolidated_soc", processed_dir, suffix=".csv"), index=False)
+
+    watermark = consolidated["date"].max()
+    write_watermark(watermark, processed_dir)
+
+    report.update(days=len(new_rows), watermark=watermark, seconds=time.perf_counter() - start)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consolidation SOC journalière incrémentale")
+    parser.add_argument("--dir", default=str(PROCESSED_DIR), help="dossier des datasets traités")
+    parser.add_argument("--full", action="store_true", help="reconstruit tout l'historique")
+    parser.add_argument("--since", help="réagrège à partir de cette date incluse (AAAA-MM-JJ)")
+    parser.add_argument("--export-csv", action="store_true", help="réécrit aussi consolidated_soc.csv")
+    args = parser.parse_args()
+
+    report = consolidate(args.dir, full=args.full, since=args.since, export_csv=args.export_csv)
+
+    bound = report["lower_bound"].strftime("%Y-%m-%d") if report["lower_bound"] is not None else "début"
+    print(f"📅 Évènements à partir du : {bound}")
+    for name, rows in report["rows_read"].items():
+        print(f"   - {name}: {rows:,} lignes lues")
+    for name in report["missing_sources"]:
+        print(f"   ⚠️ {name} absent : KPI existants conservés")
+    if report["days"]:
+        print(f"✅ {report['days']} jour(s) consolidé(s) en {report['seconds']:.2f}s "
+              f"— watermark : {report['watermark']:%Y-%m-%d}")
+    else:
+        print("✅ Aucun nouveau jour à consolider")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Feature engineering SOC sur les sessions réseau.
+
+Mêmes règles que la section « FEATURE ENGINEERING SOC » du notebook
+01_eda_secureops, applicables à un DataFrame entier ou à un bloc de
+sessions (ingestion en flux).
+"""
+import numpy as np
+import pandas as pd
+
+# Renommage des colonnes du dataset brut cybersecurity_intrusion_data.csv
+RAW_RENAMES = {
+    "network_packet_size": "packet_size",
+    "login_attempts": "login_attempts_count",
+    "failed_logins": "failed_logins_count",
+    "session_duration": "session_duration_seconds"
+}
+
+# Pondération du score de risque (sur 100)
+RISK_WEIGHTS = {
+    "low_ip_reputation": 40,
+    "unusual_access": 30,
+    "high_failed_logins": 20,
+    "no_encryption": 10
+}
+
+# Libellés des règles, dans l'ordre d'affichage de `risk_drivers`
+DRIVER_LABELS = {
+    "low_ip_reputation": "Low IP reputation",
+    "unusual_access": "Unusual access time",
+    "high_failed_logins": "High failed logins",
+    "no_encryption": "No encryption"
+}
+NO_DRIVER_LABEL = "No strong indicator"
+
+
+def _driver_label(mask):
+    triggers = [label for bit, label in enumerate(DRIVER_LABELS.values()) if mask >> bit & 1]
+    return ", ".join(triggers) if triggers else NO_DRIVER_LABEL
+
+
+# Table de correspondance masque 4 bits -> explication (bit i = i-ème règle)
+DRIVER_LOOKUP = [_driver_label(mask) for mask in range(1 << len(DRIVER_LABELS))]
+
+
+def prepare_raw(df):
+    """
+    Nettoyage des sessions brutes : noms de colonnes et booléens SOC.
+
+    Le label brut `attack_detected` du dataset n'est pas conservé : comme
+    dans le notebook, la colonne est remplacée par `derive_features`.
+    """
+    df = df.rename(columns=RAW_RENAMES)
+    df["encryption_used"] = df["encryption_used"].fillna("Unknown")
+    df["unusual_time_access"] = df["unusual_time_access"].astype(bool)
+    return df
+
+
+def risk_level(score):
+    """High (>= 70) / Medium (>= 40) / Low, pour un vecteur de scores"""
+    return np.select([score >= 70, score >= 40], ["High", "Medium"], default="Low")
+
+
+def risk_driver_mask(df):
+    """Masque 4 bits des règles déclenchées (uint8, bit i = i-ème règle de DRIVER_LABELS)"""
+    mask = np.zeros(len(df), dtype=np.uint8)
+    for bit, flag in enumerate(DRIVER_LABELS):
+        mask |= df[flag].to_numpy(dtype=bool).astype(np.uint8) << bit
+    return mask
+
+
+def risk_drivers(df):
+    """
+    Explication lisible des règles déclenchées, en catégorielle.
+
+    Équivalent vectorisé de l'ancien `explain_row` : le masque sert
+    directement de code dans les 16 libellés de DRIVER_LOOKUP.
+    """
+    codes = risk_driver_mask(df).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=DRIVER_LOOKUP)
+
+
+def derive_features(df):
+    """Indicateurs SOC, score et niveau de risque, explication des règles"""
+    df["high_risk_session"] = (
+        (df["failed_logins_count"] > 3) |
+        (df["unusual_time_access"]) |
+        (df["ip_reputation_score"] < 0.3)
+    ).astype(int)
+    # Sémantique du store (notebook : attack_detected = high_risk_session) :
+    # une seule signification pour la colonne, quelle que soit l'origine des sessions
+    df["attack_detected"] = df["high_risk_session"].astype(bool)
+
+    df["high_failed_logins"] = df["failed_logins_count"] >= 3
+    df["low_ip_reputation"] = df["ip_reputation_score"] < 0.3
+    df["unusual_access"] = df["unusual_time_access"] == 1
+    df["no_encryption"] = df["encryption_used"] == "No"
+
+    flags = df[list(RISK_WEIGHTS)].astype(int)
+    df["suspicious_session"] = flags.sum(axis=1) >= 2
+    df["risk_score"] = (flags * pd.Series(RISK_WEIGHTS)).sum(axis=1)
+    df["risk_level"] = risk_level(df["risk_score"].to_numpy())
+    df["risk_drivers"] = risk_drivers(df)
+    return df
+
+
+def apply_model(df, pipeline):
+    """Anomalie Isolation Forest (1 = anomalie) et alerte SOC combinée"""
+    df["anomaly"] = pipeline.predict(df)
+    df["soc_alert"] = (
+        (df["risk_level"] == "High") |
+        ((df["risk_level"] == "Medium") & (df["anomaly"] == 1))
+    )
+    return df
@@ -0,0 +1,121 @@
+"""
+Cache des figures Plotly du tableau de bord.
+
+Les figures sont conservées sérialisées (JSON UTF-8) : taille mesurable, et
+chaque lecture reconstruit une figure indépendante, sans la revalidation
+Plotly qui domine le coût de construction. Clé : nom de la figure,
+métriques, période et granularité ; les entrées sont liées à une version
+des données. Quand la version suivante ne modifie que des jours à partir
+d'une date (mode live), seules les figures dont la période atteint cette
+date sont retirées ; sinon tout est purgé. Éviction LRU au-delà d'un
+budget en octets.
+"""
+import json
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def serialize(figure):
+    import plotly.io as pio
+    return pio.to_json(figure, validate=False).encode("utf-8")
+
+
+def deserialize(payload):
+    import plotly.graph_objects as go
+    # Figure déjà validée à sa construction : pas de revalidation
+    return go.Figure(json.loads(payload), _validate=False)
+
+
+class FigureCache:
+    """Figures sérialisées par clé, bornées en octets (LRU), invalidées par version des données"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.version = None
+        self._entries = OrderedDict()
+        # Dernier jour couvert par chaque figure (None = jusqu'à la fin des données)
+        self._period_ends = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def _check_version(self, version):
+        if version != self.version:
+            if self._entries:
+                self._counters["invalidations"] += 1
+            self._entries.clear()
+            self._period_ends.clear()
+            self._bytes = 0
+            self.version = version
+
+    def _drop(self, key):
+        self._bytes -= len(self._entries.pop(key))
+        self._period_ends.pop(key, None)
+
+    def advance(self, version, parent=None, since=None):
+        """
+        Passe à la version `version` des données. Si elle dérive de la
+        version courante (`parent`) par des jours modifiés à partir de
+        `since`, seules les figures dont la période atteint `since` sont
+        retirées ; sinon tout est purgé.
+        """
+        with self._lock:
+            if version == self.version:
+                return
+            if since is None or parent is None or parent != self.version:
+                self._check_version(version)
+                return
+            stale = [key for key, end in self._period_ends.items() if end is None or end >= since]
+            for key in stale:
+                self._drop(key)
+            if stale:
+                self._counters["invalidations"] += 1
+            self.version = version
+
+    def get_or_build(self, key, build, version=None, period_end=None):
+        """
+        Figure de `key` pour la version `version` des données ; `build()` si absente.
+
+        `period_end` : dernier jour dont dépend la figure (None = toute la fin
+        des données) ; sert à l'invalidation partielle de `advance`.
+        """
+        with self._lock:
+            self._check_version(version)
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return deserialize(payload)
+            self._counters["misses"] += 1
+
+        figure = build()
+        payload = serialize(figure)
+        size = len(payload)
+        with self._lock:
+            # Données changées pendant la construction : figure périmée, non conservée
+            if version == self.version and size <= self.max_bytes:
+                if key in self._entries:
+                    self._drop(key)
+                self._entries[key] = payload
+                self._period_ends[key] = period_end
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self._counters["evictions"] += 1
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._period_ends.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            snapshot = dict(self._counters)
+            snapshot.update(entries=len(self._entries), size_bytes=self._bytes, max_bytes=self.max_bytes)
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = snapshot["hits"] / lookups if lookups else 0.0
+        return snapshot
@@ -0,0 +1,190 @@
+"""
+Ingestion en flux des logs d'intrusion bruts.
+
+Les fichiers de sessions sont lus par blocs de taille bornée ; chaque bloc
+passe par le feature engineering SOC et le scoring ML, puis est écrit
+immédiatement (un row group par bloc). La mémoire reste constante quel
+que soit le volume d'entrée.
+
+Par défaut le lot est ajouté au store (`intrusion_processed.parts/`) : les
+sessions déjà présentes ne sont jamais réécrites. La date d'évènement vient
+d'une colonne horodatée du fichier ; sans elle, `--event-date` est requis.
+
+Exemples :
+    python -m secureops.ingestion Data/raw/cybersecurity_intrusion_data.csv --event-date 2025-12-31
+    python -m secureops.ingestion sessions.csv --out /tmp/sessions_scored.parquet
+"""
+import argparse
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from secureops.features import apply_model, derive_features, prepare_raw
+from secureops.model_registry import ModelRegistry
+from secureops.storage import PROCESSED_DIR, coerce, new_part_path, part_files, table_path
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# Colonnes horodatées reconnues dans les fichiers bruts (première présente retenue)
+TIMESTAMP_COLUMNS = ["event_date", "timestamp", "event_time", "session_start", "date"]
+
+
+def iter_raw_chunks(paths, chunksize=DEFAULT_CHUNKSIZE):
+    """Blocs de sessions brutes, fichier après fichier"""
+    for path in paths:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def timestamp_column(columns):
+    return next((c for c in TIMESTAMP_COLUMNS if c in columns), None)
+
+
+def process_chunk(chunk, pipeline, event_date=None):
+    """Bloc brut -> bloc au schéma intrusion_processed"""
+    # Horodatage du fichier prioritaire ; `event_date` pour les fichiers qui n'en ont pas
+    column = timestamp_column(chunk.columns)
+    if column is not None:
+        timestamps = pd.to_datetime(chunk[column], errors="coerce")
+    elif event_date is not None:
+        timestamps = pd.Timestamp(event_date).as_unit("ns")
+    else:
+        raise ValueError(f"Aucune colonne horodatée ({', '.join(TIMESTAMP_COLUMNS)}) : "
+                         "précisez la date d'évènement (--event-date)")
+    chunk = derive_features(prepare_raw(chunk))
+    chunk = apply_model(chunk, pipeline)
+    chunk["event_date"] = timestamps
+    return coerce(chunk, "intrusion_processed")
+
+
+def iter_processed_chunks(paths, pipeline, chunksize=DEFAULT_CHUNKSIZE, event_date=None):
+    for chunk in iter_raw_chunks(paths, chunksize):
+        yield process_chunk(chunk, pipeline, event_date)
+
+
+class _ParquetSink:
+    """Écriture incrémentale : un row group par bloc"""
+
+    def __init__(self, path):
+        self.path = path
+        self.writer = None
+        self.schema = None
+
+    def write(self, chunk):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            self.schema = table.schema
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+        else:
+            table = pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self.path = path
+        self.header = True
+
+    def write(self, chunk):
+        chunk.to_csv(self.path, mode="w" if self.header else "a", header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        pass
+
+
+def _check_out(out, processed_dir=PROCESSED_DIR):
+    """Un fichier de sortie explicite ne doit pas écraser une table du store"""
+    out = Path(out).resolve()
+    store = Path(processed_dir).resolve()
+    protected = {table_path("intrusion_processed", store, suffix=s) for s in (".parquet", ".csv")}
+    if out in protected or out.parent == table_path("intrusion_processed", store, suffix=".parts"):
+        raise ValueError(f"{out} appartient au store : sans --out, le lot y est ajouté sans réécriture")
+    return out
+
+
+def ingest(paths, out=None, pipeline=None, chunksize=DEFAULT_CHUNKSIZE, event_date=None, on_chunk=None,
+           processed_dir=PROCESSED_DIR):
+    """
+    Traite `paths` bloc par bloc.
+
+    Sans `out`, le lot est ajouté au store : un nouveau fichier dans
+    `intrusion_processed.parts/`, les sessions existantes ne sont pas
+    touchées. Avec `out` (.parquet ou .csv, hors store), le résultat est
+    écrit dans ce fichier. Dans les deux cas le fichier n'apparaît qu'en fin
+    de traitement (fichier temporaire puis renommage atomique).
+    `on_chunk(chunk)` est appelé après chaque bloc écrit. Retourne des compteurs agrégés.
+    """
+    # Par défaut : modèle actif du registre
+    pipeline = pipeline or ModelRegistry().active().pipeline
+    out = new_part_path("intrusion_processed", processed_dir) if out is None else _check_out(out, processed_dir)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    sink = _CsvSink(tmp) if out.suffix == ".csv" else _ParquetSink(tmp)
+
+    stats = {"chunks": 0, "sessions": 0, "anomalies": 0, "soc_alerts": 0, "high_risk": 0}
+    start = time.perf_counter()
+    try:
+        for chunk in iter_processed_chunks(paths, pipeline, chunksize, event_date):
+            sink.write(chunk)
+            stats["chunks"] += 1
+            stats["sessions"] += len(chunk)
+            stats["anomalies"] += int(chunk["anomaly"].sum())
+            stats["soc_alerts"] += int(chunk["soc_alert"].sum())
+            stats["high_risk"] += int((chunk["risk_level"] == "High").sum())
+            if on_chunk is not None:
+                on_chunk(chunk)
+    except BaseException:
+        sink.close()
+        tmp.unlink(missing_ok=True)
+        raise
+
+    sink.close()
+    if stats["chunks"]:
+        os.replace(tmp, out)
+    stats["seconds"] = time.perf_counter() - start
+    stats["out"] = out
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingestion en flux des sessions réseau brutes")
+    parser.add_argument("paths", nargs="+", help="fichiers CSV bruts (schéma cybersecurity_intrusion_data)")
+    parser.add_argument("--out", default=None,
+                        help="fichier de sortie .parquet ou .csv hors store (défaut : ajout au store)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="sessions par bloc")
+    parser.add_argument("--event-date",
+                        help="date d'évènement des sessions, requise si le fichier n'a pas de colonne horodatée")
+    args = parser.parse_args()
+
+    # Vérifié avant tout traitement : un fichier sans horodatage exige --event-date
+    if args.event_date is None:
+        for path in args.paths:
+            if timestamp_column(pd.read_csv(path, nrows=0).columns) is None:
+                parser.error(f"{path} : aucune colonne horodatée ({', '.join(TIMESTAMP_COLUMNS)}), "
+                             "--event-date requis")
+    try:
+        stats = ingest(args.paths, args.out, chunksize=args.chunksize, event_date=args.event_date)
+    except ValueError as e:
+        parser.error(str(e))
+
+    rate = stats["sessions"] / stats["seconds"] if stats["seconds"] else 0
+    print(f"✅ {stats['sessions']:,} sessions en {stats['chunks']} bloc(s) -> {stats['out']}")
+    if args.out is None:
+        print(f"   Lots en attente de regroupement : {len(part_files('intrusion_processed'))} "
+              "(python -m secureops.storage --compact intrusion_processed)")
+    print(f"   Anomalies : {stats['anomalies']:,} | Haut risque : {stats['high_risk']:,} | "
+          f"Alertes SOC : {stats['soc_alerts']:,}")
+    print(f"   {stats['seconds']:.2f}s ({rate:,.0f} sessions/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Index de KPI par plage de dates (somme, moyenne, min, max en temps constant).
+
+Le dataset consolidé est trié une fois par date. Pour chaque métrique on
+précalcule :
+- les sommes et comptes cumulés (valeurs non nulles) -> somme / moyenne ;
+- une sparse table (min / max sur des blocs de 2^k lignes) -> min / max.
+
+Une sélection [début, fin] se résout alors par deux `searchsorted` sur les
+dates, puis quelques lectures de tableaux, quelle que soit la taille de la
+période.
+
+Mode live : `extend` produit l'index de la version suivante des données en
+ne recalculant que la fin des tableaux, à partir de la première date
+modifiée ; l'index d'origine reste valide pour les sessions qui le lisent.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+def _sparse_table(values, reduce):
+    """Niveaux k : reduce des blocs [i, i + 2^k) pour tout i"""
+    levels = [values]
+    width = 1
+    while 2 * width <= len(values):
+        prev = levels[-1]
+        levels.append(reduce(prev[:-width], prev[width:]))
+        width *= 2
+    return levels
+
+
+def _extend_sparse_table(levels, lo, tail, reduce):
+    """Sparse table de levels[0][:lo] + tail : seuls les blocs qui atteignent `lo` sont recalculés"""
+    base = np.concatenate([levels[0][:lo], tail])
+    extended = [base]
+    width, k = 1, 1
+    while 2 * width <= len(base):
+        prev = extended[-1]
+        # Bloc [i, i + 2^k) entièrement avant `lo` : inchangé
+        keep = max(0, lo - 2 * width + 1)
+        kept = levels[k][:keep] if k < len(levels) else levels[0][:0]
+        keep = len(kept)
+        extended.append(np.concatenate([kept, reduce(prev[keep:-width], prev[keep + width:])]))
+        width *= 2
+        k += 1
+    return extended
+
+
+def _metric_arrays(col):
+    """(valeurs sommées, présence, valeurs pour le min, valeurs pour le max) d'une colonne"""
+    present = col.notna().to_numpy()
+    if pd.api.types.is_integer_dtype(col) and present.all():
+        values = col.to_numpy(dtype=np.int64)
+        return values, present, values, values
+    values = col.to_numpy(dtype=np.float64)
+    lows = np.where(present, values, np.inf)
+    highs = np.where(present, values, -np.inf)
+    return np.where(present, values, 0.0), present, lows, highs
+
+
+def _fingerprint(frame, columns, parent=""):
+    hashed = pd.util.hash_pandas_object(frame[columns], index=False).to_numpy().tobytes()
+    return hashlib.sha1(parent.encode("utf-8") + hashed).hexdigest()[:16]
+
+
+class KpiRangeIndex:
+    """Agrégats par plage de dates sur un DataFrame trié une seule fois"""
+
+    def __init__(self, df, metrics, date_col="date"):
+        self.date_col = date_col
+        self.metrics = list(metrics)
+        self.frame = df.sort_values(date_col, kind="stable").reset_index(drop=True)
+        self.dates = self.frame[date_col].to_numpy(dtype="datetime64[ns]")
+        # Empreinte du contenu : change dès que les données changent
+        self.version = _fingerprint(self.frame, [date_col] + self.metrics)
+        # Index construit par `extend` : version d'origine et première date recalculée
+        self.parent_version = None
+        self.changed_from = None
+
+        self._sums, self._counts, self._mins, self._maxs = {}, {}, {}, {}
+        for m in self.metrics:
+            values, present, lows, highs = _metric_arrays(self.frame[m])
+            # Préfixes avec un zéro en tête : somme(lo, hi) = P[hi] - P[lo]
+            self._sums[m] = np.concatenate([[0], np.cumsum(values)])
+            self._counts[m] = np.concatenate([[0], np.cumsum(present, dtype=np.int64)])
+            self._mins[m] = _sparse_table(lows, np.minimum)
+            self._maxs[m] = _sparse_table(highs, np.maximum)
+
+    def extend(self, rows):
+        """
+        Index de la version suivante : les lignes datées à partir de la
+        première date de `rows` sont remplacées par `rows`. Préfixes et
+        sparse tables ne sont recalculés qu'à partir de cette date.
+        """
+        if rows.empty:
+            return self
+        rows = rows.sort_values(self.date_col, kind="stable")
+        since = rows[self.date_col].iloc[0]
+        lo = int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(since), "ns"), side="left"))
+
+        index = object.__new__(KpiRangeIndex)
+        index.date_col = self.date_col
+        index.metrics = self.metrics
+        index.frame = pd.concat([self.frame.iloc[:lo], rows[self.frame.columns]], ignore_index=True)
+        index.dates = index.frame[self.date_col].to_numpy(dtype="datetime64[ns]")
+        index.version = _fingerprint(rows, [self.date_col] + self.metrics, parent=self.version)
+        index.parent_version = self.version
+        index.changed_from = pd.Timestamp(since)
+
+        index._sums, index._counts, index._mins, index._maxs = {}, {}, {}, {}
+        for m in self.metrics:
+            values, present, lows, highs = _metric_arrays(rows[m])
+            sums, counts = self._sums[m], self._counts[m]
+            index._sums[m] = np.concatenate([sums[:lo + 1], sums[lo] + np.cumsum(values)])
+            index._counts[m] = np.concatenate([counts[:lo + 1], counts[lo] + np.cumsum(present, dtype=np.int64)])
+            index._mins[m] = _extend_sparse_table(self._mins[m], lo, lows, np.minimum)
+            index._maxs[m] = _extend_sparse_table(self._maxs[m], lo, highs, np.maximum)
+        return index
+
+    def __len__(self):
+        return len(self.dates)
+
+    # -----------------------------------------------------------------
+    # Résolution d'une plage de dates
+    # -----------------------------------------------------------------
+    def bounds(self, start=None, end=None):
+        """Positions [lo, hi) des lignes telles que start <= date <= end"""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start), "ns"), side="left"))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end), "ns"), side="right"))
+        return lo, max(lo, hi)
+
+    def slice(self, start=None, end=None):
+        """Lignes de la période (tranche contiguë, sans masque booléen)"""
+        lo, hi = self.bounds(start, end)
+        return self.frame.iloc[lo:hi]
+
+    # -----------------------------------------------------------------
+    # Agrégats sur [lo, hi)
+    # -----------------------------------------------------------------
+    def count(self, metric, lo, hi):
+        counts = self._counts[metric]
+        return int(counts[hi] - counts[lo])
+
+    def sum(self, metric, lo, hi):
+        sums = self._sums[metric]
+        return sums[hi] - sums[lo]
+
+    def mean(self, metric, lo, hi):
+        n = self.count(metric, lo, hi)
+        return self.sum(metric, lo, hi) / n if n else np.nan
+
+    def _range_query(self, levels, lo, hi, reduce):
+        if hi <= lo:
+            return np.nan
+        k = (hi - lo).bit_length() - 1
+        value = reduce(levels[k][lo], levels[k][hi - (1 << k)])
+        return np.nan if np.isinf(value) else value
+
+    def min(self, metric, lo, hi):
+        return self._range_query(self._mins[metric], lo, hi, min)
+
+    def max(self, metric, lo, hi):
+        return self._range_query(self._maxs[metric], lo, hi, max)
+
+    def summary(self, start=None, end=None):
+        """{métrique: {sum, mean, min, max, count}} pour la période"""
+        lo, hi = self.bounds(start, end)
+        return {
+            m: {
+                "sum": self.sum(m, lo, hi),
+                "mean": self.mean(m, lo, hi),
+                "min": self.min(m, lo, hi),
+                "max": self.max(m, lo, hi),
+                "count": self.count(m, lo, hi),
+            }
+            for m in self.metrics
+        }
@@ -0,0 +1,130 @@
+"""
+Table du store tenue à jour en continu (mode live du tableau de bord).
+
+Le fichier de la table n'est relu que si sa date de modification a changé,
+et seulement à partir de la dernière date déjà chargée : la ligne de cette
+date est remplacée (journée consolidée en cours, réécrite par le pipeline)
+et les lignes postérieures sont ajoutées. Chaque changement incrémente
+`version` et note la première date modifiée : les structures dérivées
+(`LiveView` : index KPI, agrégats) ne recalculent que ce qui suit cette
+date, au lieu d'être reconstruites.
+"""
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+
+from secureops.storage import PROCESSED_DIR, read_table, table_mtime
+
+# Changements mémorisés : une structure plus en retard est reconstruite entièrement
+CHANGE_HISTORY = 64
+
+
+class LiveTable:
+    """Lignes d'une table du store, complétées au fil de l'eau (partagée entre sessions)"""
+
+    def __init__(self, name, columns, date_col="date", frame=None, processed_dir=PROCESSED_DIR):
+        self.name = name
+        self.columns = list(columns)
+        self.date_col = date_col
+        self.processed_dir = processed_dir
+        self._lock = threading.Lock()
+
+        # Lignes fournies (déjà chargées, peut-être avant la dernière écriture) :
+        # le premier `poll` relit la dernière date par précaution
+        self._mtime = None if frame is not None else table_mtime(name, processed_dir)
+        if frame is None:
+            frame = read_table(name, columns=self.columns, processed_dir=processed_dir)
+        self.frame = frame.sort_values(date_col, kind="stable").reset_index(drop=True)
+        self.version = 0
+        # (version, première date modifiée ; None = tout le contenu)
+        self._changes = deque(maxlen=CHANGE_HISTORY)
+        self.last_poll = None
+        self.last_change = None
+
+    @property
+    def watermark(self):
+        return self.frame[self.date_col].max() if len(self.frame) else None
+
+    def snapshot(self):
+        """(version, lignes) cohérents entre eux"""
+        with self._lock:
+            return self.version, self.frame
+
+    def changed_since(self, version, until=None):
+        """
+        Première date modifiée entre `version` (exclue) et `until` (incluse,
+        version courante par défaut) ; None si inconnue (historique dépassé,
+        table vide au départ) : tout est alors à recalculer.
+        """
+        with self._lock:
+            until = self.version if until is None else until
+            changes = [since for v, since in self._changes if version < v <= until]
+        if version is None or len(changes) != until - version or any(s is None for s in changes):
+            return None
+        return min(changes)
+
+    def poll(self):
+        """Charge les lignes nouvelles ou réécrites ; retourne leur nombre (0 si rien n'a changé)"""
+        with self._lock:
+            self.last_poll = time.time()
+            mtime = table_mtime(self.name, self.processed_dir)
+            if mtime is None or mtime == self._mtime:
+                return 0
+
+            watermark = self.watermark
+            filters = [(self.date_col, ">=", watermark)] if watermark is not None else None
+            rows = read_table(self.name, columns=self.columns, filters=filters,
+                              processed_dir=self.processed_dir)
+            self._mtime = mtime
+            rows = rows.sort_values(self.date_col, kind="stable").reset_index(drop=True)
+
+            kept = self.frame
+            if watermark is not None:
+                current = self.frame[self.frame[self.date_col] >= watermark].reset_index(drop=True)
+                if rows.equals(current):
+                    return 0
+                kept = self.frame[self.frame[self.date_col] < watermark]
+                changed = len(rows) - (len(current) if rows.head(len(current)).equals(current) else 0)
+            else:
+                changed = len(rows)
+
+            self.frame = pd.concat([kept, rows], ignore_index=True)
+            self.version += 1
+            self._changes.append((self.version, watermark))
+            self.last_change = self.last_poll
+            return changed
+
+
+class LiveView:
+    """
+    Structure dérivée d'une `LiveTable` (partagée entre sessions).
+
+    `build(frame)` la construit entièrement ; `update(valeur, frame, since)`
+    produit la valeur de la version suivante à partir de la précédente et
+    des lignes datées à partir de `since`. Chaque valeur produite est un
+    nouvel objet : une session qui lit encore la précédente n'est pas affectée.
+    """
+
+    def __init__(self, table, build, update):
+        self.table = table
+        self.build = build
+        self.update = update
+        self._lock = threading.Lock()
+        self._version = None
+        self._value = None
+
+    def get(self):
+        version, frame = self.table.snapshot()
+        with self._lock:
+            # Valeur à jour (ou déjà construite pour une version plus récente)
+            if self._value is not None and self._version >= version:
+                return self._value
+            since = self.table.changed_since(self._version, until=version) if self._value is not None else None
+            if since is None:
+                value = self.build(frame)
+            else:
+                value = self.update(self._value, frame, since)
+            self._version, self._value = version, value
+            return value
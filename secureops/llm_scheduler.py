@@ -0,0 +1,304 @@
+"""
+Ordonnanceur partagé des appels LLM (Groq).
+
+Toutes les sessions Streamlit passent par une seule instance :
+- plafond global d'appels simultanés (créneaux d'appel) ;
+- limitation de débit par seau à jetons (requêtes / minute + rafale), le
+  jeton étant obtenu avant le créneau : une requête freinée par le débit
+  n'occupe pas de créneau ;
+- nouvelles tentatives avec backoff exponentiel et jitter sur les erreurs
+  transitoires (429, 5xx, coupure réseau, timeout), en respectant Retry-After ;
+- fusion des requêtes identiques en cours : un seul appel amont, le flux de
+  réponse est diffusé à tous les demandeurs.
+
+Les fragments de texte sont relayés au fil de l'eau (streaming). Si plus
+aucun demandeur ne lit la réponse (arrêt par l'utilisateur), l'appel
+amont est interrompu.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import deque
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_RATE_PER_MINUTE = 30
+DEFAULT_BURST = 5
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+
+# Statuts HTTP transitoires : une nouvelle tentative a des chances d'aboutir
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+# Fenêtre des temps d'attente conservés pour les métriques
+WAIT_SAMPLES = 500
+
+
+class TokenBucket:
+    """Seau à jetons thread-safe : `rate` jetons / seconde, `capacity` en rafale"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Bloque jusqu'à obtenir un jeton ; retourne le temps attendu (s)"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def is_retryable(error):
+    """Erreur transitoire : limite de débit, erreur serveur, réseau ou timeout"""
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    name = type(error).__name__
+    return "Connection" in name or "Timeout" in name or isinstance(error, (ConnectionError, TimeoutError))
+
+
+def retry_after(error):
+    """Délai imposé par le fournisseur (en-tête Retry-After), sinon None"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def request_key(params):
+    """Empreinte des paramètres d'appel : deux requêtes identiques ont la même clé"""
+    raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    """Appel amont partagé entre tous ses demandeurs"""
+
+    def __init__(self, key):
+        self.key = key
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self.subscribers = 0
+        self.cancelled = False
+        self.enqueued_at = time.monotonic()
+        self.cond = threading.Condition()
+
+
+class _Follower:
+    """
+    Lecture d'un appel partagé par un demandeur (itérateur des fragments).
+
+    L'abonnement est rendu une seule fois : en fin de flux, à `close()` ou à
+    la collecte de l'objet, y compris s'il n'a jamais été itéré (rerun
+    Streamlit avant le premier fragment).
+    """
+
+    def __init__(self, call):
+        self.call = call
+        self._position = 0
+        self._released = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        call = self.call
+        try:
+            with call.cond:
+                while not self._released and self._position >= len(call.chunks) and not call.done:
+                    call.cond.wait()
+                if not self._released and self._position < len(call.chunks):
+                    self._position += 1
+                    return call.chunks[self._position - 1]
+                error = call.error if call.done and not self._released else None
+        except BaseException:
+            self.close()
+            raise
+        self.close()
+        if error is not None:
+            raise error
+        raise StopIteration
+
+    def close(self):
+        call = self.call
+        with call.cond:
+            if self._released:
+                return
+            self._released = True
+            call.subscribers -= 1
+            if call.subscribers == 0 and not call.done:
+                call.cancelled = True
+            call.cond.notify_all()
+
+    def __del__(self):
+        self.close()
+
+
+class LLMScheduler:
+    """File partagée des appels `chat.completions.create` d'un client Groq"""
+
+    def __init__(self, client, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 rate_per_minute=DEFAULT_RATE_PER_MINUTE, burst=DEFAULT_BURST,
+                 max_retries=DEFAULT_MAX_RETRIES, base_delay=DEFAULT_BASE_DELAY,
+                 max_delay=DEFAULT_MAX_DELAY):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.bucket = TokenBucket(rate_per_minute / 60.0, burst)
+        # Créneaux d'appel amont : tenus pendant l'appel seulement (ni attente de débit, ni backoff)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+        self._counters = {
+            "submitted": 0, "coalesced": 0, "completed": 0,
+            "failed": 0, "cancelled": 0, "retries": 0,
+        }
+        self._queued = 0
+        self._running = 0
+
+    # -----------------------------------------------------------------
+    # API
+    # -----------------------------------------------------------------
+    def stream(self, **params):
+        """
+        Fragments de texte de la réponse, au fil de l'eau.
+
+        Les erreurs définitives (après nouvelles tentatives) sont levées
+        pendant l'itération. Fermer le flux (ou l'abandonner sans l'avoir lu)
+        se désabonne de l'appel.
+        """
+        key = request_key(params)
+        with self._lock:
+            call = self._inflight.get(key)
+            if call is not None:
+                # Vérification et abonnement d'un bloc : le dernier demandeur ne peut pas
+                # abandonner l'appel entre les deux
+                with call.cond:
+                    if call.cancelled:
+                        # Appel abandonné par tous ses demandeurs : sa réponse sera tronquée
+                        call = None
+                    else:
+                        call.subscribers += 1
+            if call is None:
+                call = _Call(key)
+                call.subscribers = 1
+                self._inflight[key] = call
+                self._counters["submitted"] += 1
+                self._queued += 1
+                threading.Thread(target=self._run, args=(call, params), name="llm", daemon=True).start()
+            else:
+                self._counters["coalesced"] += 1
+        return _Follower(call)
+
+    def complete(self, **params):
+        """Réponse complète (appel bloquant)"""
+        return "".join(self.stream(**params))
+
+    def metrics(self):
+        with self._lock:
+            waits = sorted(self._waits)
+            snapshot = dict(self._counters)
+            snapshot.update(queue_depth=self._queued, running=self._running,
+                            max_concurrency=self.max_concurrency)
+        snapshot["avg_wait_s"] = sum(waits) / len(waits) if waits else 0.0
+        snapshot["p95_wait_s"] = waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+        snapshot["max_wait_s"] = waits[-1] if waits else 0.0
+        return snapshot
+
+    # -----------------------------------------------------------------
+    # Demandeur : relit le tampon partagé
+    # -----------------------------------------------------------------
+    # -----------------------------------------------------------------
+    # Worker : appel amont avec débit limité et nouvelles tentatives
+    # -----------------------------------------------------------------
+    def _run(self, call, params):
+        attempt = 0
+        queued = True
+        try:
+            while True:
+                # Jeton de débit d'abord, créneau ensuite
+                self.bucket.acquire()
+                if call.cancelled:
+                    self._finish(call, outcome="cancelled")
+                    return
+                with self._slots:
+                    with self._lock:
+                        if queued:
+                            self._queued -= 1
+                            self._waits.append(time.monotonic() - call.enqueued_at)
+                            queued = False
+                        self._running += 1
+                    try:
+                        self._pump(call, params)
+                        self._finish(call, outcome="cancelled" if call.cancelled else "completed")
+                        return
+                    except Exception as e:
+                        # Fragments déjà diffusés : rejouer la requête les dupliquerait
+                        if call.chunks or attempt >= self.max_retries or not is_retryable(e):
+                            self._finish(call, error=e)
+                            return
+                        error = e
+                    finally:
+                        with self._lock:
+                            self._running -= 1
+
+                # Attente hors créneau ; Retry-After du fournisseur borné comme le backoff
+                delay = retry_after(error)
+                if delay is None:
+                    # Backoff exponentiel, « full jitter »
+                    delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                delay = min(delay, self.max_delay)
+                with self._lock:
+                    self._counters["retries"] += 1
+                time.sleep(delay)
+                attempt += 1
+        finally:
+            if queued:
+                with self._lock:
+                    self._queued -= 1
+
+    def _pump(self, call, params):
+        stream = self.client.chat.completions.create(stream=True, **params)
+        try:
+            for chunk in stream:
+                if call.cancelled:
+                    return
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    with call.cond:
+                        call.chunks.append(delta)
+                        call.cond.notify_all()
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+    def _finish(self, call, error=None, outcome="failed"):
+        with self._lock:
+            if self._inflight.get(call.key) is call:
+                del self._inflight[call.key]
+            self._counters["failed" if error is not None else outcome] += 1
+        with call.cond:
+            call.error = error
+            call.done = True
+            call.cond.notify_all()
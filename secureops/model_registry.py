@@ -0,0 +1,410 @@
+"""
+Registre versionné des modèles de détection.
+
+Organisation sur disque :
+    models/registry/<modèle>/<version>/
+        estimator.joblib   estimateur (decision_function), tableaux non compressés
+        scaler.pkl         StandardScaler
+        ml_features.pkl    ordre des features
+        meta.json          origine, date, empreinte, jours d'entraînement
+                           (trained_from / trained_until), métriques éventuelles
+        score_quantiles.npy  distribution des scores de référence (sensibilité)
+    models/registry/active.json    {"model": ..., "version": ...}
+
+Les estimateurs sont lus avec `joblib.load(mmap_mode="r")` : leurs tableaux
+NumPy restent des projections du fichier, partagées par le cache de pages
+du système entre tous les processus Streamlit qui servent le même modèle.
+Un modèle n'est chargé qu'à sa première utilisation.
+
+Changer de modèle ou de version réécrit `active.json` (fichier temporaire
+puis `os.replace`) ; chaque processus relit ce pointeur quand il change et
+bascule d'une seule affectation. Les scorings en cours terminent avec
+l'ancien pipeline, sans redémarrage de l'application.
+
+Import des artefacts de `models/` comme première version :
+    python -m secureops.model_registry import models --model isolation_forest \
+        --trained-from 2025-12-27 --trained-until 2025-12-27
+"""
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+from secureops.compiled_forest import CompiledForest, file_digest
+from secureops.scoring import MODELS_DIR, ScoringPipeline, load_forest
+from secureops.sensitivity import QUANTILES_FILE, ScoreDistribution, load_distribution
+from secureops.storage import read_table
+
+REGISTRY_DIR = MODELS_DIR / "registry"
+ACTIVE_FILE = "active.json"
+
+ESTIMATOR_FILE = "estimator.joblib"
+SCALER_FILE = "scaler.pkl"
+FEATURES_FILE = "ml_features.pkl"
+META_FILE = "meta.json"
+
+# Modèles proposés par l'interface (identifiant -> libellé)
+MODEL_LABELS = {
+    "isolation_forest": "Isolation Forest",
+    "one_class_svm": "One-Class SVM",
+}
+DEFAULT_MODEL = "isolation_forest"
+
+# Sessions de référence pour la distribution des scores
+REFERENCE_TABLE = "intrusion_processed"
+
+
+def _write_json_atomic(path, payload):
+    """Écrit un JSON d'un bloc : les lecteurs voient l'ancien ou le nouveau, jamais un fichier partiel"""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _version_key(version):
+    # v2 < v10 : tri numérique quand le nom s'y prête
+    digits = version.lstrip("v")
+    return (0, int(digits), version) if digits.isdigit() else (1, 0, version)
+
+
+def reference_scores(pipeline, table=REFERENCE_TABLE):
+    """Scores du pipeline sur les sessions de référence du store"""
+    return pipeline.decision_function(read_table(table, columns=pipeline.features))
+
+
+def _array_bytes(obj, depth=0, seen=None):
+    """(octets projetés depuis le fichier, octets en mémoire privée) des tableaux d'un objet"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen or depth > 4:
+        return 0, 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        base = obj
+        while isinstance(base, np.ndarray) and base.base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        return (obj.nbytes, 0) if isinstance(base, np.memmap) else (0, obj.nbytes)
+    if isinstance(obj, dict):
+        children = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        children = obj
+    elif hasattr(obj, "__dict__"):
+        children = vars(obj).values()
+    else:
+        return 0, 0
+
+    mapped = private = 0
+    for child in children:
+        m, p = _array_bytes(child, depth + 1, seen)
+        mapped += m
+        private += p
+    return mapped, private
+
+
+class LoadedModel:
+    """Pipeline chargé + mesures de chargement et d'empreinte mémoire"""
+
+    def __init__(self, model, version, pipeline, load_s, file_bytes, distribution=None):
+        self.model = model
+        self.version = version
+        self.pipeline = pipeline
+        self.distribution = distribution
+        self.load_s = load_s
+        self.file_bytes = file_bytes
+        self.mapped_bytes, self.private_bytes = _array_bytes(pipeline.forest)
+        self.loaded_at = time.time()
+
+    def stats(self):
+        return {
+            "model": self.model,
+            "version": self.version,
+            "load_s": self.load_s,
+            "file_bytes": self.file_bytes,
+            "mapped_bytes": self.mapped_bytes,
+            "private_bytes": self.private_bytes,
+        }
+
+
+class ModelRegistry:
+    """Versions disponibles, chargement paresseux et modèle actif (partagé entre sessions)"""
+
+    def __init__(self, root=REGISTRY_DIR, fallback_dir=MODELS_DIR):
+        self.root = Path(root)
+        # Registre vide : les artefacts à plat de `models/` servent de modèle par défaut
+        self.fallback_dir = Path(fallback_dir)
+        self._lock = threading.Lock()
+        self._loaded = {}
+        self._active = None
+        self._active_mtime = None
+
+    # -----------------------------------------------------------------
+    # Catalogue
+    # -----------------------------------------------------------------
+    def version_dir(self, model, version):
+        return self.root / model / version
+
+    def versions(self, model):
+        """Versions enregistrées d'un modèle, de la plus ancienne à la plus récente"""
+        model_dir = self.root / model
+        if not model_dir.is_dir():
+            return []
+        found = [p.name for p in model_dir.iterdir() if (p / ESTIMATOR_FILE).exists()]
+        return sorted(found, key=_version_key)
+
+    def models(self):
+        """{modèle: [versions]} pour tous les modèles connus, enregistrés ou non"""
+        names = list(MODEL_LABELS)
+        if self.root.is_dir():
+            names += sorted(p.name for p in self.root.iterdir() if p.is_dir() and p.name not in MODEL_LABELS)
+        return {name: self.versions(name) for name in names}
+
+    def meta(self, model, version):
+        try:
+            return json.loads((self.version_dir(model, version) / META_FILE).read_text(encoding="utf-8"))
+        except:
+            return {}
+
+    def active_pointer(self):
+        """(modèle, version) désignés par active.json ; à défaut, dernière version du modèle par défaut"""
+        try:
+            pointer = json.loads((self.root / ACTIVE_FILE).read_text(encoding="utf-8"))
+            if pointer["version"] in self.versions(pointer["model"]):
+                return pointer["model"], pointer["version"]
+        except:
+            pass
+        versions = self.versions(DEFAULT_MODEL)
+        return (DEFAULT_MODEL, versions[-1]) if versions else (DEFAULT_MODEL, None)
+
+    # -----------------------------------------------------------------
+    # Chargement
+    # -----------------------------------------------------------------
+    def _load_version(self, model, version):
+        started = time.perf_counter()
+        if version is None:
+            pipeline = ScoringPipeline(
+                forest=load_forest(self.fallback_dir),
+                scaler=joblib.load(self.fallback_dir / SCALER_FILE),
+                features=joblib.load(self.fallback_dir / FEATURES_FILE),
+            )
+            files = [self.fallback_dir / n for n in ("isolation_forest.npz", SCALER_FILE, FEATURES_FILE)]
+            distribution = None
+        else:
+            directory = self.version_dir(model, version)
+            pipeline = ScoringPipeline(
+                forest=joblib.load(directory / ESTIMATOR_FILE, mmap_mode="r"),
+                scaler=joblib.load(directory / SCALER_FILE),
+                features=joblib.load(directory / FEATURES_FILE),
+            )
+            files = [directory / n for n in (ESTIMATOR_FILE, SCALER_FILE, FEATURES_FILE)]
+            distribution = load_distribution(directory)
+        load_s = time.perf_counter() - started
+        file_bytes = sum(f.stat().st_size for f in files if f.exists())
+        return LoadedModel(model, version, pipeline, load_s, file_bytes, distribution)
+
+    def get(self, model, version):
+        """Pipeline d'une version, chargé à la première demande puis conservé"""
+        key = (model, version)
+        loaded = self._loaded.get(key)
+        if loaded is None:
+            # Chargement hors verrou : les autres sessions continuent de scorer
+            loaded = self._load_version(model, version)
+            with self._lock:
+                loaded = self._loaded.setdefault(key, loaded)
+        return loaded
+
+    def _pointer_mtime(self):
+        try:
+            return (self.root / ACTIVE_FILE).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def active(self):
+        """Modèle actif (LoadedModel) ; suit les bascules faites par d'autres processus"""
+        mtime = self._pointer_mtime()
+        current = self._active
+        if current is not None and mtime == self._active_mtime:
+            return current
+
+        model, version = self.active_pointer()
+        if current is None or (current.model, current.version) != (model, version):
+            current = self.get(model, version)
+        # Une seule affectation : les appels en cours gardent leur référence
+        self._active, self._active_mtime = current, mtime
+        return current
+
+    def activate(self, model, version):
+        """Bascule atomique vers une version (chargée avant la bascule)"""
+        if version not in self.versions(model):
+            raise ValueError(f"Version inconnue : {model}/{version}")
+        loaded = self.get(model, version)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            _write_json_atomic(self.root / ACTIVE_FILE, {
+                "model": model,
+                "version": version,
+                "activated_at": datetime.now().isoformat(timespec="seconds"),
+            })
+            self._active, self._active_mtime = loaded, self._pointer_mtime()
+        return loaded
+
+    def evict(self, keep_active=True):
+        """Oublie les versions chargées (sauf l'active) ; leurs projections sont libérées"""
+        with self._lock:
+            active = self._active
+            self._loaded = {k: v for k, v in self._loaded.items() if keep_active and v is active}
+
+    def stats(self):
+        """Mesures des versions chargées dans ce processus"""
+        active = self._active
+        rows = []
+        for loaded in list(self._loaded.values()):
+            row = loaded.stats()
+            row["active"] = loaded is active
+            rows.append(row)
+        return rows
+
+    # -----------------------------------------------------------------
+    # Enregistrement
+    # -----------------------------------------------------------------
+    def next_version(self, model):
+        versions = [v for v in self.versions(model) if v.lstrip("v").isdigit()]
+        return f"v{int(versions[-1].lstrip('v')) + 1}" if versions else "v1"
+
+    def register(self, model, estimator, scaler, features, meta=None, version=None, scores=None):
+        """
+        Enregistre une nouvelle version (sans l'activer) ; retourne son nom.
+
+        `scores` : scores des sessions de référence (calculés si absents).
+        Les fichiers sont écrits dans un dossier temporaire renommé en une
+        fois : une version visible est toujours complète.
+        """
+        version = version or self.next_version(model)
+        target = self.version_dir(model, version)
+        if target.exists():
+            raise ValueError(f"Version déjà enregistrée : {model}/{version}")
+        tmp = target.with_name(f".{version}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        # Sans compression : condition pour que joblib puisse projeter les tableaux
+        joblib.dump(estimator, tmp / ESTIMATOR_FILE, compress=0)
+        joblib.dump(scaler, tmp / SCALER_FILE)
+        joblib.dump(list(features), tmp / FEATURES_FILE)
+        if scores is None:
+            try:
+                scores = reference_scores(ScoringPipeline(estimator, scaler, features))
+            except:
+                scores = None
+        if scores is not None:
+            ScoreDistribution.from_scores(scores).save(tmp / QUANTILES_FILE)
+        _write_json_atomic(tmp / META_FILE, {
+            "model": model,
+            "version": version,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "estimator": type(estimator).__name__,
+            "digest": file_digest(tmp / ESTIMATOR_FILE),
+            **(meta or {}),
+        })
+        os.replace(tmp, target)
+        return version
+
+    def calibrate(self, model, version, scores=None):
+        """(Re)calcule la distribution des scores de référence d'une version enregistrée"""
+        loaded = self.get(model, version)
+        distribution = ScoreDistribution.from_scores(
+            reference_scores(loaded.pipeline) if scores is None else scores
+        )
+        path = self.version_dir(model, version) / QUANTILES_FILE
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp.npy")
+        distribution.save(tmp)
+        os.replace(tmp, path)
+        loaded.distribution = distribution
+        return distribution
+
+
+def import_models_dir(registry, source_dir, model=DEFAULT_MODEL, trained_from=None, trained_until=None):
+    """
+    Enregistre les artefacts à plat d'un dossier (isolation_forest.pkl, scaler.pkl, ml_features.pkl).
+
+    `trained_from` / `trained_until` : jours des sessions d'entraînement, si
+    connus (le réentraînement n'évalue ensuite que les jours suivants).
+    """
+    source_dir = Path(source_dir)
+    estimator = load_forest(source_dir)
+    if not isinstance(estimator, CompiledForest):
+        estimator = CompiledForest.from_sklearn(estimator)
+    return registry.register(
+        model,
+        estimator,
+        joblib.load(source_dir / SCALER_FILE),
+        joblib.load(source_dir / FEATURES_FILE),
+        meta={
+            "source": str(source_dir),
+            "source_digest": file_digest(source_dir / "isolation_forest.pkl"),
+            **({"trained_from": trained_from} if trained_from else {}),
+            **({"trained_until": trained_until} if trained_until else {}),
+        },
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Registre des modèles de détection")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="Enregistre les artefacts d'un dossier comme nouvelle version")
+    imp.add_argument("source", type=Path)
+    imp.add_argument("--model", default=DEFAULT_MODEL)
+    imp.add_argument("--activate", action="store_true")
+    imp.add_argument("--trained-from", default=None, help="Premier jour des sessions d'entraînement (AAAA-MM-JJ)")
+    imp.add_argument("--trained-until", default=None, help="Dernier jour des sessions d'entraînement (AAAA-MM-JJ)")
+
+    act = sub.add_parser("activate", help="Bascule vers une version")
+    act.add_argument("model")
+    act.add_argument("version")
+
+    cal = sub.add_parser("calibrate", help="Recalcule la distribution des scores de référence")
+    cal.add_argument("model")
+    cal.add_argument("version")
+
+    sub.add_parser("list", help="Liste les versions et leurs mesures de chargement")
+    args = parser.parse_args(argv)
+
+    registry = ModelRegistry()
+    if args.command == "import":
+        version = import_models_dir(registry, args.source, args.model,
+                                    trained_from=args.trained_from, trained_until=args.trained_until)
+        print(f"✅ {args.model}/{version} enregistré")
+        if args.activate:
+            registry.activate(args.model, version)
+            print(f"   actif : {args.model}/{version}")
+    elif args.command == "activate":
+        registry.activate(args.model, args.version)
+        print(f"✅ actif : {args.model}/{args.version}")
+    elif args.command == "calibrate":
+        distribution = registry.calibrate(args.model, args.version)
+        critical, high = distribution.cutoffs()
+        print(f"✅ {args.model}/{args.version} : {distribution.n_reference:,} sessions de référence, "
+              f"seuils par défaut CRITIQUE < {critical:.4f}, ÉLEVÉ < {high:.4f}")
+    else:
+        active = registry.active_pointer()
+        for model, versions in registry.models().items():
+            for version in versions:
+                loaded = registry.get(model, version)
+                marker = "*" if (model, version) == active else " "
+                print(f"{marker} {model}/{version:<6} {loaded.file_bytes / 1e6:6.2f} Mo  "
+                      f"chargé en {loaded.load_s * 1000:6.1f} ms  "
+                      f"projeté {loaded.mapped_bytes / 1e6:.2f} Mo / privé {loaded.private_bytes / 1e6:.2f} Mo")
+            if not versions:
+                print(f"  {model:<23} aucune version enregistrée")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Rapport PDF SOC (reportlab) généré en arrière-plan.
+
+Le rapport d'une période contient les KPI, le tableau de statistiques et
+les graphiques (dessins vectoriels reportlab, sans conversion d'image).
+Les graphiques sont mis en cache par (version des données, période) ; le
+document est construit dans un `BytesIO` par un worker, hors du thread de
+la page Streamlit. Le temps de génération est mesuré pour chaque rapport.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from io import BytesIO
+
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+# Budget de génération d'un rapport (secondes) : au-delà, l'interface le signale
+REPORT_TIME_BUDGET_S = 5.0
+
+CHART_CACHE_SIZE = 32
+MAX_AXIS_LABELS = 8
+
+BRAND_BLUE = colors.HexColor("#0B5ED7")
+SERIES_COLORS = [colors.HexColor("#DC3545"), colors.HexColor("#FFC107"), colors.HexColor("#28A745")]
+
+CHART_WIDTH = 16 * cm
+CHART_HEIGHT = 6 * cm
+
+
+# =====================================================================
+# GRAPHIQUES
+# =====================================================================
+def _axis_labels(dates):
+    """Libellés de dates espacés (au plus MAX_AXIS_LABELS visibles)"""
+    step = max(1, -(-len(dates) // MAX_AXIS_LABELS))
+    return [d.strftime("%d/%m/%y") if i % step == 0 else "" for i, d in enumerate(dates)]
+
+
+def _frame(title):
+    drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+    drawing.add(String(0, CHART_HEIGHT - 12, title, fontName="Helvetica-Bold", fontSize=10,
+                       fillColor=BRAND_BLUE))
+    return drawing
+
+
+def _place(chart):
+    chart.x = 1.2 * cm
+    chart.y = 1.0 * cm
+    chart.width = CHART_WIDTH - 1.6 * cm
+    chart.height = CHART_HEIGHT - 2.0 * cm
+    chart.categoryAxis.labels.fontName = "Helvetica"
+    chart.categoryAxis.labels.fontSize = 7
+    chart.categoryAxis.labels.angle = 30
+    chart.categoryAxis.labels.boxAnchor = "ne"
+    chart.valueAxis.labels.fontName = "Helvetica"
+    chart.valueAxis.labels.fontSize = 7
+    chart.valueAxis.valueMin = 0
+
+
+def line_chart(chart_df, columns, labels, title):
+    drawing = _frame(title)
+    chart = HorizontalLineChart()
+    _place(chart)
+    chart.data = [[float(v) for v in chart_df[c].fillna(0)] for c in columns]
+    chart.categoryAxis.categoryNames = _axis_labels(list(chart_df["date"]))
+    for i in range(len(columns)):
+        chart.lines[i].strokeColor = SERIES_COLORS[i % len(SERIES_COLORS)]
+        chart.lines[i].strokeWidth = 1.5
+    drawing.add(chart)
+
+    legend = Legend()
+    legend.x = CHART_WIDTH - 5 * cm
+    legend.y = CHART_HEIGHT - 6
+    legend.fontName = "Helvetica"
+    legend.fontSize = 7
+    legend.columnMaximum = 1
+    legend.alignment = "right"
+    legend.colorNamePairs = [(SERIES_COLORS[i % len(SERIES_COLORS)], labels[i]) for i in range(len(columns))]
+    drawing.add(legend)
+    return drawing
+
+
+def bar_chart(chart_df, column, title, color):
+    drawing = _frame(title)
+    chart = VerticalBarChart()
+    _place(chart)
+    chart.data = [[float(v) for v in chart_df[column].fillna(0)]]
+    chart.categoryAxis.categoryNames = _axis_labels(list(chart_df["date"]))
+    chart.bars[0].fillColor = color
+    chart.bars[0].strokeColor = None
+    drawing.add(chart)
+    return drawing
+
+
+def build_charts(chart_df, grain_label):
+    return [
+        line_chart(chart_df, ["anomalies_detected", "critical_incidents"],
+                   ["Anomalies", "Incidents critiques"],
+                   f"Anomalies & incidents critiques (par {grain_label})"),
+        bar_chart(chart_df, "high_risk_sessions", f"Sessions à haut risque (par {grain_label})",
+                  SERIES_COLORS[1]),
+        bar_chart(chart_df, "total_tickets", f"Tickets IT (par {grain_label})", SERIES_COLORS[2]),
+    ]
+
+
+class ChartCache:
+    """Graphiques déjà construits, par clé (version des données, période) — LRU"""
+
+    def __init__(self, max_entries=CHART_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        """(graphiques, trouvés en cache ?)"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key], True
+        charts = build()
+        with self._lock:
+            self._entries[key] = charts
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return charts, False
+
+
+# =====================================================================
+# DOCUMENT
+# =====================================================================
+def _table(rows, col_widths):
+    table = Table(rows, colWidths=col_widths)
+    table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), BRAND_BLUE),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("ALIGN", (1, 0), (-1, -1), "CENTER"),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F1F5FB")]),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#C9D3E0")),
+        ("TOPPADDING", (0, 0), (-1, -1), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ]))
+    return table
+
+
+def build_soc_report(start, end, kpis, stats_rows, charts):
+    """
+    PDF du rapport SOC en mémoire.
+
+    `kpis` : [(libellé, valeur)] ; `stats_rows` : lignes du tableau de
+    statistiques, en-tête compris ; `charts` : dessins reportlab.
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=2 * cm, rightMargin=2 * cm,
+                            topMargin=1.5 * cm, bottomMargin=1.5 * cm,
+                            title="Rapport SOC SecureOps", author="SecureOps SOC Platform")
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle("SocTitle", parent=styles["Title"], textColor=BRAND_BLUE, alignment=TA_CENTER)
+    section_style = ParagraphStyle("SocSection", parent=styles["Heading2"], textColor=BRAND_BLUE)
+
+    story = [
+        Paragraph("Rapport SOC — SecureOps", title_style),
+        Paragraph(f"Période : {start:%d/%m/%Y} – {end:%d/%m/%Y}", styles["Normal"]),
+        Paragraph(f"Généré le {datetime.now():%d/%m/%Y à %H:%M}", styles["Normal"]),
+        Spacer(1, 0.5 * cm),
+        Paragraph("Indicateurs clés", section_style),
+        _table([["Indicateur", "Valeur"]] + [[label, value] for label, value in kpis], [9 * cm, 6 * cm]),
+        Spacer(1, 0.4 * cm),
+        Paragraph("Statistiques détaillées", section_style),
+        _table(stats_rows, [5 * cm, 3.5 * cm, 3.5 * cm, 3.5 * cm]),
+        Spacer(1, 0.4 * cm),
+        Paragraph("Évolution sur la période", section_style),
+    ]
+    for drawing in charts:
+        # Copie superficielle : la mise en page marque le flowable (report de
+        # page), le dessin en cache doit rester réutilisable tel quel
+        story += [copy.copy(drawing), Spacer(1, 0.3 * cm)]
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+# =====================================================================
+# GÉNÉRATION EN ARRIÈRE-PLAN
+# =====================================================================
+class ReportWorker:
+    """Construit les rapports dans un thread dédié ; mesure chaque génération"""
+
+    def __init__(self, max_workers=1, chart_cache=None):
+        self.chart_cache = chart_cache or ChartCache()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report")
+
+    def _generate(self, key, start, end, kpis, stats_rows, chart_df, grain_label):
+        started = time.perf_counter()
+        charts, cached = self.chart_cache.get_or_build(key, lambda: build_charts(chart_df, grain_label))
+        charts_s = time.perf_counter() - started
+        pdf = build_soc_report(start, end, kpis, stats_rows, charts)
+        return {
+            "pdf": pdf,
+            "seconds": time.perf_counter() - started,
+            "charts_seconds": charts_s,
+            "charts_cached": cached,
+            "size_bytes": len(pdf),
+        }
+
+    def submit(self, key, start, end, kpis, stats_rows, chart_df, grain_label):
+        """Future -> {pdf, seconds, charts_seconds, charts_cached, size_bytes}"""
+        return self._executor.submit(self._generate, key, start, end, kpis, stats_rows,
+                                     chart_df.copy(), grain_label)
@@ -0,0 +1,289 @@
+"""
+Réentraînement de l'Isolation Forest sur les sessions récentes.
+
+Le job tourne dans son propre processus (à la demande depuis ⚙️ Paramètres,
+ou planifié avec `--every`) : l'ajustement, coûteux en CPU, ne touche pas
+au processus Streamlit. Chaque passe :
+
+1. prend la fenêtre glissante des sessions les plus récentes du store ;
+2. réajuste scaler + forêt sur le début de la fenêtre (mêmes paramètres
+   que le modèle de production) ;
+3. évalue candidat et modèle actif sur la fin de la fenêtre, tenue à
+   l'écart de l'ajustement (labels `attack_detected` du store : sessions
+   à haut risque selon les règles SOC, pas le label brut du dataset).
+   Seules les sessions postérieures aux jours d'entraînement des deux
+   modèles (`trained_until` des métadonnées du registre) sont retenues ;
+   sans elles, l'évaluation est signalée comme biaisée dans le compte rendu ;
+4. promeut le candidat s'il ne régresse pas : nouvelle version du registre
+   (dossier renommé d'un bloc) puis bascule du pointeur actif.
+
+Le scoring continue pendant tout ce temps avec le modèle actif ; les
+processus Streamlit basculent au rerun suivant la promotion.
+
+    python -m secureops.retraining            # une passe
+    python -m secureops.retraining --every 24 # toutes les 24 h
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from secureops.compiled_forest import CompiledForest
+from secureops.model_registry import DEFAULT_MODEL, REFERENCE_TABLE, ModelRegistry
+from secureops.scoring import ScoringPipeline
+from secureops.storage import read_table
+
+ROOT = Path(__file__).resolve().parent.parent
+STATUS_PATH = ROOT / ".cache" / "retraining.json"
+LOG_PATH = ROOT / ".cache" / "retraining.log"
+
+# Fenêtre glissante : sessions les plus récentes, dont la fin sert d'évaluation
+WINDOW_SESSIONS = 50_000
+HOLDOUT_FRACTION = 0.2
+LABEL_COLUMN = "attack_detected"
+
+# Paramètres de production (notebook 01_eda_secureops)
+FOREST_PARAMS = {"n_estimators": 200, "contamination": 0.15, "random_state": 42}
+
+# Promotion : le candidat ne doit pas perdre plus que cette marge sur la métrique
+PROMOTION_METRIC = "auc"
+MAX_REGRESSION = 0.01
+
+
+# =====================================================================
+# DONNÉES & ÉVALUATION
+# =====================================================================
+def training_window(features, window=WINDOW_SESSIONS, holdout=HOLDOUT_FRACTION, table=REFERENCE_TABLE,
+                    labels=(LABEL_COLUMN,), after=None):
+    """
+    (sessions d'ajustement, sessions d'évaluation), les plus récentes en dernier.
+
+    Coupure par jour : les sessions évaluées sont postérieures au dernier jour
+    d'ajustement et à `after` (fin de l'entraînement d'un autre modèle à
+    comparer). Sans session plus récente (store d'un seul jour), coupure au
+    rang : l'évaluation peut porter sur des jours déjà vus (`is_fresh_holdout`).
+    """
+    frame = read_table(table, columns=list(features) + list(labels) + ["event_date"])
+    # Tri stable : ordre d'arrivée conservé au sein d'une même date
+    frame = frame.sort_values("event_date", kind="stable").tail(window).reset_index(drop=True)
+    split = int(len(frame) * (1 - holdout))
+    if split == 0 or split == len(frame):
+        raise ValueError(f"Fenêtre trop petite pour évaluer ({len(frame)} sessions)")
+    dates = frame["event_date"]
+    last_fit = dates.iloc[split - 1]
+    fresh = dates > (last_fit if after is None else max(last_fit, pd.Timestamp(after)))
+    if fresh.any():
+        return frame[dates <= last_fit], frame[fresh]
+    return frame.iloc[:split], frame.iloc[split:]
+
+
+def is_fresh_holdout(train, test, after=None):
+    """Sessions d'évaluation toutes postérieures à l'ajustement et à `after` (None = inconnu : non)"""
+    if after is None:
+        return False
+    return bool(test["event_date"].min() > max(train["event_date"].max(), pd.Timestamp(after)))
+
+
+def evaluate(pipeline, frame, threshold=0.0, label=LABEL_COLUMN, scores=None):
+    """Qualité de détection contre les labels : précision, rappel, F1, AUC, taux signalé"""
+    from sklearn.metrics import roc_auc_score
+
+    scores = pipeline.decision_function(frame) if scores is None else scores
+    y = frame[label].to_numpy(dtype=bool)
+    flagged = scores < threshold
+    tp = int((flagged & y).sum())
+    precision = tp / max(int(flagged.sum()), 1)
+    recall = tp / max(int(y.sum()), 1)
+    return {
+        "precision": precision,
+        "recall": recall,
+        "f1": 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+        # Score bas = anomalie : l'AUC se calcule sur l'opposé
+        "auc": float(roc_auc_score(y, -scores)) if 0 < y.sum() < len(y) else float("nan"),
+        "flag_rate": float(flagged.mean()),
+    }
+
+
+# =====================================================================
+# RÉENTRAÎNEMENT
+# =====================================================================
+def fit_candidate(train, features, params=None, n_jobs=-1):
+    """Scaler + forêt ajustés sur la fenêtre ; la forêt est compilée pour le scoring"""
+    from sklearn.ensemble import IsolationForest
+    from sklearn.preprocessing import StandardScaler
+
+    X = train[list(features)].to_numpy(dtype=np.float64)
+    scaler = StandardScaler().fit(X)
+    forest = IsolationForest(**{**FOREST_PARAMS, **(params or {})}, n_jobs=n_jobs).fit(scaler.transform(X))
+    return CompiledForest.from_sklearn(forest), scaler
+
+
+def retrain(registry=None, model=DEFAULT_MODEL, window=WINDOW_SESSIONS, holdout=HOLDOUT_FRACTION,
+            promote=True, max_regression=MAX_REGRESSION, on_status=None):
+    """Une passe complète ; retourne le compte rendu (métriques, version, promotion)"""
+    registry = registry or ModelRegistry()
+    report = {"state": "running", "pid": os.getpid(), "started_at": datetime.now().isoformat(timespec="seconds")}
+    notify = on_status or (lambda r: None)
+    notify(report)
+
+    current = registry.active()
+    features = current.pipeline.features
+    # Dernier jour vu par le modèle actif : l'évaluation ne porte que sur les jours suivants
+    current_until = registry.meta(current.model, current.version).get("trained_until")
+    train, test = training_window(features, window, holdout, after=current_until)
+    fresh = is_fresh_holdout(train, test, current_until)
+    report.update(train_sessions=len(train), holdout_sessions=len(test), fresh_holdout=fresh, step="fit")
+    notify(report)
+
+    started = time.perf_counter()
+    estimator, scaler = fit_candidate(train, features)
+    report["fit_seconds"] = time.perf_counter() - started
+
+    candidate = ScoringPipeline(estimator, scaler, features)
+    report["metrics"] = {"candidate": evaluate(candidate, test), "current": evaluate(current.pipeline, test)}
+    report["current"] = f"{current.model}/{current.version}"
+    gain = report["metrics"]["candidate"][PROMOTION_METRIC] - report["metrics"]["current"][PROMOTION_METRIC]
+    accepted = bool(gain >= -max_regression)
+
+    report["promoted"] = False
+    if accepted and promote:
+        version = registry.register(model, estimator, scaler, features, meta={
+            "source": "retraining",
+            "params": FOREST_PARAMS,
+            "train_sessions": len(train),
+            "holdout_sessions": len(test),
+            "trained_from": train["event_date"].min().date().isoformat(),
+            "trained_until": train["event_date"].max().date().isoformat(),
+            "fit_seconds": report["fit_seconds"],
+            "metrics": report["metrics"]["candidate"],
+        })
+        registry.activate(model, version)
+        report.update(version=version, promoted=True)
+    report["reason"] = (
+        f"{PROMOTION_METRIC} {report['metrics']['candidate'][PROMOTION_METRIC]:.4f} vs "
+        f"{report['metrics']['current'][PROMOTION_METRIC]:.4f} "
+        + ("(promu)" if report["promoted"] else "(accepté, non promu)" if accepted else "(rejeté)")
+    )
+    if not fresh:
+        reason = ("plage d'entraînement du modèle actif inconnue" if current_until is None
+                  else f"modèle actif entraîné jusqu'au {current_until}")
+        report["reason"] += (f" — évaluation biaisée en faveur du modèle actif ({reason}, "
+                             f"aucune session plus récente dans la fenêtre)")
+    report.update(state="done", step=None, finished_at=datetime.now().isoformat(timespec="seconds"))
+    notify(report)
+    return report
+
+
+# =====================================================================
+# SUIVI & LANCEMENT HORS PROCESSUS
+# =====================================================================
+def write_status(report, path=STATUS_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(report, indent=2, default=str) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_status(path=STATUS_PATH):
+    """Dernier compte rendu ({} si aucun job n'a tourné)"""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except:
+        return {}
+
+
+# Jobs lancés par ce processus : `poll` les récolte une fois terminés
+_children = {}
+
+
+def _alive(pid):
+    if pid is None:
+        # Lancé par ce processus, pas encore identifié dans son propre compte rendu
+        return any(child.poll() is None for child in _children.values())
+    child = _children.get(pid)
+    if child is not None:
+        return child.poll() is None
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+
+def is_running(status=None):
+    status = read_status() if status is None else status
+    return status.get("state") == "running" and _alive(status.get("pid", -1))
+
+
+def launch(extra_args=()):
+    """
+    Démarre une passe dans un processus séparé ; retourne son pid (None si
+    un job tourne déjà ou si le processus n'a pas pu être lancé).
+    """
+    if is_running():
+        return None
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Statut écrit avant le démarrage : seul le processus enfant l'écrit ensuite
+    # (un échec rapide de sa part n'est jamais écrasé par le lanceur)
+    write_status({"state": "running", "pid": None, "step": "start",
+                  "started_at": datetime.now().isoformat(timespec="seconds")})
+    try:
+        with open(LOG_PATH, "ab") as log:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "secureops.retraining", *extra_args],
+                cwd=ROOT, stdout=log, stderr=subprocess.STDOUT, start_new_session=True
+            )
+    except OSError as e:
+        write_status({"state": "failed", "error": str(e), "finished_at": datetime.now().isoformat(timespec="seconds")})
+        return None
+    _children[process.pid] = process
+    return process.pid
+
+
+def run_once(args):
+    try:
+        report = retrain(window=args.window, holdout=args.holdout, promote=not args.no_promote,
+                         max_regression=args.max_regression, on_status=write_status)
+    except Exception as e:
+        report = {"state": "failed", "error": str(e), "finished_at": datetime.now().isoformat(timespec="seconds")}
+        write_status(report)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Réentraînement glissant de l'Isolation Forest")
+    parser.add_argument("--window", type=int, default=WINDOW_SESSIONS, help="Sessions récentes utilisées")
+    parser.add_argument("--holdout", type=float, default=HOLDOUT_FRACTION, help="Part finale tenue à l'écart")
+    parser.add_argument("--max-regression", type=float, default=MAX_REGRESSION)
+    parser.add_argument("--no-promote", action="store_true", help="Évalue sans enregistrer le candidat")
+    parser.add_argument("--every", type=float, default=None, help="Relance toutes les N heures")
+    args = parser.parse_args(argv)
+
+    # Priorité basse : le service Streamlit garde la main sur le CPU
+    try:
+        os.nice(10)
+    except:
+        pass
+
+    while True:
+        report = run_once(args)
+        if report["state"] == "failed":
+            print(f"❌ Réentraînement en échec : {report['error']}")
+        else:
+            print(f"✅ {report['train_sessions']:,} sessions ajustées en {report['fit_seconds']:.1f}s, "
+                  f"{report['holdout_sessions']:,} évaluées — {report['reason']}")
+        if args.every is None:
+            return
+        time.sleep(args.every * 3600)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Cube d'agrégats SOC par jour / semaine / mois pour les graphiques.
+
+Les agrégats de chaque granularité sont calculés une fois par chargement
+des données ; en mode live, seules les périodes qui contiennent des jours
+nouveaux ou réécrits sont recalculées (`update_rollups`). Les graphiques reçoivent ensuite la granularité la plus
+grossière qui garde assez de points sur la période choisie : le calcul et
+le volume envoyé au navigateur restent bornés, même sur plusieurs années.
+
+Sémantique d'agrégation :
+- les compteurs sont sommés ;
+- les moyennes journalières sont pondérées par leur effectif (ex. durée
+  moyenne des incidents pondérée par le nombre d'incidents du jour).
+"""
+import numpy as np
+import pandas as pd
+
+# Granularités, de la plus fine à la plus grossière. Le découpage est fait
+# dans `_period_start` (semaines du lundi, mois calendaires).
+GRAINS = ("day", "week", "month")
+
+GRAIN_LABELS = {"day": "jour", "week": "semaine", "month": "mois"}
+
+# Durée approximative d'une période, en jours (choix de la granularité)
+GRAIN_DAYS = {"day": 1, "week": 7, "month": 30.44}
+
+# Nombre minimal de points par graphique avant de passer à une granularité plus fine
+MIN_POINTS = 60
+
+SUM_METRICS = [
+    "total_sessions", "anomalies_detected", "high_risk_sessions",
+    "total_incidents", "critical_incidents", "total_tickets"
+]
+
+# Moyenne -> colonne de pondération. Le p95 n'est pas agrégeable exactement :
+# on retient la moyenne des p95 journaliers pondérée par le nombre de tickets.
+WEIGHTED_MEANS = {
+    "avg_packet_size": "total_sessions",
+    "avg_ip_reputation": "total_sessions",
+    "avg_incident_duration_days": "total_incidents",
+    "avg_resolution_minutes": "total_tickets",
+    "p95_resolution_minutes": "total_tickets",
+}
+
+
+def _period_start(dates, grain):
+    dates = pd.DatetimeIndex(dates).normalize()
+    if grain == "day":
+        return dates
+    if grain == "week":
+        return dates - pd.to_timedelta(dates.dayofweek, unit="D")
+    return dates - pd.to_timedelta(dates.day - 1, unit="D")
+
+
+def rollup(df, grain, date_col="date"):
+    """Agrège `df` à la granularité `grain` (une ligne par début de période)"""
+    if grain not in GRAINS:
+        raise KeyError(f"Granularité inconnue : {grain} ({', '.join(GRAINS)})")
+    periods = _period_start(df[date_col], grain)
+    groups = df.groupby(periods)
+
+    out = pd.DataFrame(index=groups.size().index)
+    for col in SUM_METRICS:
+        if col in df.columns:
+            out[col] = groups[col].sum()
+
+    for col, weight in WEIGHTED_MEANS.items():
+        if col not in df.columns:
+            continue
+        if weight not in df.columns:
+            out[col] = groups[col].mean()
+            continue
+        # Lignes sans valeur : elles ne comptent ni au numérateur ni au dénominateur
+        w = df[weight].where(df[col].notna(), 0)
+        num = (df[col].fillna(0) * w).groupby(periods).sum()
+        den = w.groupby(periods).sum()
+        weighted = num / den.replace(0, np.nan)
+        # Période sans effectif : moyenne simple des valeurs disponibles
+        out[col] = weighted.fillna(groups[col].mean())
+
+    out.index.name = date_col
+    return out.reset_index()
+
+
+def build_rollups(df, date_col="date"):
+    """{granularité: DataFrame agrégé} pour toutes les granularités"""
+    return {grain: rollup(df, grain, date_col) for grain in GRAINS}
+
+
+def update_rollups(rollups, df, since, date_col="date"):
+    """
+    Cube de la version suivante des données : pour chaque granularité, les
+    périodes qui commencent avant celle de `since` sont reprises telles
+    quelles, les suivantes sont réagrégées depuis `df` (trié par date).
+    """
+    dates = df[date_col].to_numpy(dtype="datetime64[ns]")
+    updated = {}
+    for grain, table in rollups.items():
+        first = _period_start([pd.Timestamp(since)], grain)[0]
+        kept = table[table[date_col] < first]
+        lo = np.searchsorted(dates, np.datetime64(first, "ns"), side="left")
+        updated[grain] = pd.concat([kept, rollup(df.iloc[lo:], grain, date_col)], ignore_index=True)
+    return updated
+
+
+def period_end(date, grain):
+    """Dernier jour de la période de `grain` qui contient `date`"""
+    start = _period_start([pd.Timestamp(date)], grain)[0]
+    if grain == "day":
+        return start
+    if grain == "week":
+        return start + pd.Timedelta(days=6)
+    return start + pd.offsets.MonthEnd(0)
+
+
+def choose_grain(start, end, min_points=MIN_POINTS):
+    """Granularité la plus grossière donnant au moins `min_points` points sur [start, end]"""
+    span_days = (pd.Timestamp(end) - pd.Timestamp(start)).days + 1
+    for grain in reversed(GRAINS):
+        if span_days / GRAIN_DAYS[grain] >= min_points:
+            return grain
+    return "day"
+
+
+def rollup_range(rollups, start, end, grain=None, date_col="date"):
+    """
+    Points de la période à la granularité `grain` (choisie automatiquement
+    si None). Les périodes partiellement couvertes aux bornes sont incluses.
+    Retourne (DataFrame, granularité).
+    """
+    grain = grain or choose_grain(start, end)
+    table = rollups[grain]
+    first = _period_start([pd.Timestamp(start)], grain)[0]
+    dates = table[date_col].to_numpy(dtype="datetime64[ns]")
+    lo = np.searchsorted(dates, np.datetime64(first, "ns"), side="left")
+    hi = np.searchsorted(dates, np.datetime64(pd.Timestamp(end), "ns"), side="right")
+    return table.iloc[lo:hi], grain
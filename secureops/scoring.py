@@ -0,0 +1,85 @@
+"""
+Pipeline de scoring ML : StandardScaler + ordre des features + Isolation Forest.
+
+Les artefacts de `models/` (forêt, scaler.pkl, ml_features.pkl) sont
+regroupés dans un seul objet, chargé une fois. La forêt est lue depuis sa
+version compilée `isolation_forest.npz` quand elle existe.
+"""
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+from secureops.compiled_forest import CompiledForest, file_digest
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / "models"
+
+
+class ScoringPipeline:
+    """Standardise, impose l'ordre `ml_features` puis score avec la forêt"""
+
+    def __init__(self, forest, scaler, features):
+        self.forest = forest
+        self.features = list(features)
+
+        # Paramètres du scaler extraits une fois : la standardisation devient
+        # une simple opération NumPy, sans DataFrame ni validation sklearn
+        mean = np.asarray(scaler.mean_, dtype=np.float64)
+        scale = np.asarray(scaler.scale_, dtype=np.float64)
+        fitted_names = getattr(scaler, "feature_names_in_", None)
+        if fitted_names is not None:
+            order = [list(fitted_names).index(f) for f in self.features]
+            mean, scale = mean[order], scale[order]
+        self._mean = mean
+        self._scale = scale
+
+    def to_array(self, X):
+        """Matrice (n, n_features) dans l'ordre du modèle, quel que soit le format d'entrée"""
+        if hasattr(X, "columns"):
+            return X[self.features].to_numpy(dtype=np.float64)
+        if isinstance(X, dict):
+            return np.array([[X[f] for f in self.features]], dtype=np.float64)
+
+        arr = np.asarray(X, dtype=np.float64)
+        if arr.ndim == 1:
+            arr = arr.reshape(1, -1)
+        if arr.shape[1] != len(self.features):
+            raise ValueError(
+                f"{arr.shape[1]} colonnes reçues, {len(self.features)} attendues ({', '.join(self.features)})"
+            )
+        return arr
+
+    def transform(self, X):
+        return (self.to_array(X) - self._mean) / self._scale
+
+    def decision_function(self, X):
+        """Score d'anomalie : négatif = anomalie (convention Isolation Forest)"""
+        return self.forest.decision_function(self.transform(X))
+
+    def predict(self, X, threshold=0.0):
+        """1 = anomalie (score < `threshold`), 0 = normal (même codage que la colonne `anomaly`)"""
+        return (self.decision_function(X) < threshold).astype(int)
+
+
+def load_forest(models_dir=MODELS_DIR):
+    """Forêt compilée (.npz) si elle est à jour, sinon le modèle sklearn picklé"""
+    models_dir = Path(models_dir)
+    pickled = models_dir / "isolation_forest.pkl"
+    compiled = models_dir / "isolation_forest.npz"
+
+    if compiled.exists():
+        forest = CompiledForest.load(compiled)
+        # Un .npz compilé depuis un autre .pkl correspond à un modèle réentraîné depuis
+        if not pickled.exists() or forest.source_digest == file_digest(pickled):
+            return forest
+    return joblib.load(pickled)
+
+
+def load_pipeline(models_dir=MODELS_DIR):
+    """Charge forêt, scaler et liste des features depuis `models_dir`"""
+    models_dir = Path(models_dir)
+    return ScoringPipeline(
+        forest=load_forest(models_dir),
+        scaler=joblib.load(models_dir / "scaler.pkl"),
+        features=joblib.load(models_dir / "ml_features.pkl"),
+    )
@@ -0,0 +1,85 @@
+"""
+Sensibilité de détection sans réentraînement.
+
+La distribution des scores d'anomalie du modèle sur les sessions de
+référence est résumée par ses quantiles, calculés une fois et stockés avec
+la version du modèle (`score_quantiles.npy`). Une sensibilité devient une
+proportion de sessions à signaler, donc un seuil de score lu dans ces
+quantiles : changer la sensibilité revient à comparer les scores déjà
+calculés à un autre seuil, sans réajuster la forêt (`contamination`).
+
+Sensibilité 0.5 -> 15 % des sessions signalées, la `contamination` de
+l'entraînement ; la part CRITIQUE reproduit l'ancien seuil fixe -0.10.
+"""
+from pathlib import Path
+
+import numpy as np
+
+QUANTILES_FILE = "score_quantiles.npy"
+
+# Grille des probabilités : pas de 0.05 %
+QUANTILE_GRID = np.linspace(0.0, 1.0, 2001)
+
+DEFAULT_SENSITIVITY = 0.5
+# Proportion signalée à sensibilité maximale (linéaire : 0.5 -> 15 %)
+MAX_FLAG_RATE = 0.30
+# Part des sessions signalées classées CRITIQUE (0.6 % / 15 % sur la référence)
+CRITICAL_SHARE = 0.04
+
+# Seuils fixes historiques, sans distribution de référence : (CRITIQUE, ÉLEVÉ)
+LEGACY_CUTOFFS = (-0.10, 0.0)
+
+
+def flag_rate(sensitivity):
+    """Proportion de sessions à signaler pour une sensibilité dans [0, 1]"""
+    return float(np.clip(sensitivity, 0.0, 1.0)) * MAX_FLAG_RATE
+
+
+class ScoreDistribution:
+    """Quantiles des scores de référence d'une version de modèle"""
+
+    def __init__(self, quantiles, n_reference=0):
+        self.quantiles = np.asarray(quantiles, dtype=np.float64)
+        self.n_reference = int(n_reference)
+
+    @classmethod
+    def from_scores(cls, scores):
+        scores = np.asarray(scores, dtype=np.float64)
+        scores = scores[np.isfinite(scores)]
+        if scores.size == 0:
+            raise ValueError("Aucun score de référence")
+        return cls(np.quantile(scores, QUANTILE_GRID), n_reference=scores.size)
+
+    def threshold(self, rate):
+        """Score sous lequel se trouve la proportion `rate` des sessions de référence"""
+        return float(np.interp(rate, QUANTILE_GRID, self.quantiles))
+
+    def rate(self, threshold):
+        """Proportion des sessions de référence sous `threshold`"""
+        return float(np.interp(threshold, self.quantiles, QUANTILE_GRID))
+
+    def cutoffs(self, sensitivity=DEFAULT_SENSITIVITY):
+        """(seuil CRITIQUE, seuil ÉLEVÉ) : score < seuil -> niveau"""
+        rate = flag_rate(sensitivity)
+        return self.threshold(rate * CRITICAL_SHARE), self.threshold(rate)
+
+    def save(self, path):
+        # Nombre de sessions de référence en tête du tableau
+        np.save(path, np.concatenate([[self.n_reference], self.quantiles]))
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        return cls(data[1:], n_reference=data[0])
+
+
+def load_distribution(directory):
+    """Distribution stockée dans le dossier d'une version, ou None"""
+    path = Path(directory) / QUANTILES_FILE
+    return ScoreDistribution.load(path) if path.exists() else None
+
+
+def risk_labels(scores, cutoffs=LEGACY_CUTOFFS):
+    """Niveau de risque SOC (CRITIQUE / ÉLEVÉ / FAIBLE) : une comparaison vectorisée par seuil"""
+    critical, high = cutoffs
+    return np.select([scores < critical, scores < high], ["CRITIQUE", "ÉLEVÉ"], default="FAIBLE")
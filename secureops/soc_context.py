@@ -0,0 +1,268 @@
+"""
+Contexte SOC des prompts LLM, tenu à jour de façon incrémentale.
+
+Agrégats maintenus :
+- KPI consolidés sur une fenêtre glissante des N derniers jours (sommes et
+  moyennes mises à jour à l'entrée / sortie de chaque jour) ;
+- répartition des types de brèches (`breach_type`) des incidents ;
+- répartition des niveaux de risque et des règles déclenchées
+  (`risk_level`, `risk_drivers`) des sessions réseau.
+
+Chaque rafraîchissement ne lit que le dernier jour vu et les suivants : la
+contribution de ce dernier jour, qui a pu recevoir des lignes depuis, est
+remplacée plutôt que cumulée. Le rendu respecte un budget de tokens : les sections les moins
+prioritaires sont raccourcies puis retirées jusqu'à tenir dans le budget.
+"""
+import math
+import threading
+from collections import Counter, deque
+
+import numpy as np
+import pandas as pd
+
+from secureops.storage import PROCESSED_DIR, read_table, table_exists
+
+DEFAULT_WINDOW_DAYS = 14
+DEFAULT_TOKEN_BUDGET = 600
+
+# Approximation sans tokenizer : ~4 caractères par token (texte FR + emojis)
+CHARS_PER_TOKEN = 4
+
+# KPI sommés sur la fenêtre / moyennés (moyenne des valeurs journalières connues)
+WINDOW_SUMS = ["anomalies_detected", "high_risk_sessions", "critical_incidents",
+               "total_incidents", "total_tickets"]
+WINDOW_MEANS = ["avg_incident_duration_days", "avg_ip_reputation"]
+
+TOP_N = 5
+
+
+def estimate_tokens(text):
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _number(value):
+    return 0.0 if value is None or pd.isna(value) else float(value)
+
+
+def _value_counts(column):
+    """{libellé: effectif} ; compté sur les codes des catégorielles, sans conversion ligne à ligne en texte"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(column.cat.categories))
+        return {str(label): int(count) for label, count in zip(column.cat.categories, counts) if count > 0}
+    return {str(label): int(count) for label, count in column.value_counts().items() if count > 0}
+
+
+def _same_row(a, b):
+    return a.keys() == b.keys() and all(
+        (pd.isna(a[k]) and pd.isna(b[k])) if pd.isna(a[k]) or pd.isna(b[k]) else a[k] == b[k] for k in a
+    )
+
+
+class _Section:
+    """Bloc du prompt : titre + lignes, retirables par la fin"""
+
+    def __init__(self, title, lines, priority, required=False):
+        self.title = title
+        self.lines = list(lines)
+        self.priority = priority
+        self.required = required
+
+    def render(self):
+        return "\n".join([self.title] + self.lines)
+
+
+class SocContextBuilder:
+    """Agrégats SOC glissants et rendu borné en tokens (partagé entre sessions)"""
+
+    def __init__(self, window_days=DEFAULT_WINDOW_DAYS, token_budget=DEFAULT_TOKEN_BUDGET):
+        self.window_days = window_days
+        self.token_budget = token_budget
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        # Fenêtre KPI : jours (date, valeurs) + sommes / comptes courants
+        self._days = deque()
+        self._sums = dict.fromkeys(WINDOW_SUMS + WINDOW_MEANS, 0.0)
+        self._counts = dict.fromkeys(WINDOW_MEANS, 0)
+        self._last_kpi_date = None
+
+        # Répartitions par colonne source (breach_type, risk_level, risk_drivers)
+        self._counters = {c: Counter() for c in ("breach_type", "risk_level", "risk_drivers")}
+        self._watermarks = {}
+
+        # Rendu mis en cache tant que les agrégats ne changent pas
+        self._version = 0
+        self._rendered = {}
+
+    # -----------------------------------------------------------------
+    # Mises à jour incrémentales
+    # -----------------------------------------------------------------
+    def _push_day(self, row):
+        for c in WINDOW_SUMS:
+            self._sums[c] += _number(row.get(c))
+        for c in WINDOW_MEANS:
+            value = row.get(c)
+            if value is not None and not pd.isna(value):
+                self._sums[c] += float(value)
+                self._counts[c] += 1
+        self._days.append(row)
+
+    def _pop_day(self, row):
+        for c in WINDOW_SUMS:
+            self._sums[c] -= _number(row.get(c))
+        for c in WINDOW_MEANS:
+            value = row.get(c)
+            if value is not None and not pd.isna(value):
+                self._sums[c] -= float(value)
+                self._counts[c] -= 1
+
+    def update_kpis(self, daily):
+        """Ajoute les jours consolidés à partir du dernier jour vu (remplacé) ; retourne leur nombre"""
+        if daily is None or daily.empty:
+            return 0
+        with self._lock:
+            new = daily
+            if self._last_kpi_date is not None:
+                new = daily[daily["date"] >= self._last_kpi_date]
+            if new.empty:
+                return 0
+            # Seuls les N derniers jours peuvent entrer dans la fenêtre
+            new = new.sort_values("date").tail(self.window_days)
+            if self._days and self._days[-1]["date"] == new["date"].iloc[0]:
+                # Dernier jour reconsolidé (upsert) : l'ancienne ligne sort de la fenêtre
+                if len(new) == 1 and _same_row(new.iloc[0].to_dict(), self._days[-1]):
+                    return 0
+                self._pop_day(self._days.pop())
+            for row in new.to_dict("records"):
+                self._push_day(row)
+                if len(self._days) > self.window_days:
+                    self._pop_day(self._days.popleft())
+            self._last_kpi_date = new["date"].iloc[-1]
+            self._version += 1
+            return len(new)
+
+    def _update_counters(self, counts, replaced=None):
+        """Cumule `counts` ({colonne: effectifs}) ; `replaced` (effectifs déjà comptés) est retiré d'abord"""
+        counters = {column: self._counters[column] for column in counts}
+        with self._lock:
+            for column, counter in counters.items():
+                if replaced:
+                    counter.subtract(replaced.get(column, {}))
+                counter.update(counts[column])
+                # Effectifs tombés à zéro après remplacement : retirés de la répartition
+                for label in [label for label, count in counter.items() if count <= 0]:
+                    del counter[label]
+            self._version += 1
+
+    def update_incidents(self, incidents):
+        if incidents is None or incidents.empty:
+            return
+        self._update_counters({"breach_type": _value_counts(incidents["breach_type"])})
+
+    def update_intrusions(self, sessions):
+        if sessions is None or sessions.empty:
+            return
+        self._update_counters({c: _value_counts(sessions[c]) for c in ("risk_level", "risk_drivers")})
+
+    def refresh_sources(self, processed_dir=PROCESSED_DIR):
+        """Lit dans le store les incidents / sessions à partir du dernier jour vu"""
+        sources = {
+            "incidents_processed": ["breach_type"],
+            "intrusion_processed": ["risk_level", "risk_drivers"],
+        }
+        with self._refresh_lock:
+            for name, columns in sources.items():
+                if not table_exists(name, processed_dir):
+                    continue
+                # Watermark : (dernier jour lu, effectifs comptés pour ce jour)
+                last_day, last_counts = self._watermarks.get(name, (None, None))
+                filters = [("event_date", ">=", last_day)] if last_day is not None else None
+                rows = read_table(name, columns=columns + ["event_date"], filters=filters,
+                                  processed_dir=processed_dir)
+                if rows.empty:
+                    continue
+                # Le dernier jour est relu en entier : sa contribution précédente est remplacée.
+                # Colonne déjà typée date : jour max et lignes de ce jour sans conversion
+                new_last = rows["event_date"].max().normalize()
+                counts = {c: _value_counts(rows[c]) for c in columns}
+                self._update_counters(counts, replaced=last_counts)
+                on_last = rows["event_date"] >= new_last
+                if not on_last.all():
+                    tail = rows[on_last]
+                    counts = {c: _value_counts(tail[c]) for c in columns}
+                self._watermarks[name] = (new_last, counts)
+
+    # -----------------------------------------------------------------
+    # Rendu
+    # -----------------------------------------------------------------
+    def _sections(self):
+        sections = []
+        if not self._days:
+            sections.append(_Section("Aucune donnée SOC disponible pour l'analyse.", [], 0, required=True))
+        else:
+            first, last = self._days[0], self._days[-1]
+
+            def mean(c):
+                return f"{self._sums[c] / self._counts[c]:.2f}" if self._counts[c] else "n/d"
+
+            sections.append(_Section(
+                "🔐 CONTEXTE SOC - SECUREOPS PLATFORM\n"
+                f"📅 Période: {first['date']:%d/%m/%Y} - {last['date']:%d/%m/%Y} ({len(self._days)} jours)",
+                [], 0, required=True
+            ))
+            sections.append(_Section("📊 MÉTRIQUES CLÉS:", [
+                f"• Anomalies détectées: {int(self._sums['anomalies_detected'])}",
+                f"• Sessions haut risque: {int(self._sums['high_risk_sessions'])}",
+                f"• Incidents critiques: {int(self._sums['critical_incidents'])} / {int(self._sums['total_incidents'])}",
+                f"• MTTR moyen: {mean('avg_incident_duration_days')} jours",
+                f"• Réputation IP moyenne: {mean('avg_ip_reputation')}",
+                f"• Tickets IT: {int(self._sums['total_tickets'])}",
+            ], 0, required=True))
+
+            def evolution(c):
+                start = _number(first.get(c))
+                return (_number(last.get(c)) - start) / max(start, 1) * 100
+
+            sections.append(_Section("📈 TENDANCES:", [
+                f"• Évolution anomalies: {evolution('anomalies_detected'):.1f}%",
+                f"• Évolution risque: {evolution('high_risk_sessions'):.1f}%",
+            ], 1))
+
+        def distribution(counter):
+            total = sum(counter.values())
+            return [f"• {label}: {count} ({count / total:.0%})" for label, count in counter.most_common(TOP_N)]
+
+        risk_levels, breach_types, risk_drivers = (
+            self._counters[c] for c in ("risk_level", "breach_type", "risk_drivers"))
+        if risk_levels:
+            sections.append(_Section("🎯 NIVEAUX DE RISQUE DES SESSIONS:", distribution(risk_levels), 2))
+        if breach_types:
+            sections.append(_Section("🚨 TYPES DE BRÈCHES LES PLUS FRÉQUENTS:", distribution(breach_types), 3))
+        if risk_drivers:
+            sections.append(_Section("🔎 RÈGLES DE RISQUE DÉCLENCHÉES:", distribution(risk_drivers), 4))
+        return sections
+
+    def render(self, token_budget=None):
+        """Contexte texte tenant dans `token_budget` tokens (estimation)"""
+        budget = token_budget or self.token_budget
+        with self._lock:
+            cached = self._rendered.get(budget)
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
+
+            sections = self._sections()
+
+            def text():
+                return "\n\n".join(s.render() for s in sections)
+
+            # Section la moins prioritaire d'abord : ligne par ligne, puis en entier
+            for section in sorted((s for s in sections if not s.required), key=lambda s: -s.priority):
+                while estimate_tokens(text()) > budget and len(section.lines) > 1:
+                    section.lines.pop()
+                if estimate_tokens(text()) > budget:
+                    sections.remove(section)
+
+            rendered = text()
+            self._rendered[budget] = (self._version, rendered)
+            return rendered
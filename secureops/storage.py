@@ -0,0 +1,265 @@
+"""
+Stockage colonnaire typé des datasets SOC traités.
+
+Chaque table de `Notebooks/data/processed/` est convertie en Parquet avec
+des types explicites (dates, booléens, catégories, entiers compacts). La
+lecture ne charge que les colonnes demandées, sans re-parser de CSV.
+
+Les lots ajoutés par l'ingestion sont écrits à part, un fichier par lot
+dans `<table>.parts/`, sans réécrire la table principale ; la lecture
+réunit table principale et parts.
+
+Construction / reconstruction du store depuis les CSV :
+    python -m secureops.storage
+Regroupement des parts dans la table principale :
+    python -m secureops.storage --compact intrusion_processed
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+PROCESSED_DIR = Path(__file__).resolve().parent.parent / "Notebooks" / "data" / "processed"
+
+# Types explicites par table ("datetime" = datetime64[ns])
+SCHEMAS = {
+    "consolidated_soc": {
+        "date": "datetime",
+        "total_sessions": "int64",
+        "anomalies_detected": "int64",
+        "high_risk_sessions": "int64",
+        "avg_packet_size": "float64",
+        "avg_ip_reputation": "float64",
+        "total_incidents": "int64",
+        "critical_incidents": "int64",
+        "avg_incident_duration_days": "float64",
+        "critical_incident_rate": "float64",
+        "total_tickets": "int64",
+        "avg_resolution_minutes": "float64",
+        "p95_resolution_minutes": "float64",
+    },
+    "intrusion_processed": {
+        "session_id": "string",
+        "packet_size": "int32",
+        "protocol_type": "category",
+        "login_attempts_count": "int32",
+        "session_duration_seconds": "float64",
+        "encryption_used": "category",
+        "ip_reputation_score": "float64",
+        "failed_logins_count": "int32",
+        "browser_type": "category",
+        "unusual_time_access": "bool",
+        "attack_detected": "bool",
+        "high_risk_session": "int8",
+        "high_failed_logins": "bool",
+        "low_ip_reputation": "bool",
+        "unusual_access": "bool",
+        "no_encryption": "bool",
+        "suspicious_session": "bool",
+        "risk_score": "int16",
+        "risk_level": "category",
+        "risk_drivers": "category",
+        "anomaly": "int8",
+        "soc_alert": "bool",
+        "event_date": "datetime",
+    },
+    "incidents_processed": {
+        "incident_id": "int64",
+        "entity_name": "string",
+        "State": "category",
+        "third_party_involved": "category",
+        "individuals_affected": "int64",
+        "breach_date": "datetime",
+        "breach_type": "category",
+        "breach_location": "category",
+        "date_reported": "datetime",
+        "incident_summary": "string",
+        "breach_start": "datetime",
+        "breach_end": "datetime",
+        "year": "int16",
+        "incident_status": "category",
+        "incident_duration_days": "float64",
+        "critical_incident": "int8",
+        "severity": "category",
+        "event_date": "datetime",
+    },
+    # Export ITSM : seules les colonnes utilisées par la consolidation sont typées
+    "tickets_processed": {
+        "Ticket ID": "string",
+        "Priority": "category",
+        "Status": "category",
+        "Created time": "datetime",
+        "Resolution time": "datetime",
+        "resolution_time_minutes": "float64",
+        "event_date": "datetime",
+    },
+}
+
+_TRUE_STRINGS = {"true", "1", "yes"}
+
+
+def table_path(name, processed_dir=PROCESSED_DIR, suffix=".parquet"):
+    if name not in SCHEMAS:
+        raise KeyError(f"Table inconnue : {name} (tables : {', '.join(SCHEMAS)})")
+    return Path(processed_dir) / f"{name}{suffix}"
+
+
+def parts_dir(name, processed_dir=PROCESSED_DIR):
+    """Dossier des lots ajoutés à une table (`<table>.parts/`)"""
+    return table_path(name, processed_dir, suffix=".parts")
+
+
+def part_files(name, processed_dir=PROCESSED_DIR):
+    directory = parts_dir(name, processed_dir)
+    return sorted(directory.glob("*.parquet")) if directory.is_dir() else []
+
+
+def new_part_path(name, processed_dir=PROCESSED_DIR):
+    """Chemin d'un nouveau lot ; l'ordre des noms suit l'ordre d'écriture"""
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    return parts_dir(name, processed_dir) / f"part-{stamp}-{os.getpid()}.parquet"
+
+
+def table_exists(name, processed_dir=PROCESSED_DIR):
+    return (table_path(name, processed_dir).exists()
+            or table_path(name, processed_dir, suffix=".csv").exists()
+            or bool(part_files(name, processed_dir)))
+
+
+def table_mtime(name, processed_dir=PROCESSED_DIR):
+    """Dernière modification de la table (fichier principal ou ajout d'un lot), en ns ; None si absente"""
+    mtimes = []
+    for path in (table_path(name, processed_dir), table_path(name, processed_dir, suffix=".csv")):
+        if path.exists():
+            mtimes.append(path.stat().st_mtime_ns)
+            break
+    directory = parts_dir(name, processed_dir)
+    if directory.is_dir():
+        mtimes.append(directory.stat().st_mtime_ns)
+    return max(mtimes) if mtimes else None
+
+
+def coerce(df, name):
+    """Applique les types de `SCHEMAS[name]` aux colonnes présentes"""
+    df = df.copy()
+    for col, dtype in SCHEMAS[name].items():
+        if col not in df.columns:
+            continue
+        if dtype == "datetime":
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+        elif dtype == "bool" and df[col].dtype == object:
+            # Booléens stockés en texte ("True"/"False") dans les CSV
+            df[col] = df[col].astype(str).str.strip().str.lower().isin(_TRUE_STRINGS)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def write_table(df, name, processed_dir=PROCESSED_DIR):
+    """Écrit une table typée en Parquet (remplacement atomique du fichier principal, parts conservées)"""
+    path = table_path(name, processed_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".parquet.tmp")
+    coerce(df, name).to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+def read_table(name, columns=None, filters=None, processed_dir=PROCESSED_DIR):
+    """
+    Lit une table en ne chargeant que `columns`.
+
+    `filters` suit la syntaxe pyarrow, ex. [("event_date", ">", date)].
+    Sans fichier Parquet, repli sur le CSV (plus lent, filtres appliqués après lecture).
+    Les lots de `<table>.parts/` sont ajoutés à la suite de la table principale.
+    """
+    path = table_path(name, processed_dir)
+    parts = part_files(name, processed_dir)
+    if parts:
+        return _read_with_parts(name, path, parts, columns, filters, processed_dir)
+    if path.exists():
+        return pd.read_parquet(path, columns=columns, filters=filters)
+    return _read_csv(name, columns, filters, processed_dir)
+
+
+def _read_csv(name, columns, filters, processed_dir):
+    csv_path = table_path(name, processed_dir, suffix=".csv")
+    df = coerce(pd.read_csv(csv_path, usecols=columns), name)
+    for col, op, value in filters or []:
+        value = pd.Timestamp(value) if SCHEMAS[name].get(col) == "datetime" else value
+        mask = {
+            "=": df[col] == value, "==": df[col] == value,
+            ">": df[col] > value, ">=": df[col] >= value,
+            "<": df[col] < value, "<=": df[col] <= value,
+        }[op]
+        df = df[mask]
+    return df.reset_index(drop=True)
+
+
+def _read_with_parts(name, path, parts, columns, filters, processed_dir):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tables = []
+    if path.exists():
+        tables.append(pq.read_table(path, columns=columns, filters=filters))
+    elif table_path(name, processed_dir, suffix=".csv").exists():
+        tables.append(pa.Table.from_pandas(_read_csv(name, columns, filters, processed_dir), preserve_index=False))
+    tables += [pq.read_table(part, columns=columns, filters=filters) for part in parts]
+    # Schémas voisins (indices des catégories, colonnes absentes d'un lot) : unifiés
+    return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+
+def compact_table(name, processed_dir=PROCESSED_DIR):
+    """Réécrit table principale + lots en un seul fichier ; retourne le nombre de lots regroupés"""
+    parts = part_files(name, processed_dir)
+    if not parts:
+        return 0
+    write_table(read_table(name, processed_dir=processed_dir), name, processed_dir)
+    # Seuls les lots lus sont retirés : un lot arrivé entre-temps est conservé
+    for part in parts:
+        part.unlink(missing_ok=True)
+    return len(parts)
+
+
+def build_store(processed_dir=PROCESSED_DIR, tables=None):
+    """Convertit les CSV traités en Parquet typé ; retourne {table: (lignes, secondes)}"""
+    report = {}
+    for name in tables or SCHEMAS:
+        csv_path = table_path(name, processed_dir, suffix=".csv")
+        if not csv_path.exists():
+            continue
+        start = time.perf_counter()
+        df = pd.read_csv(csv_path)
+        write_table(df, name, processed_dir)
+        report[name] = (len(df), time.perf_counter() - start)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construit le store Parquet typé depuis les CSV traités")
+    parser.add_argument("--dir", default=str(PROCESSED_DIR), help="dossier des datasets traités")
+    parser.add_argument("tables", nargs="*", help="tables à convertir (défaut : toutes)")
+    parser.add_argument("--compact", action="store_true",
+                        help="regroupe les lots ajoutés dans la table principale au lieu de convertir les CSV")
+    args = parser.parse_args()
+
+    if args.compact:
+        for name in args.tables or SCHEMAS:
+            start = time.perf_counter()
+            merged = compact_table(name, args.dir)
+            if merged:
+                print(f"✅ {name}: {merged} lot(s) regroupé(s) en {time.perf_counter() - start:.2f}s")
+        return
+
+    for name, (rows, seconds) in build_store(args.dir, args.tables or None).items():
+        csv_size = table_path(name, args.dir, suffix=".csv").stat().st_size
+        pq_size = table_path(name, args.dir).stat().st_size
+        print(f"✅ {name}: {rows:,} lignes | {csv_size / 1e6:.2f} Mo CSV -> {pq_size / 1e6:.2f} Mo Parquet | {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
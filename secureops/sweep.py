@@ -0,0 +1,200 @@
+"""
+Balayage de configurations de l'Isolation Forest.
+
+Chaque configuration (nombre d'arbres, `max_samples`, `contamination`,
+sous-ensemble de features) est ajustée sur la fenêtre d'entraînement du
+réentraînement, puis évaluée sur les sessions tenues à l'écart contre les
+labels `attack_detected` (sessions à haut risque selon les règles SOC,
+comme dans le notebook) et `soc_alert`. Les coûts sont mesurés avec :
+temps d'ajustement, débit de scoring (forêt compilée) et taille du modèle.
+
+Les ajustements sont répartis sur tous les cœurs (un processus par cœur,
+données chargées une fois par processus). Le rapport désigne la
+configuration la moins coûteuse qui atteint l'objectif de détection.
+
+    python -m secureops.sweep --label attack_detected --metric recall --target 0.25
+"""
+import argparse
+import importlib
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from secureops.model_registry import DEFAULT_MODEL, ModelRegistry
+from secureops.retraining import HOLDOUT_FRACTION, WINDOW_SESSIONS, evaluate, fit_candidate, training_window
+from secureops.scoring import ScoringPipeline
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_PATH = ROOT / ".cache" / "sweep.csv"
+
+LABELS = ("attack_detected", "soc_alert")
+
+FEATURES = [
+    "packet_size", "login_attempts_count", "failed_logins_count",
+    "session_duration_seconds", "ip_reputation_score", "unusual_time_access",
+]
+FEATURE_SUBSETS = {
+    "toutes": FEATURES,
+    "sans_taille": [f for f in FEATURES if f != "packet_size"],
+    "connexions": ["login_attempts_count", "failed_logins_count", "ip_reputation_score", "unusual_time_access"],
+}
+
+GRID = {
+    "n_estimators": [50, 100, 200, 400],
+    "max_samples": [128, 256, 1024],
+    "contamination": [0.05, 0.10, 0.15, 0.20],
+    "features": list(FEATURE_SUBSETS),
+}
+
+# Débit mesuré sur un bloc de cette taille (tiré des sessions d'évaluation)
+THROUGHPUT_SESSIONS = 20_000
+
+# Coût à minimiser parmi les configurations qui atteignent l'objectif
+COSTS = {
+    "scoring": "us_per_session",
+    "size": "model_bytes",
+    "fit": "fit_seconds",
+}
+
+
+def configurations(grid=GRID):
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+# =====================================================================
+# TRAVAIL D'UN PROCESSUS
+# =====================================================================
+_data = {}
+
+
+def _init_worker(window, holdout):
+    # Imports sklearn faits ici : hors du temps d'ajustement de la première tâche
+    for module in ("sklearn.ensemble", "sklearn.preprocessing", "sklearn.metrics"):
+        importlib.import_module(module)
+
+    # Données lues une fois par processus, pas sérialisées à chaque tâche
+    train, test = training_window(FEATURES, window, holdout, labels=LABELS)
+    rng = np.random.default_rng(0)
+    _data.update(train=train, test=test, bench=test.iloc[rng.integers(0, len(test), THROUGHPUT_SESSIONS)])
+
+
+def run_config(config):
+    """Ajuste, évalue et mesure une configuration ; une ligne du rapport"""
+    train, test, bench = _data["train"], _data["test"], _data["bench"]
+    features = FEATURE_SUBSETS[config["features"]]
+    params = {k: config[k] for k in ("n_estimators", "max_samples", "contamination")}
+
+    started = time.perf_counter()
+    forest, scaler = fit_candidate(train, features, params, n_jobs=1)
+    fit_seconds = time.perf_counter() - started
+    pipeline = ScoringPipeline(forest, scaler, features)
+
+    started = time.perf_counter()
+    pipeline.decision_function(bench)
+    scoring_seconds = time.perf_counter() - started
+
+    row = {
+        **config,
+        "fit_seconds": fit_seconds,
+        "sessions_per_s": len(bench) / scoring_seconds,
+        "us_per_session": scoring_seconds / len(bench) * 1e6,
+        "model_bytes": sum(a.nbytes for a in (forest.feature, forest.threshold, forest.child,
+                                               forest.leaf_value, forest.roots)),
+        "nodes": int(forest.feature.size),
+    }
+    scores = pipeline.decision_function(test)
+    for label in LABELS:
+        for name, value in evaluate(pipeline, test, label=label, scores=scores).items():
+            row[f"{label}_{name}"] = value
+    return row
+
+
+# =====================================================================
+# BALAYAGE
+# =====================================================================
+def sweep(configs, window=WINDOW_SESSIONS, holdout=HOLDOUT_FRACTION, workers=None, on_result=None):
+    """Toutes les configurations, réparties sur `workers` processus (tous les cœurs par défaut)"""
+    workers = workers or os.cpu_count() or 1
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(window, holdout)) as pool:
+        futures = [pool.submit(run_config, config) for config in configs]
+        for future in as_completed(futures):
+            rows.append(future.result())
+            if on_result is not None:
+                on_result(len(rows), len(futures))
+    return pd.DataFrame(rows)
+
+
+def cheapest(results, label="attack_detected", metric="recall", target=0.0, cost="scoring"):
+    """Configurations qui atteignent l'objectif, de la moins coûteuse à la plus coûteuse"""
+    column = f"{label}_{metric}"
+    qualified = results[results[column] >= target]
+    return qualified.sort_values([COSTS[cost], column], ascending=[True, False], kind="stable")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Balayage des configurations Isolation Forest")
+    parser.add_argument("--label", choices=LABELS, default="attack_detected")
+    parser.add_argument("--metric", choices=["precision", "recall", "f1", "auc"], default="recall")
+    parser.add_argument("--target", type=float, default=0.0, help="Valeur minimale de la métrique")
+    parser.add_argument("--cost", choices=list(COSTS), default="scoring")
+    parser.add_argument("--window", type=int, default=WINDOW_SESSIONS)
+    parser.add_argument("--holdout", type=float, default=HOLDOUT_FRACTION)
+    parser.add_argument("--workers", type=int, default=None, help="Processus (défaut : tous les cœurs)")
+    parser.add_argument("--quick", action="store_true", help="Grille réduite (vérification rapide)")
+    parser.add_argument("--out", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--register", action="store_true",
+                        help="Enregistre la configuration retenue comme nouvelle version (sans l'activer)")
+    args = parser.parse_args(argv)
+
+    grid = GRID if not args.quick else {"n_estimators": [50, 200], "max_samples": [256],
+                                        "contamination": [0.15], "features": ["toutes", "connexions"]}
+    configs = configurations(grid)
+    print(f"🔬 {len(configs)} configurations sur {args.workers or os.cpu_count()} processus")
+
+    started = time.perf_counter()
+    results = sweep(configs, args.window, args.holdout, args.workers,
+                    on_result=lambda done, total: print(f"\r   {done}/{total}", end="", flush=True))
+    print(f"\r✅ Balayage terminé en {time.perf_counter() - started:.1f}s")
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    results.to_csv(args.out, index=False)
+
+    column = f"{args.label}_{args.metric}"
+    columns = ["n_estimators", "max_samples", "contamination", "features", column,
+               f"{args.label}_auc", "fit_seconds", "sessions_per_s", "model_bytes"]
+    ranked = cheapest(results, args.label, args.metric, args.target, args.cost)
+    with pd.option_context("display.width", 160, "display.max_columns", 20):
+        print(f"\n🏆 Meilleures configurations par {column} :")
+        print(results.sort_values(column, ascending=False)[columns].head(10).round(4).to_string(index=False))
+        if ranked.empty:
+            print(f"\n❌ Aucune configuration n'atteint {column} >= {args.target}")
+            return
+        print(f"\n💰 Moins coûteuses ({args.cost}) avec {column} >= {args.target} :")
+        print(ranked[columns].head(5).round(4).to_string(index=False))
+    print(f"\nRésultats complets : {args.out}")
+
+    if args.register:
+        best = ranked.iloc[0]
+        features = FEATURE_SUBSETS[best["features"]]
+        params = {"n_estimators": int(best["n_estimators"]), "max_samples": int(best["max_samples"]),
+                  "contamination": float(best["contamination"])}
+        train, _ = training_window(features, args.window, args.holdout)
+        forest, scaler = fit_candidate(train, features, params)
+        version = ModelRegistry().register(DEFAULT_MODEL, forest, scaler, features, meta={
+            "source": "sweep",
+            "params": {**params, "features": best["features"]},
+            "metrics": {k: float(best[k]) for k in results.columns if k.startswith(LABELS)},
+        })
+        print(f"📦 Enregistrée : {DEFAULT_MODEL}/{version} (activation : python -m secureops.model_registry "
+              f"activate {DEFAULT_MODEL} {version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Doublures partagées des tests de l'assistant : client Groq en mémoire et
+serveur SSE local au format de l'API Groq (chat.completions en streaming).
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+
+# =====================================================================
+# CLIENT GROQ EN MÉMOIRE
+# =====================================================================
+class FakeGroq:
+    """Client minimal : `chat.completions.create(stream=True)` rend `reply` mot par mot"""
+
+    def __init__(self, reply="Synthèse : 3 incidents critiques."):
+        self.reply = reply
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, stream=False, **params):
+        self.calls.append(params)
+        words = self.reply.split(" ")
+        pieces = [w if i == 0 else f" {w}" for i, w in enumerate(words)]
+        return iter([SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=p))])
+                     for p in pieces])
+
+
+# =====================================================================
+# SERVEUR SSE LOCAL
+# =====================================================================
+class SseServer:
+    """Serveur HTTP local : chaque fragment de `pieces` est envoyé après `delay_s`"""
+
+    def __init__(self, pieces, delay_s=0.0):
+        self.pieces = list(pieces)
+        self.delay_s = delay_s
+        self.requests = []
+        # Flux envoyé jusqu'au bout (le client ne s'est pas désabonné)
+        self.finished = threading.Event()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _event(self, payload):
+                data = f"data: {payload}\n\n".encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                server.requests.append(json.loads(self.rfile.read(length) or b"{}"))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for i, piece in enumerate(server.pieces):
+                        if i:
+                            time.sleep(server.delay_s)
+                        self._event(json.dumps({
+                            "id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0,
+                            "model": "test", "choices": [{"index": 0, "delta": {"content": piece},
+                                                          "finish_reason": None}],
+                        }))
+                    self._event("[DONE]")
+                    self.wfile.write(b"0\r\n\r\n")
+                    self.wfile.flush()
+                    server.finished.set()
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client parti avant la fin du flux
+                    pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def sse_server():
+    """Fabrique de serveurs SSE locaux, arrêtés en fin de test"""
+    servers = []
+
+    def start(pieces, delay_s=0.0):
+        server = SseServer(pieces, delay_s).__enter__()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.__exit__()
+
+
+@pytest.fixture
+def fake_groq():
+    return FakeGroq()
+
+
+@pytest.fixture
+def assistant(monkeypatch):
+    """Module ui.assistant sans store ni clé API : contexte SOC fixe, cache et file injectables"""
+    from ui import assistant
+
+    monkeypatch.setattr(assistant, "build_soc_context", lambda df: "🔐 CONTEXTE SOC - TEST")
+    monkeypatch.setattr(assistant, "init_response_cache", lambda: None)
+    monkeypatch.setattr(assistant, "init_llm_scheduler", lambda: None)
+    return assistant
@@ -0,0 +1,36 @@
+"""
+Moteur d'alertes en temps d'événement : les lectures d'état ne modifient pas les compteurs.
+"""
+import pandas as pd
+
+from secureops.alerts import DAY_S, AlertEngine, default_rules
+
+T0 = 1_700_000_000
+
+
+def anomalies(*stamps):
+    dates = pd.to_datetime(list(stamps), unit="s")
+    return pd.DataFrame({"anomaly": [1] * len(dates), "high_risk_session": [0] * len(dates), "event_date": dates})
+
+
+def test_snapshot_between_batches_keeps_the_window():
+    engine = AlertEngine(default_rules(anomalies=5, window_s=DAY_S))
+    engine.process_frame(anomalies(T0, T0 + 60, T0 + 120), ts_col="event_date")
+
+    assert engine.snapshot()["rules"]["anomalies"]["count"] == 3
+    assert engine.snapshot()["rules"]["anomalies"]["count"] == 3
+
+    fired = engine.process_frame(anomalies(T0 + 180, T0 + 240, T0 + 300), ts_col="event_date")
+    assert [a["rule"] for a in fired] == ["anomalies"]
+
+
+def test_snapshot_is_read_at_the_last_event():
+    engine = AlertEngine(default_rules(anomalies=5, window_s=DAY_S))
+    engine.process_frame(anomalies(T0, T0 + 1), ts_col="event_date")
+
+    state = engine.snapshot()
+    assert state["last_ts"] is not None and state["last_ts"] < T0 + DAY_S
+    assert state["rules"]["anomalies"]["count"] == 2
+    # Fenêtre lue plus tard sans modifier l'état : elle est vide, puis les compteurs sont intacts
+    assert engine.snapshot(ts=T0 + 3 * DAY_S)["rules"]["anomalies"]["count"] == 0
+    assert engine.snapshot()["rules"]["anomalies"]["count"] == 2
@@ -0,0 +1,92 @@
+"""
+Réponses de l'assistant en streaming, contre un serveur SSE local au format Groq.
+"""
+import time
+
+import pytest
+from groq import Groq
+
+from secureops.chat_history import ChatSession, ChatStore
+from secureops.llm_scheduler import LLMScheduler
+
+PIECES = ["🔴 Synthèse", " :", " 3", " incidents", " critiques", " en", " 24h", "."]
+DELAY_S = 0.15
+
+
+class Interrupted(Exception):
+    """Rerun Streamlit (bouton d'arrêt) pendant l'affichage du flux"""
+
+
+def consume(stream):
+    for _ in stream:
+        pass
+
+
+@pytest.fixture
+def server(sse_server):
+    return sse_server(PIECES, delay_s=DELAY_S)
+
+
+@pytest.fixture
+def scheduler(server, assistant, monkeypatch):
+    client = Groq(api_key="test", base_url=server.base_url, max_retries=0)
+    scheduler = LLMScheduler(client, max_concurrency=2, rate_per_minute=600)
+    monkeypatch.setattr(assistant, "init_llm_scheduler", lambda: scheduler)
+    return scheduler
+
+
+@pytest.fixture
+def chat(tmp_path):
+    return ChatSession(ChatStore(tmp_path / "history.sqlite"), "conv-test")
+
+
+def test_first_token_arrives_before_the_full_answer(assistant, scheduler, server, chat):
+    state = {}
+    stream = assistant.groq_soc_analysis_stream("Résumé ?", None)
+    response = assistant.stream_answer(chat, stream, consume, state)
+
+    latency = state["soc_last_latency"]
+    assert response == "".join(PIECES)
+    assert latency["complete"]
+    # Premier fragment servi dès son arrivée, sans attendre la fin du flux
+    assert latency["first_token"] < 2 * DELAY_S
+    assert latency["total"] >= DELAY_S * (len(PIECES) - 1)
+    assert server.requests[0]["stream"] is True
+
+
+def test_cancelled_stream_keeps_partial_text(assistant, scheduler, server, chat):
+    state = {}
+
+    def stop_after_two(stream):
+        for i, _ in enumerate(stream):
+            if i == 1:
+                raise Interrupted()
+
+    stream = assistant.groq_soc_analysis_stream("Résumé ?", None)
+    with pytest.raises(Interrupted):
+        assistant.stream_answer(chat, stream, stop_after_two, state)
+
+    _, role, message, _ = chat.recent(1)[0]
+    assert role == "assistant"
+    assert message == "".join(PIECES[:2]) + "\n\n⚠️ Réponse interrompue"
+    assert not state["soc_last_latency"]["complete"]
+
+    # Plus aucun lecteur : l'appel amont est abandonné avant la fin du flux
+    deadline = time.monotonic() + 5
+    while scheduler.metrics()["cancelled"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert scheduler.metrics()["cancelled"] == 1
+    assert not server.finished.is_set()
+
+
+def test_final_message_is_saved_to_history(assistant, scheduler, tmp_path, chat):
+    chat.add("user", "Résumé ?")
+    stream = assistant.groq_soc_analysis_stream("Résumé ?", None)
+    assistant.stream_answer(chat, stream, consume, {})
+
+    # Relu depuis le disque, comme après un rechargement de la page
+    reloaded = ChatSession(ChatStore(tmp_path / "history.sqlite"), "conv-test")
+    assert [(role, message) for _, role, message, _ in reloaded.recent()] == [
+        ("assistant", "".join(PIECES)),
+        ("user", "Résumé ?"),
+    ]
@@ -0,0 +1,131 @@
+"""
+Cache disque des réponses de l'assistant, derrière un client Groq en mémoire.
+"""
+import pytest
+
+from secureops import llm_cache
+from secureops.llm_cache import ResponseCache
+from secureops.llm_scheduler import LLMScheduler
+
+TTL_SECONDS = 60
+MAX_ENTRIES = 2
+
+
+class Clock:
+    """Horloge du cache, avancée à la main"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds=1.0):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_cache, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(tmp_path / "llm.sqlite", ttl_seconds=TTL_SECONDS, max_entries=MAX_ENTRIES)
+
+
+@pytest.fixture
+def assistant(assistant, fake_groq, cache, monkeypatch):
+    scheduler = LLMScheduler(fake_groq, rate_per_minute=6000, burst=100)
+    monkeypatch.setattr(assistant, "init_llm_scheduler", lambda: scheduler)
+    monkeypatch.setattr(assistant, "init_response_cache", lambda: cache)
+    return assistant
+
+
+def ask(assistant, question, conversation=""):
+    return "".join(assistant.groq_soc_analysis_stream(question, None, conversation))
+
+
+def test_miss_then_hit_does_not_call_the_client(assistant, fake_groq, cache):
+    first = ask(assistant, "Résumé de la situation ?")
+    second = ask(assistant, "  résumé de la  situation")
+
+    assert first == second == fake_groq.reply
+    assert len(fake_groq.calls) == 1
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["size_bytes"] > 0
+
+
+def test_data_context_is_part_of_the_key(assistant, fake_groq, monkeypatch):
+    ask(assistant, "Résumé ?")
+    monkeypatch.setattr(assistant, "build_soc_context", lambda df: "🔐 CONTEXTE SOC - AUTRE PÉRIODE")
+    ask(assistant, "Résumé ?")
+
+    assert len(fake_groq.calls) == 2
+
+
+def test_conversation_dependent_question_bypasses_the_cache(assistant, fake_groq, cache):
+    ask(assistant, "Résumé ?")
+    ask(assistant, "Résumé ?", conversation="💬 DERNIERS ÉCHANGES:\n- Analyste: et hier ?")
+
+    assert len(fake_groq.calls) == 2
+    assert "et hier" in fake_groq.calls[1]["messages"][1]["content"]
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 0, 1)
+
+
+def test_expired_entry_is_a_miss(assistant, fake_groq, cache, clock):
+    ask(assistant, "Résumé ?")
+    clock.advance(TTL_SECONDS - 1)
+    ask(assistant, "Résumé ?")
+    clock.advance(2)
+    ask(assistant, "Résumé ?")
+
+    assert len(fake_groq.calls) == 2
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 2)
+
+
+def test_least_recently_read_entry_is_evicted(assistant, fake_groq, cache, clock):
+    ask(assistant, "Question A")
+    clock.advance()
+    ask(assistant, "Question B")
+    clock.advance()
+    ask(assistant, "Question A")  # A relue : B devient la moins récente
+    clock.advance()
+    ask(assistant, "Question C")  # au-delà de MAX_ENTRIES : B sort
+    clock.advance()
+
+    assert cache.stats()["entries"] == MAX_ENTRIES
+    calls = len(fake_groq.calls)
+    ask(assistant, "Question A")
+    assert len(fake_groq.calls) == calls
+    ask(assistant, "Question B")
+    assert len(fake_groq.calls) == calls + 1
+
+
+def test_interrupted_answer_is_not_cached(assistant, fake_groq, cache):
+    create = fake_groq.chat.completions.create
+
+    def broken_stream(**params):
+        yield from create(**params)
+        raise RuntimeError("connexion coupée")
+
+    fake_groq.chat.completions.create = broken_stream
+    answer = ask(assistant, "Résumé ?")
+
+    assert "Flux interrompu" in answer
+    assert cache.stats()["entries"] == 0
+
+
+def test_clear_resets_entries_and_counters(assistant, cache):
+    ask(assistant, "Résumé ?")
+    ask(assistant, "Résumé ?")
+    cache.clear()
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (0, 0, 0)
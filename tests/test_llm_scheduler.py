@@ -0,0 +1,46 @@
+"""
+File partagée des appels LLM : abonnements des demandeurs fusionnés.
+"""
+import gc
+import time
+
+from groq import Groq
+
+from secureops.llm_scheduler import LLMScheduler
+
+PIECES = ["Un", " deux", " trois", " quatre", " cinq", " six"]
+DELAY_S = 0.2
+PARAMS = {"model": "test", "messages": [{"role": "user", "content": "Résumé ?"}]}
+
+
+def wait_for_cancel(scheduler, timeout_s=5):
+    deadline = time.monotonic() + timeout_s
+    while scheduler.metrics()["cancelled"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return scheduler.metrics()["cancelled"]
+
+
+def test_unread_follower_does_not_keep_the_call_alive(sse_server):
+    server = sse_server(PIECES, delay_s=DELAY_S)
+    scheduler = LLMScheduler(Groq(api_key="test", base_url=server.base_url, max_retries=0))
+
+    reader = scheduler.stream(**PARAMS)
+    scheduler.stream(**PARAMS)  # demandeur fusionné, jamais lu (rerun avant le premier fragment)
+    gc.collect()
+    assert scheduler.metrics()["coalesced"] == 1
+
+    assert next(reader) == PIECES[0]
+    reader.close()
+
+    assert wait_for_cancel(scheduler) == 1
+    assert not server.finished.is_set()
+
+
+def test_closing_an_unstarted_follower_releases_it(sse_server):
+    server = sse_server(PIECES, delay_s=DELAY_S)
+    scheduler = LLMScheduler(Groq(api_key="test", base_url=server.base_url, max_retries=0))
+
+    scheduler.stream(**PARAMS).close()
+
+    assert wait_for_cancel(scheduler) == 1
+    assert not server.finished.is_set()
@@ -0,0 +1,7 @@
+"""
+Pages de l'application Streamlit, chargées à la demande.
+
+Chaque module de page expose `render()`. `app.py` n'importe que la page
+affichée : plotly, Groq, reportlab et le modèle ML ne sont chargés qu'à la
+première visite de la page qui en a besoin.
+"""
@@ -0,0 +1,68 @@
+"""
+Alertes SOC : moteur partagé par toutes les sessions, réglé depuis ⚙️ Paramètres.
+
+Le moteur, la livraison et la surveillance du flux de sessions tournent
+dans leurs propres threads : l'interface ne fait que lire leur état.
+Le moteur (pandas / pyarrow) n'est importé et démarré qu'après le premier
+affichage ; le badge de la barre latérale ne lit que son historique.
+"""
+import os
+import threading
+
+_lock = threading.Lock()
+_monitor = None
+_starter = None
+
+
+def build_sinks(email=True, slack=True):
+    """Puits activés (configuration par variables d'environnement, stubs locaux par défaut)"""
+    from secureops.alerts import SmtpSink, WebhookSink
+
+    sinks = []
+    if email:
+        sinks.append(SmtpSink(
+            host=os.getenv("ALERT_SMTP_HOST", "localhost"),
+            port=int(os.getenv("ALERT_SMTP_PORT", 1025)),
+            sender=os.getenv("ALERT_EMAIL_FROM", "soc@secureops.local"),
+            recipients=os.getenv("ALERT_EMAIL_TO", "soc-team@secureops.local").split(",")
+        ))
+    if slack:
+        sinks.append(WebhookSink(os.getenv("ALERT_WEBHOOK_URL", "http://localhost:8765/slack")))
+    return sinks
+
+
+def load_alert_monitor():
+    """Moteur + livraison asynchrone + lecture des nouvelles sessions (un seul par processus)"""
+    global _monitor
+    with _lock:
+        if _monitor is None:
+            from secureops.alerts import AlertDispatcher, AlertEngine, SessionMonitor, default_rules
+
+            engine = AlertEngine(default_rules(), AlertDispatcher(build_sinks()))
+            _monitor = SessionMonitor(engine).start()
+        return _monitor
+
+
+def start_alert_monitor():
+    """Démarre le moteur dans un thread, hors du passage du script (sans effet s'il tourne déjà)"""
+    global _starter
+    with _lock:
+        if _monitor is not None or _starter is not None:
+            return
+        _starter = threading.Thread(target=load_alert_monitor, name="alert-monitor-start", daemon=True)
+        _starter.start()
+
+
+def recent_alerts(within_s=24 * 3600):
+    """
+    Alertes datées de moins de `within_s` secondes avant le dernier événement
+    vu par le moteur (temps des événements, plus récente en premier) ; [] si
+    le moteur n'est pas démarré.
+    """
+    monitor = _monitor
+    if monitor is None:
+        return []
+    state = monitor.engine.snapshot()
+    if state["last_ts"] is None:
+        return []
+    return [a for a in reversed(state["history"]) if state["last_ts"] - a["ts"] <= within_s]
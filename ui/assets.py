@@ -0,0 +1,235 @@
+"""
+Ressources statiques de l'interface : images et feuille de style.
+
+Étape de build (python -m ui.assets) : chaque image affichée par
+l'application (`DISPLAY_WIDTHS`) est redimensionnée à sa largeur d'affichage
+(x2 pour les écrans haute densité, sans agrandissement) et recompressée en
+WebP ; les autres fichiers de `assets/` sont ignorés. La feuille de style
+`assets/soc.css` est minifiée. Les fichiers produits dans `static/` portent
+l'empreinte de leur contenu (cache navigateur sans risque de version
+périmée) et sont listés dans `static/manifest.json`.
+
+À l'exécution, si le service statique de Streamlit est actif
+(`server.enableStaticServing`), les pages référencent ces fichiers par URL :
+le navigateur les télécharge une fois, au lieu de recevoir le CSS et les
+images à chaque rerun. Sans build ou sans service statique, retour aux
+fichiers d'origine. La feuille de style n'est injectée qu'une fois par
+session, dans le <head> de la page où elle reste d'un rerun à l'autre.
+"""
+import argparse
+import hashlib
+import json
+import re
+import shutil
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+
+import streamlit as st
+
+ROOT = Path(__file__).resolve().parent.parent
+ASSETS_DIR = ROOT / "assets"
+STATIC_DIR = ROOT / "static"
+MANIFEST_PATH = STATIC_DIR / "manifest.json"
+CSS_SOURCE = ASSETS_DIR / "soc.css"
+
+# Préfixe des URLs servies par Streamlit pour le dossier static/
+STATIC_URL = "app/static"
+
+# Feuille de style déjà injectée dans la page de la session
+CSS_STATE_KEY = "css_injected"
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".avif"}
+
+# Images affichées par l'application et leur largeur d'affichage (px) :
+# seules celles-ci ont une variante dans static/
+DISPLAY_WIDTHS = {
+    "logoSSN.png": 180,  # app.py, barre latérale
+    "7.jpg": 600,        # ui/home.py
+}
+PIXEL_DENSITY = 2
+WEBP_QUALITY = 80
+
+
+# =====================================================================
+# BUILD
+# =====================================================================
+def minify_css(css):
+    """Retire commentaires et espaces superflus"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def build_image(source, display_width):
+    """(octets WebP, largeur, hauteur) de la variante d'une image"""
+    from PIL import Image
+
+    with Image.open(source) as img:
+        img.load()
+        target = min(img.width, display_width * PIXEL_DENSITY)
+        if target < img.width:
+            img = img.resize((target, round(img.height * target / img.width)), Image.LANCZOS)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        buffer = BytesIO()
+        img.save(buffer, "WEBP", quality=WEBP_QUALITY, method=6)
+        return buffer.getvalue(), img.width, img.height
+
+
+def build(assets_dir=ASSETS_DIR, static_dir=STATIC_DIR):
+    """Produit les variantes dans `static_dir` ; retourne le manifeste"""
+    static_dir = Path(static_dir)
+    for sub in ("img", "css"):
+        shutil.rmtree(static_dir / sub, ignore_errors=True)
+        (static_dir / sub).mkdir(parents=True, exist_ok=True)
+
+    manifest = {"images": {}, "css": None}
+    for source in sorted(Path(assets_dir).iterdir()):
+        if source.suffix.lower() not in IMAGE_SUFFIXES or source.name not in DISPLAY_WIDTHS:
+            continue
+        try:
+            data, width, height = build_image(source, DISPLAY_WIDTHS[source.name])
+        except Exception as e:
+            print(f"⚠️ {source.name} ignorée : {e}")
+            continue
+        path = f"img/{source.stem}.w{width}.{_digest(data)}.webp"
+        (static_dir / path).write_bytes(data)
+        manifest["images"][source.name] = {
+            "path": path,
+            "width": width,
+            "height": height,
+            "bytes": len(data),
+            "source_bytes": source.stat().st_size,
+        }
+
+    css_source = Path(assets_dir) / CSS_SOURCE.name
+    if css_source.exists():
+        data = minify_css(css_source.read_text(encoding="utf-8")).encode("utf-8")
+        path = f"css/{css_source.stem}.{_digest(data)}.css"
+        (static_dir / path).write_bytes(data)
+        manifest["css"] = {"path": path, "bytes": len(data), "source_bytes": css_source.stat().st_size}
+
+    (static_dir / MANIFEST_PATH.name).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+# =====================================================================
+# EXÉCUTION
+# =====================================================================
+@st.cache_data
+def _read_manifest(mtime):
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    # Entrées dont le fichier a disparu : retour à l'original
+    manifest["images"] = {name: entry for name, entry in manifest.get("images", {}).items()
+                          if (STATIC_DIR / entry["path"]).exists()}
+    css = manifest.get("css")
+    if css and not (STATIC_DIR / css["path"]).exists():
+        manifest["css"] = None
+    return manifest
+
+
+def manifest():
+    """Manifeste du dernier build (relu si `static/manifest.json` change)"""
+    try:
+        return _read_manifest(MANIFEST_PATH.stat().st_mtime)
+    except:
+        return {"images": {}, "css": None}
+
+
+def static_serving():
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _inline_css():
+    return minify_css(CSS_SOURCE.read_text(encoding="utf-8"))
+
+
+def inject_css():
+    """
+    Feuille de style, une fois par session : lien vers le fichier statique
+    (mis en cache par le navigateur), sinon contenu inline.
+
+    Un élément Streamlit disparaît au rerun qui ne le redessine pas : la
+    feuille est donc ajoutée au <head> de la page par un script, et y reste.
+    """
+    if st.session_state.get(CSS_STATE_KEY):
+        return
+    entry = manifest()["css"]
+    if entry and static_serving():
+        tag, attrs, text = "link", {"rel": "stylesheet", "href": f"{STATIC_URL}/{entry['path']}"}, ""
+        node_id = f"soc-css-{Path(entry['path']).stem}"
+    else:
+        css = _inline_css()
+        tag, attrs, text = "style", {}, css
+        node_id = f"soc-css-{_digest(css.encode('utf-8'))}"
+    # "</" échappé : le contenu ne peut pas refermer la balise <script>
+    content = json.dumps(text).replace("</", "<\\/")
+    st.iframe(f"""<script>
+        const doc = window.parent.document;
+        if (!doc.getElementById({json.dumps(node_id)})) {{
+            doc.querySelectorAll("[id^='soc-css-']").forEach((old) => old.remove());
+            const node = doc.createElement({json.dumps(tag)});
+            node.id = {json.dumps(node_id)};
+            Object.entries({json.dumps(attrs)}).forEach(([k, v]) => node.setAttribute(k, v));
+            node.textContent = {content};
+            doc.head.appendChild(node);
+        }}
+    </script>""", height="content")
+    st.session_state[CSS_STATE_KEY] = True
+
+
+def image(name, **kwargs):
+    """
+    Image de assets/ : variante optimisée servie en statique si disponible.
+
+    Arguments de `st.image` (`width`, `use_container_width`) ; sans
+    variante, l'image d'origine est affichée par `st.image`.
+    """
+    entry = manifest()["images"].get(name)
+    if entry is None:
+        st.image(str(ASSETS_DIR / name), **kwargs)
+        return
+    if not static_serving():
+        st.image(str(STATIC_DIR / entry["path"]), **kwargs)
+        return
+
+    if kwargs.get("use_container_width"):
+        size = "width: 100%; height: auto;"
+    else:
+        size = f"width: {kwargs.get('width', entry['width'])}px; max-width: 100%; height: auto;"
+    st.markdown(
+        f'<img src="{STATIC_URL}/{entry["path"]}" width="{entry["width"]}" height="{entry["height"]}" '
+        f'style="{size} display: block;" alt="" loading="lazy">',
+        unsafe_allow_html=True
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build des images et du CSS servis en statique")
+    parser.add_argument("--assets-dir", type=Path, default=ASSETS_DIR)
+    parser.add_argument("--static-dir", type=Path, default=STATIC_DIR)
+    args = parser.parse_args(argv)
+
+    result = build(args.assets_dir, args.static_dir)
+    entries = list(result["images"].items())
+    if result["css"]:
+        entries.append((CSS_SOURCE.name, result["css"]))
+    for name, entry in entries:
+        print(f"{name:<16} {entry['source_bytes'] / 1024:>7.0f} Ko -> {entry['bytes'] / 1024:>6.0f} Ko  {entry['path']}")
+    total_in = sum(e["source_bytes"] for _, e in entries)
+    total_out = sum(e["bytes"] for _, e in entries)
+    print(f"Total : {total_in / 1024:.0f} Ko -> {total_out / 1024:.0f} Ko")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Assistant IA : analyse SOC conversationnelle via Groq (streaming).
+"""
+import os
+import time
+import uuid
+from datetime import datetime
+
+import streamlit as st
+from groq import Groq
+
+from secureops.chat_history import ChatSession, ChatStore
+from secureops.llm_cache import ResponseCache, normalize_question
+from secureops.llm_scheduler import LLMScheduler
+from secureops.soc_context import SocContextBuilder
+from ui.data import current_data
+
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+# =====================================================================
+# INITIALISATION GROQ (FIX ERREUR MODÈLE)
+# =====================================================================
+@st.cache_resource
+def init_groq_client():
+    if GROQ_API_KEY:
+        return Groq(api_key=GROQ_API_KEY)
+    return None
+
+
+# File partagée par toutes les sessions : plafond de concurrence, débit, retries
+@st.cache_resource
+def init_llm_scheduler():
+    client = init_groq_client()
+    if client is None:
+        return None
+    return LLMScheduler(
+        client,
+        max_concurrency=int(os.getenv("GROQ_MAX_CONCURRENCY", 4)),
+        rate_per_minute=int(os.getenv("GROQ_RATE_PER_MINUTE", 30))
+    )
+
+
+# Cache disque des réponses : même question + mêmes données = pas de nouvel appel
+@st.cache_resource
+def init_response_cache():
+    try:
+        return ResponseCache()
+    except:
+        return None
+
+
+# Historique des conversations sur disque (la session ne garde que les derniers échanges)
+@st.cache_resource
+def init_chat_store():
+    try:
+        return ChatStore()
+    except:
+        return None
+
+# =====================================================================
+# FONCTION ANALYSE GROQ (FIX MODÈLE)
+# =====================================================================
+GROQ_MODEL = "llama-3.3-70b-versatile"  # Modèle valide et performant
+
+SOC_SYSTEM_PROMPT = """Tu es un analyste SOC senior expert chez SecureOps (SSN - Système Security Network).
+
+🎯 MISSION:
+• Analyser les incidents de sécurité avec précision professionnelle
+• Identifier les menaces critiques et patterns d'attaque
+• Proposer des actions concrètes, priorisées et mesurables
+• Communiquer de manière claire, structurée et actionnable
+
+💼 STYLE PROFESSIONNEL:
+• Ton direct, expert mais accessible
+• Réponses structurées avec sections claires
+• Utilise des emojis pertinents pour la lisibilité (🔴 🟠 🟢 ⚠️ 🎯 📊 💡)
+• Priorise toujours les informations critiques
+• Propose des actions avec timeline et responsabilités
+• Quantifie les risques et impacts
+
+✅ FORMAT RECOMMANDÉ:
+1. Synthèse executive (2-3 lignes)
+2. Analyse détaillée
+3. Recommandations prioritaires
+4. Actions immédiates si nécessaire"""
+
+
+@st.cache_resource
+def init_context_builder():
+    """Agrégats SOC glissants partagés, rendus sous un budget de tokens"""
+    return SocContextBuilder(token_budget=int(os.getenv("SOC_CONTEXT_TOKENS", 600)))
+
+
+def build_soc_context(df_context):
+    """Contexte SOC envoyé au LLM : KPI des 14 derniers jours, brèches, risques sessions"""
+    builder = init_context_builder()
+    builder.update_kpis(df_context)
+    try:
+        builder.refresh_sources()
+    except:
+        pass
+    return builder.render()
+
+
+def groq_soc_analysis_stream(question, df_context, conversation=""):
+    """
+    Analyse SOC via Groq AI, fragment par fragment (streaming).
+
+    `conversation` : résumé des échanges précédents (contexte borné).
+    Sans conversation, la réponse complète est mise en cache en fin de
+    flux ; une question posée dans le fil d'une conversation en dépend et
+    n'est ni lue ni écrite dans le cache. Une réponse interrompue (arrêt,
+    erreur réseau) n'est jamais mise en cache.
+    """
+    llm_scheduler = init_llm_scheduler()
+    response_cache = init_response_cache()
+    if not llm_scheduler:
+        yield "❌ Service Groq non disponible. Vérifiez votre clé API."
+        return
+    
+    data_context = build_soc_context(df_context)
+    context = f"{data_context}\n\n{conversation}" if conversation else data_context
+    # Clé : prompt système + données SOC (le résumé de conversation n'y entre pas)
+    cache_context = f"{SOC_SYSTEM_PROMPT}\n{data_context}"
+    if conversation:
+        response_cache = None
+    
+    if response_cache is not None:
+        cached = response_cache.get(GROQ_MODEL, question, cache_context)
+        if cached is not None:
+            yield cached
+            return
+    
+    # Utilisation du bon modèle Llama 3.3, via la file partagée
+    stream = llm_scheduler.stream(
+        model=GROQ_MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": SOC_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": f"{context}\n\n❓ QUESTION SOC:\n{question}"
+            }
+        ],
+        temperature=0.3,
+        max_tokens=1200,
+        top_p=0.9
+    )
+    
+    parts = []
+    complete = False
+    try:
+        for delta in stream:
+            parts.append(delta)
+            yield delta
+        complete = True
+    except Exception as e:
+        if parts:
+            yield f"\n\n❌ Flux interrompu: {str(e)}"
+        else:
+            yield f"❌ Erreur lors de l'analyse: {str(e)}\n\n💡 Vérifiez que le modèle Groq est accessible et que votre clé API est valide."
+    finally:
+        # Arrêt demandé pendant le flux : désabonnement (l'appel amont s'arrête
+        # si plus personne ne lit la réponse)
+        stream.close()
+    
+    if complete and parts and response_cache is not None:
+        response_cache.put(GROQ_MODEL, question, cache_context, "".join(parts))
+
+
+def stream_answer(chat, stream, write, state):
+    """
+    Diffuse `stream` avec `write` (st.write_stream) et enregistre la réponse dans `chat`.
+
+    Interruption (arrêt, rerun, erreur) : la réponse partielle est conservée,
+    marquée comme interrompue. Les latences sont écrites dans
+    `state["soc_last_latency"]` dans tous les cas.
+    """
+    parts = []
+    latency = {"start": time.perf_counter(), "first_token": None}
+
+    def collect():
+        for piece in stream:
+            if latency["first_token"] is None:
+                latency["first_token"] = time.perf_counter() - latency["start"]
+            parts.append(piece)
+            yield piece
+
+    complete = False
+    try:
+        write(collect())
+        complete = True
+    finally:
+        # Désabonnement : l'appel amont s'arrête si plus personne ne lit la réponse
+        stream.close()
+        response = "".join(parts)
+        if not complete:
+            response = (response + "\n\n" if response else "") + "⚠️ Réponse interrompue"
+        if chat is not None:
+            chat.add("assistant", response)
+        state["soc_last_latency"] = {
+            "first_token": latency["first_token"],
+            "total": time.perf_counter() - latency["start"],
+            "complete": complete
+        }
+    return response
+
+
+# Questions rapides : autonomes, elles ne dépendent pas de la conversation
+QUICK_QUESTIONS = {
+    "📊 Résumé situation": "Donne-moi un résumé exécutif de la situation sécurité avec métriques et tendances clés.",
+    "🚨 Incidents critiques": "Analyse les incidents critiques récents. Quels patterns détectes-tu?",
+    "💡 Recommandations": "Quelles sont tes 3 recommandations prioritaires pour améliorer la posture de sécurité?",
+}
+
+
+def is_quick_question(question):
+    return normalize_question(question) in {normalize_question(q) for q in QUICK_QUESTIONS.values()}
+
+
+@st.cache_data(max_entries=200)
+def render_chat_turn(role, message, created_at):
+    """Bulle HTML d'un échange (rendue une fois par échange)"""
+    timestamp = datetime.fromtimestamp(created_at)
+    if role == "user":
+        return f"""
+                <div class="chat-message chat-user">
+                    <strong>👤 Analyste SOC</strong> • {timestamp.strftime('%H:%M:%S')}<br><br>
+                    {message}
+                </div>
+                """
+    return f"""
+                <div class="chat-message chat-assistant">
+                    <strong>🤖 Assistant IA</strong> • {timestamp.strftime('%H:%M:%S')}<br><br>
+                    {message}
+                </div>
+                """
+
+
+# =====================================================================
+# PAGE: ASSISTANT IA
+# =====================================================================
+def render():
+    groq_client = init_groq_client()
+    llm_scheduler = init_llm_scheduler()
+    response_cache = init_response_cache()
+    chat_store = init_chat_store()
+    
+    st.markdown("""
+    <div class="soc-header">
+        <h1>💬 Assistant SOC IA</h1>
+        <p>Analyse intelligente propulsée par Groq AI (Llama 3.3)</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if not groq_client:
+        st.markdown("""
+        <div class="alert-critical">
+            ❌ <strong>Service Groq non disponible</strong><br>
+            Vérifiez votre clé API dans le fichier .env
+        </div>
+        """, unsafe_allow_html=True)
+        st.stop()
+    
+    df = current_data()
+    
+    # Conversation reprise après rechargement de la page via ?conv=<id>
+    if "soc_chat" not in st.session_state:
+        conversation_id = st.query_params.get("conv") or uuid.uuid4().hex
+        st.query_params["conv"] = conversation_id
+        if chat_store is not None:
+            st.session_state.soc_chat = ChatSession(chat_store, conversation_id)
+        else:
+            st.session_state.soc_chat = None
+    chat = st.session_state.soc_chat
+    
+    # Questions rapides
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    st.markdown("### 🎯 Questions Rapides")
+    
+    for col, (label, question) in zip(st.columns(3), QUICK_QUESTIONS.items()):
+        with col:
+            if st.button(label, use_container_width=True):
+                st.session_state.quick_q = question
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Formulaire chat
+    st.markdown('<div class="section-container">', unsafe_allow_html=True)
+    
+    with st.form("chat_form", clear_on_submit=True):
+        user_input = st.text_area(
+            "💬 Votre question SOC",
+            placeholder="Ex: Pourquoi les anomalies ont augmenté cette semaine?",
+            height=120,
+            value=st.session_state.get('quick_q', '')
+        )
+        
+        col1, col2, col3 = st.columns([1, 1, 1])
+        with col2:
+            submit = st.form_submit_button("🚀 ANALYSER", use_container_width=True)
+    
+    if 'quick_q' in st.session_state:
+        del st.session_state.quick_q
+    
+    if submit and user_input:
+        # Contexte de conversation calculé avant d'ajouter la nouvelle question ;
+        # question rapide : autonome, posée sur les seules données (réponse en cache)
+        conversation = chat.prompt_context() if chat is not None and not is_quick_question(user_input) else ""
+        if chat is not None:
+            chat.add("user", user_input)
+        
+        # Tout clic pendant la génération relance le script et interrompt le flux
+        st.button("⏹️ Arrêter la génération")
+        st.markdown("**🤖 Assistant IA** • analyse en cours...")
+        
+        stream = groq_soc_analysis_stream(user_input, df, conversation)
+        stream_answer(chat, stream, st.write_stream, st.session_state)
+        st.rerun()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Cache des réponses IA
+    if response_cache is not None:
+        with st.expander("⚡ Cache des réponses IA"):
+            cache_stats = response_cache.stats()
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Réponses en cache", cache_stats["entries"])
+            col2.metric("Hits", cache_stats["hits"])
+            col3.metric("Misses", cache_stats["misses"])
+            col4.metric("Taux de hit", f"{cache_stats['hit_rate']:.0%}")
+            st.caption(
+                f"Durée de vie : {response_cache.ttl_seconds // 3600}h • "
+                f"Capacité : {response_cache.max_entries} réponses • "
+                f"Taille : {cache_stats['size_bytes'] / 1024:.0f} Ko"
+            )
+            if st.button("🧹 Vider le cache"):
+                response_cache.clear()
+                st.rerun()
+    
+    # File d'appels LLM partagée
+    if llm_scheduler is not None:
+        with st.expander("📡 File d'appels LLM"):
+            queue_stats = llm_scheduler.metrics()
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("En file", queue_stats["queue_depth"])
+            col2.metric("En cours", f"{queue_stats['running']}/{queue_stats['max_concurrency']}")
+            col3.metric("Attente moy.", f"{queue_stats['avg_wait_s']:.2f}s")
+            col4.metric("Attente p95", f"{queue_stats['p95_wait_s']:.2f}s")
+            st.caption(
+                f"Appels : {queue_stats['submitted']} • Fusionnés : {queue_stats['coalesced']} • "
+                f"Nouvelles tentatives : {queue_stats['retries']} • Échecs : {queue_stats['failed']} • "
+                f"Interrompus : {queue_stats['cancelled']}"
+            )
+    
+    # Historique
+    if chat is not None and chat.buffer:
+        st.markdown("---")
+        st.markdown("### 💬 Historique de Conversation")
+        
+        last_latency = st.session_state.get("soc_last_latency")
+        if last_latency and last_latency["first_token"] is not None:
+            st.caption(
+                f"⚡ Dernière réponse : premier fragment en {last_latency['first_token']:.2f}s, "
+                f"complète en {last_latency['total']:.2f}s"
+                + ("" if last_latency["complete"] else " (interrompue)")
+            )
+        
+        for _, role, message, created_at in chat.recent():
+            st.markdown(render_chat_turn(role, message, created_at), unsafe_allow_html=True)
+        
+        # Échanges sortis du tampon : lus sur disque, page par page
+        total_turns = len(chat)
+        if total_turns > len(chat.buffer):
+            if st.toggle(f"📜 Afficher les échanges plus anciens ({total_turns - len(chat.buffer)})"):
+                n_pages = (total_turns - 1) // chat.buffer.maxlen
+                page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+                for _, role, message, created_at in chat_store.page(chat.conversation, page, chat.buffer.maxlen):
+                    st.markdown(render_chat_turn(role, message, created_at), unsafe_allow_html=True)
+        
+        if st.button("🗑️ Effacer l'historique"):
+            chat.clear()
+            st.session_state.pop("soc_last_latency", None)
+            st.rerun()
@@ -0,0 +1,492 @@
+"""
+Tableau de bord SOC : KPI de la période, tendances, statistiques, exports.
+"""
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from secureops.figure_cache import FigureCache
+from secureops.rollups import GRAIN_LABELS, period_end, rollup_range
+from ui.data import load_kpi_index, load_live_table, load_rollups, refresh_data
+
+# =====================================================================
+# RAPPORT PDF (ARRIÈRE-PLAN)
+# =====================================================================
+@st.cache_resource
+def load_report_worker():
+    """Génération des rapports PDF hors du thread de la page (graphiques en cache)"""
+    # reportlab n'est chargé qu'à la première demande de rapport
+    from secureops.reporting import ReportWorker
+    return ReportWorker()
+
+
+def pdf_report_panel(report_key, report_args):
+    """Bouton de génération, attente puis téléchargement du rapport PDF de la période"""
+    job = st.session_state.get("pdf_job")
+    if job is not None and job["key"] != report_key:
+        job = None  # période modifiée : le rapport précédent ne correspond plus
+    
+    if job is None:
+        if st.button("📑 Générer le rapport PDF", use_container_width=True):
+            future = load_report_worker().submit(report_key, *report_args)
+            st.session_state.pdf_job = {"key": report_key, "future": future}
+            st.rerun()
+        return
+    
+    future = job["future"]
+    if not future.done():
+        # Le fragment se relance seul jusqu'à la fin de la génération
+        st.fragment(_pdf_report_progress, run_every=0.5)(future)
+        return
+    
+    try:
+        report = future.result()
+    except Exception as e:
+        st.error(f"❌ Échec de la génération du rapport: {str(e)}")
+        del st.session_state.pdf_job
+        return
+    
+    from secureops.reporting import REPORT_TIME_BUDGET_S
+    
+    start, end = report_args[0], report_args[1]
+    st.download_button(
+        "📑 Télécharger le rapport PDF",
+        report["pdf"],
+        file_name=f"soc_report_{start:%Y%m%d}_{end:%Y%m%d}.pdf",
+        mime="application/pdf",
+        use_container_width=True
+    )
+    charts_info = "en cache" if report["charts_cached"] else f"{report['charts_seconds']:.2f}s"
+    st.caption(
+        f"Généré en {report['seconds']:.2f}s (graphiques {charts_info}) • "
+        f"{report['size_bytes'] / 1024:.0f} Ko"
+    )
+    if report["seconds"] > REPORT_TIME_BUDGET_S:
+        st.warning(f"⚠️ Génération au-delà du budget de {REPORT_TIME_BUDGET_S:.0f}s")
+
+
+def _pdf_report_progress(future):
+    if future.done():
+        st.rerun()
+    st.info("⏳ Génération du rapport PDF en cours...")
+
+
+# =====================================================================
+# FIGURES (MISES EN CACHE)
+# =====================================================================
+TREND_METRICS = ["anomalies_detected", "critical_incidents", "total_tickets"]
+MULTI_METRICS = ["critical_incidents", "avg_incident_duration_days", "total_tickets", "avg_ip_reputation"]
+
+
+@st.cache_resource
+def load_figure_cache():
+    """Figures sérialisées partagées entre sessions, bornées en taille"""
+    return FigureCache(max_bytes=int(os.getenv("FIGURE_CACHE_MB", 16)) * 1024 * 1024)
+
+
+def trend_figure(trend_df, trend_grain):
+    return px.line(
+        trend_df,
+        x="date",
+        y=TREND_METRICS,
+        labels={"value": "Volume", "date": "Date"},
+        title=f"Anomalies, incidents critiques & tickets IT (par {GRAIN_LABELS[trend_grain]})",
+        markers=True
+    )
+
+
+def anomalies_figure(chart_df):
+    fig_anomalies = go.Figure()
+    fig_anomalies.add_trace(go.Scatter(
+        x=chart_df["date"],
+        y=chart_df["anomalies_detected"],
+        mode='lines+markers',
+        name='Anomalies',
+        line=dict(color='#DC3545', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(220, 53, 69, 0.1)'
+    ))
+    fig_anomalies.update_layout(
+        height=350,
+        margin=dict(l=20, r=20, t=40, b=20),
+        hovermode='x unified',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_anomalies
+
+
+def risk_figure(chart_df):
+    fig_risk = go.Figure()
+    fig_risk.add_trace(go.Bar(
+        x=chart_df["date"],
+        y=chart_df["high_risk_sessions"],
+        name='Haut Risque',
+        marker_color='#FFC107'
+    ))
+    fig_risk.update_layout(
+        height=350,
+        margin=dict(l=20, r=20, t=40, b=20),
+        hovermode='x unified',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_risk
+
+
+def multi_figure(chart_df):
+    fig_multi = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Incidents Critiques', 'MTTR Évolution', 
+                       'Tickets IT', 'Réputation IP'),
+        vertical_spacing=0.12,
+        horizontal_spacing=0.1
+    )
+    
+    # Incidents critiques
+    fig_multi.add_trace(
+        go.Scatter(x=chart_df["date"], y=chart_df["critical_incidents"],
+                  mode='lines', name='Incidents', line=dict(color='#DC3545', width=2)),
+        row=1, col=1
+    )
+    
+    # MTTR
+    fig_multi.add_trace(
+        go.Scatter(x=chart_df["date"], y=chart_df["avg_incident_duration_days"],
+                  mode='lines+markers', name='MTTR', line=dict(color='#0B5ED7', width=2)),
+        row=1, col=2
+    )
+    
+    # Tickets
+    fig_multi.add_trace(
+        go.Bar(x=chart_df["date"], y=chart_df["total_tickets"],
+              name='Tickets', marker_color='#28A745'),
+        row=2, col=1
+    )
+    
+    # Réputation IP
+    fig_multi.add_trace(
+        go.Scatter(x=chart_df["date"], y=chart_df["avg_ip_reputation"],
+                  mode='lines', name='Réputation', line=dict(color='#17A2B8', width=2),
+                  fill='tozeroy'),
+        row=2, col=2
+    )
+    
+    fig_multi.update_layout(
+        height=600,
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_multi
+
+
+def gauge_figure(critical_rate):
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=critical_rate,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Taux d'Incidents Critiques (%)"},
+        delta={'reference': 15},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "#0B5ED7"},
+            'steps': [
+                {'range': [0, 25], 'color': "#28A745"},
+                {'range': [25, 50], 'color': "#FFC107"},
+                {'range': [50, 100], 'color': "#DC3545"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 50
+            }
+        }
+    ))
+    fig_gauge.update_layout(height=300, margin=dict(l=20, r=20, t=60, b=20))
+    return fig_gauge
+
+
+# =====================================================================
+# PANNEAU KPI & GRAPHIQUES (MODE LIVE)
+# =====================================================================
+DEFAULT_REFRESH_S = 60
+
+
+def _live_status(live, new_rows):
+    if not live:
+        return
+    table = load_live_table()
+    latest = table.watermark
+    status = f"🔴 Live • rafraîchi toutes les {st.session_state.get('refresh_interval_s', DEFAULT_REFRESH_S)}s"
+    if latest is not None:
+        status += f" • dernière donnée : {latest:%d/%m/%Y}"
+    if new_rows:
+        status += f" • {new_rows} nouvelle(s) ligne(s)"
+    if table.last_poll:
+        status += f" • vérifié à {datetime.fromtimestamp(table.last_poll):%H:%M:%S}"
+    st.caption(status)
+
+
+def dashboard_panel(start_date, end_date, live=False, follow_latest=False):
+    """
+    KPI, graphiques et statistiques de la période.
+
+    Exécuté en fragment : en mode live (ou via « Actualiser »), seul ce
+    bloc est relancé ; il ne lit dans le store que les lignes arrivées
+    depuis le dernier rafraîchissement.
+    """
+    col_status, col_refresh = st.columns([4, 1])
+    with col_refresh:
+        refresh = st.button("🔄 Actualiser", use_container_width=True)
+    new_rows = refresh_data() if live or refresh else 0
+    with col_status:
+        _live_status(live, new_rows)
+    
+    kpi_index = load_kpi_index()
+    df = kpi_index.frame
+    if live and follow_latest:
+        end_date = max(pd.Timestamp(end_date), df["date"].max()).date()
+    
+    # Filtrage des données : tranche [lo, hi) trouvée par recherche dichotomique
+    lo, hi = kpi_index.bounds(start_date, end_date)
+    df_filtered = df.iloc[lo:hi]
+    
+    if df_filtered.empty:
+        st.error("❌ Aucune donnée disponible pour cette période")
+        st.stop()
+    
+    # KPIs principaux
+    st.markdown("### 📈 Indicateurs Clés de Performance")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    total_anomalies = int(kpi_index.sum("anomalies_detected", lo, hi))
+    total_high_risk = int(kpi_index.sum("high_risk_sessions", lo, hi))
+    total_critical = int(kpi_index.sum("critical_incidents", lo, hi))
+    avg_mttr = kpi_index.mean("avg_incident_duration_days", lo, hi)
+    total_tickets = int(kpi_index.sum("total_tickets", lo, hi))
+    
+    col1.metric("🚨 Anomalies", f"{total_anomalies:,}", f"+{np.random.randint(5, 20)}%")
+    col2.metric("⚠️ Haut Risque", f"{total_high_risk:,}", f"-{np.random.randint(2, 15)}%")
+    col3.metric("🔴 Critiques", f"{total_critical:,}", f"+{np.random.randint(1, 10)}%")
+    col4.metric("⏱️ MTTR", f"{avg_mttr:.1f}j", f"-{np.random.randint(5, 15)}%")
+    col5.metric("🎫 Tickets", f"{total_tickets:,}", f"+{np.random.randint(10, 25)}%")
+    
+    st.markdown("---")
+        # EVOLUTION TEMPORELLE
+    # =============================
+    st.markdown('<div class="section-title">Évolution temporelle SOC</div>', unsafe_allow_html=True)
+
+    # Historique complet : granularité adaptée à sa durée
+    rollups = load_rollups()
+    figures = load_figure_cache()
+    # Nouvelle version live : seules les figures couvrant les jours modifiés sont retirées
+    figures.advance(kpi_index.version, kpi_index.parent_version, kpi_index.changed_from)
+    trend_df, trend_grain = rollup_range(rollups, df["date"].min(), df["date"].max())
+
+    fig_trend = figures.get_or_build(
+        ("trend", tuple(TREND_METRICS), trend_grain),
+        lambda: trend_figure(trend_df, trend_grain),
+        kpi_index.version
+    )
+    st.plotly_chart(fig_trend, use_container_width=True)
+
+    # =============================
+    
+    # Points des graphiques de la période : agrégats à la granularité adaptée
+    chart_df, chart_grain = rollup_range(rollups, start_date, end_date)
+    period_key = (str(start_date), str(end_date), chart_grain)
+    # Dernier jour agrégé dans les graphiques (période entamée comprise)
+    chart_end = period_end(end_date, chart_grain)
+    if chart_grain != "day":
+        st.caption(f"📆 Graphiques agrégés par {GRAIN_LABELS[chart_grain]} sur la période sélectionnée")
+    
+    # Graphiques principaux
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📉 Évolution des Anomalies")
+        fig_anomalies = figures.get_or_build(
+            ("anomalies", ("anomalies_detected",)) + period_key,
+            lambda: anomalies_figure(chart_df),
+            kpi_index.version,
+            period_end=chart_end
+        )
+        st.plotly_chart(fig_anomalies, use_container_width=True)
+    
+    with col2:
+        st.markdown("### 🎯 Sessions à Haut Risque")
+        fig_risk = figures.get_or_build(
+            ("risk", ("high_risk_sessions",)) + period_key,
+            lambda: risk_figure(chart_df),
+            kpi_index.version,
+            period_end=chart_end
+        )
+        st.plotly_chart(fig_risk, use_container_width=True)
+    
+    st.markdown("---")
+
+    # =============================
+
+    
+    # Tableau de bord multi-métriques
+    st.markdown("### 🔄 Vue Multi-Métriques")
+    
+    fig_multi = figures.get_or_build(
+        ("multi", tuple(MULTI_METRICS)) + period_key,
+        lambda: multi_figure(chart_df),
+        kpi_index.version,
+        period_end=chart_end
+    )
+    
+    st.plotly_chart(fig_multi, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Statistiques avancées
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📊 Statistiques Détaillées")
+        stats_df = pd.DataFrame({
+            'Métrique': ['Anomalies', 'Haut Risque', 'Incidents', 'MTTR (jours)', 'Tickets'],
+            'Minimum': [
+                kpi_index.min('anomalies_detected', lo, hi),
+                kpi_index.min('high_risk_sessions', lo, hi),
+                kpi_index.min('critical_incidents', lo, hi),
+                f"{kpi_index.min('avg_incident_duration_days', lo, hi):.2f}",
+                kpi_index.min('total_tickets', lo, hi)
+            ],
+            'Maximum': [
+                kpi_index.max('anomalies_detected', lo, hi),
+                kpi_index.max('high_risk_sessions', lo, hi),
+                kpi_index.max('critical_incidents', lo, hi),
+                f"{kpi_index.max('avg_incident_duration_days', lo, hi):.2f}",
+                kpi_index.max('total_tickets', lo, hi)
+            ],
+            'Moyenne': [
+                f"{kpi_index.mean('anomalies_detected', lo, hi):.1f}",
+                f"{kpi_index.mean('high_risk_sessions', lo, hi):.1f}",
+                f"{kpi_index.mean('critical_incidents', lo, hi):.1f}",
+                f"{kpi_index.mean('avg_incident_duration_days', lo, hi):.2f}",
+                f"{kpi_index.mean('total_tickets', lo, hi):.1f}"
+            ]
+        })
+        st.dataframe(stats_df, use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("### 🎯 Niveau de Criticité")
+        period_incidents = kpi_index.sum('total_incidents', lo, hi)
+        critical_rate = (kpi_index.sum('critical_incidents', lo, hi) / 
+                        period_incidents * 100 
+                        if period_incidents > 0 else 0)
+        
+        fig_gauge = figures.get_or_build(
+            ("gauge", ("critical_incidents", "total_incidents"), str(start_date), str(end_date)),
+            lambda: gauge_figure(critical_rate),
+            kpi_index.version,
+            period_end=pd.Timestamp(end_date)
+        )
+        st.plotly_chart(fig_gauge, use_container_width=True)
+    
+    # Période affichée, pour les exports (calculés lors des exécutions complètes)
+    return {
+        "start": pd.Timestamp(start_date),
+        "end": pd.Timestamp(end_date),
+        "version": kpi_index.version,
+        "rows": df_filtered,
+        "chart_df": chart_df,
+        "grain": chart_grain,
+        "stats": stats_df,
+        "kpis": [
+            ("Anomalies détectées", f"{total_anomalies:,}"),
+            ("Sessions à haut risque", f"{total_high_risk:,}"),
+            ("Incidents critiques", f"{total_critical:,}"),
+            ("Taux d'incidents critiques", f"{critical_rate:.1f}%"),
+            ("MTTR moyen", f"{avg_mttr:.1f} j"),
+            ("Tickets IT", f"{total_tickets:,}"),
+        ]
+    }
+
+
+# =====================================================================
+# PAGE: TABLEAU DE BORD SOC
+# =====================================================================
+def render():
+    st.markdown("""
+    <div class="soc-header">
+        <h1>📊 Dashboard SOC</h1>
+        <p>Vue consolidée de la posture de sécurité</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    kpi_index = load_kpi_index()
+    df = kpi_index.frame
+    live_interval = st.session_state.get("refresh_interval_s", DEFAULT_REFRESH_S)
+    
+    # Filtres temporels
+    col1, col2, col3 = st.columns([2, 2, 1])
+    
+    with col1:
+        start_date = st.date_input(
+            "📅 Date début",
+            value=df["date"].min(),
+            min_value=df["date"].min(),
+            max_value=df["date"].max()
+        )
+    
+    with col2:
+        end_date = st.date_input(
+            "📅 Date fin",
+            value=df["date"].max(),
+            min_value=df["date"].min(),
+            max_value=df["date"].max()
+        )
+    
+    with col3:
+        live = st.toggle(
+            "🔴 Mode live",
+            value=st.session_state.get("dashboard_live", False),
+            help=f"KPI et graphiques rafraîchis toutes les {live_interval}s (⚙️ Paramètres)"
+        )
+        st.session_state.dashboard_live = live
+    
+    # Période laissée sur la dernière date : en live, elle suit les nouvelles données
+    follow_latest = pd.Timestamp(end_date) >= df["date"].max().normalize()
+    
+    # KPI + graphiques : seul ce bloc est relancé en mode live
+    panel = st.fragment(dashboard_panel, run_every=live_interval if live else None)
+    period = panel(start_date, end_date, live, follow_latest)
+    
+    # Export
+    st.markdown("---")
+    st.markdown("### 📥 Export & Reporting")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        csv_data = period["rows"].to_csv(index=False)
+        st.download_button(
+            "📄 Export CSV",
+            csv_data,
+            file_name=f"soc_report_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    
+    with col2:
+        report_key = (period["version"], str(period["start"]), str(period["end"]), period["grain"])
+        stats_df = period["stats"]
+        report_stats = [list(stats_df.columns)] + stats_df.astype(str).values.tolist()
+        pdf_report_panel(
+            report_key,
+            (period["start"], period["end"], period["kpis"], report_stats,
+             period["chart_df"], GRAIN_LABELS[period["grain"]])
+        )
@@ -0,0 +1,91 @@
+"""
+Données partagées par les pages (dataset consolidé, index KPI, agrégats).
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from secureops.kpi_index import KpiRangeIndex
+from secureops.live import LiveTable, LiveView
+from secureops.rollups import build_rollups, update_rollups
+from secureops.storage import read_table
+
+# =====================================================================
+# CHARGEMENT DES DONNÉES
+# =====================================================================
+# Colonnes du dataset consolidé réellement utilisées par l'application
+DASHBOARD_COLUMNS = [
+    "date",
+    "total_sessions",
+    "anomalies_detected",
+    "high_risk_sessions",
+    "critical_incidents",
+    "total_incidents",
+    "total_tickets",
+    "avg_incident_duration_days",
+    "p95_resolution_minutes",
+    "avg_ip_reputation"
+]
+
+@st.cache_data
+def load_consolidated_data():
+    try:
+        # Store Parquet typé (python -m secureops.storage), projection sur les colonnes utiles
+        df = read_table("consolidated_soc", columns=DASHBOARD_COLUMNS)
+        return df
+    except:
+        dates = pd.date_range(end=datetime.now(), periods=90, freq='D')
+        return pd.DataFrame({
+            'date': dates,
+            'total_sessions': np.random.randint(80, 150, 90),
+            'anomalies_detected': np.random.randint(10, 80, 90),
+            'high_risk_sessions': np.random.randint(20, 100, 90),
+            'critical_incidents': np.random.randint(0, 15, 90),
+            'total_incidents': np.random.randint(50, 200, 90),
+            'total_tickets': np.random.randint(100, 400, 90),
+            'avg_incident_duration_days': np.random.uniform(0.2, 8, 90),
+            'p95_resolution_minutes': np.random.uniform(60, 480, 90),
+            'avg_ip_reputation': np.random.uniform(0.4, 0.95, 90)
+        })
+
+@st.cache_resource
+def load_live_table():
+    """Dataset consolidé tenu à jour : seules les lignes nouvelles sont relues du store"""
+    return LiveTable("consolidated_soc", DASHBOARD_COLUMNS, frame=load_consolidated_data())
+
+def current_data():
+    """Dataset consolidé, avec les lignes déjà chargées par le mode live"""
+    return load_live_table().snapshot()[1]
+
+def refresh_data():
+    """Relit le store si de nouvelles lignes sont arrivées ; retourne leur nombre"""
+    try:
+        return load_live_table().poll()
+    except:
+        return 0
+
+def _rows_since(df, since):
+    return df[df["date"] >= since]
+
+@st.cache_resource
+def _kpi_index_view():
+    metrics = [c for c in DASHBOARD_COLUMNS if c != "date"]
+    return LiveView(
+        load_live_table(),
+        build=lambda df: KpiRangeIndex(df, metrics),
+        update=lambda index, df, since: index.extend(_rows_since(df, since))
+    )
+
+def load_kpi_index():
+    """Index trié + préfixes / sparse tables : KPI d'une période en O(1)"""
+    return _kpi_index_view().get()
+
+@st.cache_resource
+def _rollups_view():
+    return LiveView(load_live_table(), build=build_rollups, update=update_rollups)
+
+def load_rollups():
+    """Agrégats jour / semaine / mois, complétés à partir des jours modifiés à chaque nouvelle version"""
+    return _rollups_view().get()
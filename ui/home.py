@@ -0,0 +1,217 @@
+"""
+Page d'accueil : synthèse SOC et présentation de la plateforme.
+"""
+import streamlit as st
+
+from ui import assets
+from ui.data import current_data
+
+
+# =====================================================================
+# PAGE: ACCUEIL
+# =====================================================================
+def render():
+    st.markdown("""
+    <div class="soc-header">
+        <h1>🔐 Plateforme SOC SecureOps</h1>
+        <p>Centre de supervision et de réponse aux incidents de sécurité</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    df = current_data()
+    
+    # Métriques temps réel style capture
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <span class="metric-icon">🚨</span>
+            <div class="metric-value">{int(df['anomalies_detected'].tail(7).sum())}</div>
+            <div class="metric-label">Anomalies (7j)</div>
+            <div class="metric-trend trend-up">↑ +12%</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <span class="metric-icon">⚠️</span>
+            <div class="metric-value">{int(df['high_risk_sessions'].tail(7).sum())}</div>
+            <div class="metric-label">Haut Risque (7j)</div>
+            <div class="metric-trend trend-down">↓ -5%</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <span class="metric-icon">🔴</span>
+            <div class="metric-value">{int(df['critical_incidents'].tail(7).sum())}</div>
+            <div class="metric-label">Incidents Critiques</div>
+            <div class="metric-trend trend-stable">→ 0%</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <span class="metric-icon">⏱️</span>
+            <div class="metric-value">{df['avg_incident_duration_days'].mean():.1f}j</div>
+            <div class="metric-label">MTTR Moyen</div>
+            <div class="metric-trend trend-down">↓ -8%</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Section À propos
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        <div class="section-container">
+            <div class="section-title">🏢 À propos de SecureOps</div>
+            <p style="font-size: 1.1rem; line-height: 2; color: #374151;">
+                <strong>SecureOps ( Développé au sein de SSN - Système Security Network)</strong> est la plateforme SOC de nouvelle génération 
+                conçue pour les entreprises exigeantes en matière de cybersécurité.
+            </p>
+                        <p style="font-size: 1.15rem; line-height: 2; color: #1f2937; font-weight: 600; margin-bottom: 1.5rem;">
+                <strong style="color: #667eea;">System Security Network ICT (SSNICT)</strong> est un leader incontesté 
+                de la cybersécurité en Afrique Centrale depuis plus de <strong>20 ans</strong>.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        try:
+            assets.image("7.jpg", use_container_width=True)
+        except:
+            st.markdown("""
+            <div class="section-container" style="text-align: center; padding: 3rem 2rem;">
+                <div style="font-size: 5rem;">🛡️</div>
+                <h3 style="color: #667eea; margin-top: 1rem;">Protection Enterprise</h3>
+            </div>
+            """, unsafe_allow_html=True)
+    # Services SSNICT
+    st.markdown("---")
+    st.markdown('<div class="section-title">🛡️ Services SSNICT</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">🔒 Cybersécurité</h3>
+            <ul style="line-height: 2.2; color: #4b5563;">
+                <li><strong>Audit de sécurité</strong> complet</li>
+                <li><strong>Installation</strong> de systèmes de protection</li>
+                <li><strong>Maintenance</strong> infrastructure sécurité</li>
+                <li><strong>Formation</strong> en cybersécurité</li>
+                <li><strong>Pentesting</strong> & évaluation</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">💻 Développement Web</h3>
+            <ul style="line-height: 2.2; color: #4b5563;">
+                <li><strong>Sites vitrines</strong> professionnels</li>
+                <li><strong>E-commerce</strong> sur mesure</li>
+                <li><strong>Applications web</strong> métier</li>
+                <li><strong>Maintenance</strong> & support</li>
+                <li><strong>Hébergement</strong> sécurisé</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">📊 Marketing Digital</h3>
+            <ul style="line-height: 2.2; color: #4b5563;">
+                <li><strong>SEO/SEM</strong> optimisation</li>
+                <li><strong>Gestion</strong> réseaux sociaux</li>
+                <li><strong>Publicité</strong> en ligne</li>
+                <li><strong>Analytics</strong> & reporting</li>
+                <li><strong>Stratégie</strong> digitale</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Vision & Mission
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">🎯 Notre Mission</h3>
+            <p style="font-size: 1.05rem; line-height: 1.9; color: #374151;">
+                <strong>Promouvoir la vulgarisation des TIC</strong> auprès des couches vulnérables 
+                pour contribuer à leur auto-emploi. SSNICT met ses compétences au profit de la classe 
+                nécessiteuse pour mieux les équiper et faciliter leur entrée dans le monde de l'emploi.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">👁️ Notre Vision</h3>
+            <p style="font-size: 1.05rem; line-height: 1.9; color: #374151;">
+                <strong>Devenir le partenaire de référence</strong> en cybersécurité et solutions IT 
+                en Afrique Centrale, en offrant des solutions innovantes qui correspondent aux besoins 
+                réels de nos clients avec les technologies les plus adaptées.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    # Capacités SOC
+    st.markdown("---")
+    st.markdown('<div class="section-title">⚡ Capacités SOC Enterprise</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">🎯 Détection Avancée</h3>
+            <ul style="line-height: 2.2; color: #4b5563;">
+                <li>Corrélation multi-sources temps réel</li>
+                <li>Behavioral analytics & UEBA</li>
+                <li>Machine Learning (Isolation Forest)</li>
+                <li>Threat Intelligence intégrée</li>
+                <li>Détection 0-day patterns</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">🚀 Réponse Automatisée</h3>
+            <ul style="line-height: 2.2; color: #4b5563;">
+                <li>Playbooks SOAR personnalisables</li>
+                <li>Orchestration automatique</li>
+                <li>Containment intelligent</li>
+                <li>Escalade adaptative</li>
+                <li>Remédiation automatique</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="section-container">
+            <h3 style="color: #667eea; margin-bottom: 1rem;">📈 Analyse & Reporting</h3>
+            <ul style="line-height: 2.2; color: #4b5563;">
+                <li>Dashboards temps réel HD</li>
+                <li>KPIs SOC personnalisés</li>
+                <li>Rapports réglementaires auto</li>
+                <li>Forensics & investigation</li>
+                <li>Conformité RGPD/ISO27001</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,249 @@
+"""
+Analyse ML : scoring d'une session ou d'un fichier de sessions.
+"""
+from datetime import datetime
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from secureops.model_registry import MODEL_LABELS
+from secureops.sensitivity import LEGACY_CUTOFFS, risk_labels
+from ui.models import active_model, current_sensitivity, risk_cutoffs
+
+# Analyse par lot : taille des blocs et nombre de sessions affichées
+BATCH_CHUNK_SIZE = 50_000
+BATCH_TOP_N = 100
+# Dernier lot scoré (un seul conservé par session)
+BATCH_STATE_KEY = "ml_batch"
+
+
+def score_sessions_in_chunks(model, csv_file, chunksize=BATCH_CHUNK_SIZE, cutoffs=LEGACY_CUTOFFS):
+    """Score un CSV de sessions par blocs : un seul appel decision_function par bloc"""
+    for chunk in pd.read_csv(csv_file, chunksize=chunksize):
+        missing = [col for col in model.features if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Colonnes manquantes dans le fichier : {', '.join(missing)}")
+
+        id_cols = [col for col in ["session_id"] if col in chunk.columns]
+        scored = chunk[id_cols + model.features].copy()
+        scored["anomaly_score"] = model.decision_function(chunk)
+        scored["risk_level"] = risk_labels(scored["anomaly_score"].to_numpy(), cutoffs)
+        yield scored
+
+
+# =====================================================================
+# PAGE: ANALYSE ML
+# =====================================================================
+def render():
+    # Une seule lecture du modèle actif par rerun : une bascule s'applique au suivant
+    loaded = active_model()
+    model = loaded.pipeline if loaded is not None else None
+    
+    st.markdown("""
+    <div class="soc-header">
+        <h1>🧠 Analyse Machine Learning</h1>
+        <p>Détection d'anomalies réseau par intelligence artificielle</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if model is None:
+        st.error("❌ Modèle ML non disponible")
+        st.stop()
+
+    # Seuils de risque lus dans les quantiles du modèle (sensibilité des Paramètres)
+    critical_cut, high_cut = risk_cutoffs(loaded)
+    st.caption(f"🤖 Modèle actif : {MODEL_LABELS.get(loaded.model, loaded.model)} "
+               f"{loaded.version or '(models/)'} — sensibilité {current_sensitivity():.2f} "
+               f"(CRITIQUE < {critical_cut:.3f}, ÉLEVÉ < {high_cut:.3f}) — réglages dans ⚙️ Paramètres")
+    
+    tab_single, tab_batch = st.tabs(["🔍 Session unique", "📂 Analyse par lot (CSV)"])
+
+    with tab_single:
+        # Formulaire
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### 🔍 Paramètres de Session Réseau")
+    
+        col1, col2, col3 = st.columns(3)
+    
+        with col1:
+            packet_size = st.number_input("📦 Taille paquets (octets)", 0, 5000, 200, 50)
+            login_attempts = st.number_input("🔁 Tentatives connexion", 0, 50, 2, 1)
+    
+        with col2:
+            failed_logins = st.number_input("❌ Échecs connexion", 0, 20, 1, 1)
+            session_duration = st.number_input("⏱️ Durée session (sec)", 1, 10000, 300, 10)
+    
+        with col3:
+            ip_reputation = st.slider("🌐 Réputation IP", 0.0, 1.0, 0.7, 0.05)
+            unusual_time = st.selectbox("🕒 Horaire inhabituel", [0, 1], 
+                                         format_func=lambda x: "✅ Oui" if x == 1 else "❌ Non")
+    
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+        # Bouton analyse
+        col1, col2, col3 = st.columns([1, 1, 1])
+        with col2:
+            analyze_button = st.button("🔍 ANALYSER LA SESSION", use_container_width=True)
+    
+        if analyze_button:
+            session = {
+                "packet_size": packet_size,
+                "login_attempts_count": login_attempts,
+                "failed_logins_count": failed_logins,
+                "session_duration_seconds": session_duration,
+                "ip_reputation_score": ip_reputation,
+                "unusual_time_access": unusual_time
+            }
+
+            with st.spinner("⚙️ Analyse en cours..."):
+                anomaly_score = model.decision_function(session)[0]
+        
+            st.markdown("---")
+        
+            # Résultats
+            col1, col2 = st.columns([1, 1])
+        
+            with col1:
+                if anomaly_score < critical_cut:
+                    risk_level, risk_color, alert_class, risk_icon = "CRITIQUE", "#ef4444", "alert-critical", "🔴"
+                elif anomaly_score < high_cut:
+                    risk_level, risk_color, alert_class, risk_icon = "ÉLEVÉ", "#f59e0b", "alert-warning", "🟠"
+                else:
+                    risk_level, risk_color, alert_class, risk_icon = "FAIBLE", "#10b981", "alert-success", "🟢"
+            
+                st.markdown(f"""
+                <div class="{alert_class}">
+                    <h2 style="margin: 0;">{risk_icon} Niveau: {risk_level}</h2>
+                    <p style="margin: 0.5rem 0 0 0; font-size: 1.2rem;">
+                        Score: <strong>{anomaly_score:.4f}</strong>
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+                # Jauge
+                fig_gauge = go.Figure(go.Indicator(
+                    mode="gauge+number",
+                    value=anomaly_score,
+                    title={'text': "Score ML", 'font': {'size': 22}},
+                    number={'font': {'size': 44}},
+                    gauge={
+                        'axis': {'range': [-0.5, 0.5]},
+                        'bar': {'color': risk_color, 'thickness': 0.8},
+                        'steps': [
+                            {'range': [-0.5, critical_cut], 'color': 'rgba(239, 68, 68, 0.2)'},
+                            {'range': [critical_cut, high_cut], 'color': 'rgba(245, 158, 11, 0.2)'},
+                            {'range': [high_cut, 0.5], 'color': 'rgba(16, 185, 129, 0.2)'}
+                        ]
+                    }
+                ))
+                fig_gauge.update_layout(height=350, margin=dict(l=40, r=40, t=100, b=40))
+                st.plotly_chart(fig_gauge, use_container_width=True)
+        
+            with col2:
+                st.markdown(f"""
+                <div class="section-container">
+                    <h3 style="color: {risk_color};">🎯 Actions Recommandées</h3>
+                """, unsafe_allow_html=True)
+            
+                if anomaly_score < critical_cut:
+                    st.markdown("• 🚨 **ESCALADE IMMÉDIATE** niveau 3\n• 🔒 **ISOLER** session/IP\n• 📊 **FORENSICS** complet\n• 📞 **ALERTER** RSSI")
+                elif anomaly_score < high_cut:
+                    st.markdown("• ⚠️ **SURVEILLANCE** renforcée\n• 📈 **MONITORER** évolution\n• 🔎 **VÉRIFIER** corrélations")
+                else:
+                    st.markdown("• ✅ **APPROUVER** session\n• 📊 **LOGGER** pour audit\n• 🔄 **CONTINUER** surveillance")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+    with tab_batch:
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### 📂 Analyse par lot")
+        st.markdown(
+            "Importez un CSV au format `intrusion_processed.csv` "
+            f"(colonnes requises : {', '.join(f'`{c}`' for c in model.features)})."
+        )
+
+        uploaded = st.file_uploader("📄 Fichier de sessions", type=["csv"])
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        if uploaded is None:
+            # Fichier retiré : le dernier résultat n'est plus affichable, on libère la mémoire
+            st.session_state.pop(BATCH_STATE_KEY, None)
+        else:
+            col1, col2, col3 = st.columns([1, 1, 1])
+            with col2:
+                batch_button = st.button("🚀 SCORER LE FICHIER", use_container_width=True)
+
+            # Seul le dernier résultat est conservé en session : le téléchargement relance le script
+            batch = st.session_state.get(BATCH_STATE_KEY)
+            if batch is not None and batch["file_id"] != uploaded.file_id:
+                batch = None
+
+            if batch_button:
+                progress = st.progress(0.0, text="⚙️ Scoring en cours...")
+                live_table = st.empty()
+                parts = []
+                top = None
+                n_scored = 0
+                start = datetime.now()
+
+                try:
+                    for scored in score_sessions_in_chunks(model, uploaded, cutoffs=(critical_cut, high_cut)):
+                        parts.append(scored)
+                        n_scored += len(scored)
+
+                        # Classement provisoire : on ne garde que les N sessions les plus suspectes
+                        top = pd.concat([top, scored]).nsmallest(BATCH_TOP_N, "anomaly_score")
+                        live_table.dataframe(top, use_container_width=True, hide_index=True)
+
+                        done = min(uploaded.tell() / max(uploaded.size, 1), 1.0)
+                        progress.progress(done, text=f"⚙️ {n_scored:,} sessions scorées...")
+                except ValueError as e:
+                    progress.empty()
+                    st.error(f"❌ {e}")
+                    st.stop()
+
+                if not parts:
+                    progress.empty()
+                    st.error("❌ Le fichier ne contient aucune session")
+                    st.stop()
+
+                elapsed = (datetime.now() - start).total_seconds()
+                progress.progress(1.0, text=f"✅ {n_scored:,} sessions scorées en {elapsed:.1f}s")
+                live_table.empty()
+
+                results = (
+                    pd.concat(parts, ignore_index=True)
+                    .sort_values("anomaly_score", kind="stable")
+                    .reset_index(drop=True)
+                )
+                del parts, top
+                batch = {"file_id": uploaded.file_id, "results": results, "cutoffs": (critical_cut, high_cut),
+                         "csv": results.to_csv(index=False).encode("utf-8")}
+                st.session_state[BATCH_STATE_KEY] = batch
+
+            if batch is not None:
+                results = batch["results"]
+                # Sensibilité modifiée depuis le scoring : recomparaison des scores conservés,
+                # export CSV reconstruit une seule fois pour les nouveaux seuils
+                if batch["cutoffs"] != (critical_cut, high_cut):
+                    results["risk_level"] = risk_labels(results["anomaly_score"].to_numpy(), (critical_cut, high_cut))
+                    batch.update(cutoffs=(critical_cut, high_cut), csv=results.to_csv(index=False).encode("utf-8"))
+                counts = results["risk_level"].value_counts()
+
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("📊 Sessions", f"{len(results):,}")
+                col2.metric("🔴 Critiques", f"{counts.get('CRITIQUE', 0):,}")
+                col3.metric("🟠 Élevées", f"{counts.get('ÉLEVÉ', 0):,}")
+                col4.metric("🟢 Faibles", f"{counts.get('FAIBLE', 0):,}")
+
+                st.markdown(f"### 🎯 Top {BATCH_TOP_N} sessions les plus suspectes")
+                st.dataframe(results.head(BATCH_TOP_N), use_container_width=True, hide_index=True)
+
+                st.download_button(
+                    "📥 Télécharger les résultats classés (CSV)",
+                    batch["csv"],
+                    file_name=f"ml_scoring_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
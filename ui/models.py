@@ -0,0 +1,43 @@
+"""
+Modèles de détection : registre partagé par toutes les sessions.
+
+Le modèle actif se choisit dans ⚙️ Paramètres ; la page d'analyse ML
+récupère le pipeline actif à chaque rerun (bascule sans redémarrage).
+La sensibilité de l'analyste (session) fixe les seuils de risque à partir
+de la distribution des scores de référence du modèle actif.
+"""
+import streamlit as st
+
+from secureops.model_registry import ModelRegistry, reference_scores
+from secureops.sensitivity import DEFAULT_SENSITIVITY, LEGACY_CUTOFFS
+
+
+@st.cache_resource
+def load_model_registry():
+    """Registre des versions (un seul par processus, modèles chargés à la demande)"""
+    return ModelRegistry()
+
+
+def active_model():
+    """Version active (LoadedModel), ou None si aucun modèle n'est chargeable"""
+    try:
+        return load_model_registry().active()
+    except:
+        return None
+
+
+def current_sensitivity():
+    return st.session_state.get("sensitivity", DEFAULT_SENSITIVITY)
+
+
+def risk_cutoffs(loaded, sensitivity=None):
+    """(seuil CRITIQUE, seuil ÉLEVÉ) du modèle pour la sensibilité de la session"""
+    if loaded is None or loaded.distribution is None:
+        return LEGACY_CUTOFFS
+    return loaded.distribution.cutoffs(current_sensitivity() if sensitivity is None else sensitivity)
+
+
+@st.cache_resource(max_entries=4)
+def load_reference_scores(model, version, _pipeline):
+    """Scores des sessions du store pour une version (calculés une fois, recomparés à chaque seuil)"""
+    return reference_scores(_pipeline)
@@ -0,0 +1,269 @@
+"""
+Paramètres de la plateforme.
+"""
+import time
+
+import pandas as pd
+import streamlit as st
+
+from secureops import retraining
+from secureops.alerts import DAY_S, format_alert, format_window
+from secureops.model_registry import MODEL_LABELS
+from secureops.sensitivity import DEFAULT_SENSITIVITY, flag_rate
+from ui import timing
+from ui.alerting import build_sinks, load_alert_monitor, recent_alerts
+from ui.models import active_model, load_model_registry, load_reference_scores, risk_cutoffs
+
+
+# =====================================================================
+# PAGE: PARAMÈTRES
+# =====================================================================
+def render():
+    st.markdown("""
+    <div class="soc-header">
+        <h1>⚙️ Configuration Système</h1>
+        <p>Paramètres et configuration de la plateforme SecureOps</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["🔧 Général", "🔔 Alertes", "📊 Modèle ML", "⚡ Performance"])
+    
+    with tab1:
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### 🔧 Paramètres Généraux")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.text_input("🏢 Organisation", value="SecureOps SOC")
+            st.selectbox("🌍 Fuseau horaire", ["UTC", "Europe/Paris", "America/New_York"])
+        
+        with col2:
+            # Intervalle du mode live du tableau de bord (conservé hors du widget)
+            st.session_state.refresh_interval_s = st.number_input(
+                "⏱️ Rafraîchissement (sec)", 10, 300,
+                st.session_state.get("refresh_interval_s", 60),
+                help="Intervalle de rafraîchissement du mode live (📊 Tableau de bord SOC)"
+            )
+            st.selectbox("🎨 Thème", ["Clair", "Sombre", "Auto"])
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with tab2:
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### 🔔 Configuration Alertes")
+        
+        # Réglages du moteur partagé (toutes les sessions) : appliqués seulement à l'enregistrement
+        monitor = load_alert_monitor()
+        engine = monitor.engine
+        rules = engine.rules
+        active_sinks = {sink.name for sink in engine.dispatcher.sinks}
+        
+        with st.form("alert_settings"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                anomalies_threshold = st.slider(
+                    "🚨 Seuil anomalies", 0, 5000, rules["anomalies"].threshold, 50,
+                    help="Anomalies sur la fenêtre glissante (0 = règle désactivée)"
+                )
+                high_risk_threshold = st.slider(
+                    "⚠️ Seuil sessions risque", 0, 10000, rules["high_risk"].threshold, 100,
+                    help="Sessions à haut risque sur la fenêtre glissante (0 = règle désactivée)"
+                )
+                # Sessions datées au jour près : fenêtre en jours de sessions
+                window_days = st.select_slider(
+                    "🕒 Fenêtre glissante (jours)", [1, 2, 3, 7, 14, 30],
+                    value=max(1, int(rules["anomalies"].window_s // DAY_S))
+                )
+            
+            with col2:
+                email = st.checkbox("📧 Email", value="email" in active_sinks)
+                slack = st.checkbox("🔔 Slack", value="slack" in active_sinks)
+            
+            if st.form_submit_button("💾 Enregistrer", use_container_width=True):
+                engine.configure(
+                    {"anomalies": anomalies_threshold, "high_risk": high_risk_threshold},
+                    window_s=window_days * DAY_S
+                )
+                if (email, slack) != ("email" in active_sinks, "slack" in active_sinks):
+                    engine.dispatcher.set_sinks(build_sinks(email, slack))
+                st.success("✅ Règles d'alerte enregistrées (toutes les sessions)")
+        
+        # État du moteur et de la livraison
+        state = engine.snapshot()
+        delivery = engine.dispatcher.stats()
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("📥 Sessions analysées", f"{state['events']:,}")
+        m2.metric("🚨 Alertes émises", len(state["history"]))
+        m3.metric("📤 Livraisons", sum(s["delivered"] for s in delivery["sinks"].values()))
+        m4.metric("❌ Échecs / perdues",
+                  sum(s["failed"] for s in delivery["sinks"].values()) + delivery["dropped"])
+        
+        for name, rule in state["rules"].items():
+            st.caption(f"{rule['label']} : {rule['count']} / {rule['threshold'] or '—'} "
+                       f"sur {format_window(rule['window_s'])}")
+        for name, sink in delivery["sinks"].items():
+            if sink["last_error"]:
+                st.caption(f"⚠️ {name} : {sink['last_error']}")
+        
+        # Sept derniers jours de sessions (datation des événements, comme les règles)
+        history = recent_alerts(within_s=7 * DAY_S)
+        if history:
+            st.dataframe(pd.DataFrame([
+                {"Date": pd.to_datetime(a["ts"], unit="s"), "Sévérité": a["severity"], "Alerte": format_alert(a)}
+                for a in history[:20]
+            ]), use_container_width=True, hide_index=True)
+        
+        if st.button("📨 Envoyer une alerte de test"):
+            engine.dispatcher.submit({
+                "rule": "test", "label": "Alerte de test", "severity": "INFO",
+                "count": 0, "threshold": 0, "window_s": rules["anomalies"].window_s,
+                "ts": state["last_ts"] if state["last_ts"] is not None else time.time()
+            })
+            st.success("✅ Alerte de test mise en file de livraison")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with tab3:
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### 📊 Configuration ML")
+        
+        registry = load_model_registry()
+        active = active_model()
+        # Modèles ayant au moins une version enregistrée (les autres ne sont pas sélectionnables)
+        catalog = {name: versions for name, versions in registry.models().items() if versions}
+        if not catalog:
+            st.info("ℹ️ Registre vide : modèle servi depuis `models/` "
+                    "(import : `python -m secureops.model_registry import models`)")
+        else:
+            names = list(catalog)
+            current = active.model if active is not None and active.model in names else names[0]
+            
+            model_name = st.selectbox("🤖 Modèle", names, index=names.index(current),
+                                      format_func=lambda m: MODEL_LABELS.get(m, m))
+            # Plus récente en premier ; la version active est présélectionnée
+            choices = catalog[model_name][::-1]
+            default = active.version if active is not None and active.model == model_name else None
+            version = st.selectbox("🏷️ Version", choices,
+                                   index=choices.index(default) if default in choices else 0)
+            meta = registry.meta(model_name, version)
+            st.caption(f"Créée le {meta.get('created_at', '?')} — {meta.get('estimator', '?')} "
+                       f"— source : {meta.get('source', '?')}")
+            
+            if active is not None and (active.model, active.version) == (model_name, version):
+                st.success("✅ Version active")
+            elif st.button("🔁 Activer cette version", use_container_width=True):
+                try:
+                    loaded = registry.activate(model_name, version)
+                    st.success(f"✅ {MODEL_LABELS.get(model_name, model_name)} {version} actif "
+                               f"(chargé en {loaded.load_s * 1000:.1f} ms)")
+                except Exception as e:
+                    st.error(f"❌ Activation impossible : {e}")
+        
+        # Sensibilité de la session : seuil lu dans les quantiles de référence, sans réentraînement
+        st.session_state.sensitivity = st.slider(
+            "🎯 Sensibilité", 0.0, 1.0, st.session_state.get("sensitivity", DEFAULT_SENSITIVITY), 0.05,
+            help=f"0.5 = {flag_rate(DEFAULT_SENSITIVITY):.0%} des sessions signalées "
+                 f"(contamination de l'entraînement), 1.0 = {flag_rate(1.0):.0%}"
+        )
+        if active is not None and active.distribution is not None:
+            critical_cut, high_cut = risk_cutoffs(active)
+            try:
+                # Store entier rescoré à ce seuil : une comparaison sur les scores déjà calculés
+                scores = load_reference_scores(active.model, active.version, active.pipeline)
+                flagged, critical = int((scores < high_cut).sum()), int((scores < critical_cut).sum())
+                col1, col2, col3 = st.columns(3)
+                col1.metric("🟠 Seuil ÉLEVÉ", f"< {high_cut:.4f}")
+                col2.metric("🔴 Seuil CRITIQUE", f"< {critical_cut:.4f}")
+                col3.metric("🚩 Sessions signalées", f"{flagged:,} / {len(scores):,}",
+                            help=f"dont {critical:,} critiques")
+            except:
+                st.caption(f"Seuils : CRITIQUE < {critical_cut:.4f}, ÉLEVÉ < {high_cut:.4f}")
+        elif active is not None:
+            st.caption("Pas de distribution de référence pour cette version : seuils fixes (-0.10 / 0)")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### 🔄 Réentraînement")
+        
+        # Le job tourne dans un processus séparé : la page ne lit que son compte rendu
+        job = retraining.read_status()
+        running = retraining.is_running(job)
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            if st.button("🔄 Réentraîner maintenant", use_container_width=True, disabled=running):
+                if retraining.launch() is not None:
+                    st.success("✅ Réentraînement lancé en arrière-plan")
+                    job, running = retraining.read_status(), True
+        with col2:
+            st.caption(f"Fenêtre : {retraining.WINDOW_SESSIONS:,} sessions les plus récentes, "
+                       f"dont les {retraining.HOLDOUT_FRACTION:.0%} dernières pour l'évaluation. "
+                       f"Planification : `python -m secureops.retraining --every 24`")
+        
+        if running:
+            st.info(f"⏳ En cours depuis {job.get('started_at', '?')} (étape : {job.get('step') or 'préparation'})")
+        elif job.get("state") == "failed":
+            st.error(f"❌ Dernier réentraînement en échec : {job.get('error')}")
+        elif job.get("state") == "done":
+            st.caption(f"Dernier réentraînement : {job.get('finished_at')} — {job.get('reason')} — "
+                       f"{job.get('train_sessions', 0):,} sessions ajustées en {job.get('fit_seconds', 0):.1f}s")
+            if job.get("metrics"):
+                st.dataframe(
+                    pd.DataFrame(job["metrics"]).T.rename(index={"candidate": "Candidat", "current": "Actif"}).round(4),
+                    use_container_width=True
+                )
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### 💾 Modèles chargés (ce processus)")
+        
+        loaded_stats = registry.stats()
+        if loaded_stats:
+            models_df = pd.DataFrame([
+                {
+                    "Modèle": MODEL_LABELS.get(row["model"], row["model"]),
+                    "Version": row["version"] or "models/",
+                    "Actif": "✅" if row["active"] else "",
+                    "Chargement (ms)": row["load_s"] * 1000,
+                    "Fichiers (Mo)": row["file_bytes"] / 1e6,
+                    "Projeté (Mo)": row["mapped_bytes"] / 1e6,
+                    "Privé (Mo)": row["private_bytes"] / 1e6
+                }
+                for row in loaded_stats
+            ])
+            st.dataframe(models_df.round(2), use_container_width=True, hide_index=True)
+            st.caption("Projeté : tableaux lus en mmap, partagés entre les processus qui servent "
+                       "la même version. Privé : copie propre à ce processus.")
+        else:
+            st.info("Aucun modèle chargé pour l'instant")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with tab4:
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.markdown("### ⚡ Démarrage & chargement des pages")
+        
+        startup, pages = timing.snapshot()
+        if startup["first_paint_s"] is not None:
+            st.metric("🚀 Premier affichage (démarrage à froid)", f"{startup['first_paint_s']:.2f}s",
+                      help=f"Page d'arrivée: {startup['first_page']}")
+        
+        if pages:
+            perf_df = pd.DataFrame([
+                {
+                    "Page": name,
+                    "Import (s)": t.get("import_s"),
+                    "1er rendu (s)": t.get("first_render_s"),
+                    "Dernier rendu (s)": t.get("last_render_s"),
+                    "Rendus": t.get("renders", 0)
+                }
+                for name, t in pages.items()
+            ])
+            st.dataframe(perf_df.round(3), use_container_width=True, hide_index=True)
+            st.caption("Chaque page est importée à sa première visite : ses dépendances "
+                       "(plotly, Groq, reportlab, modèle ML) ne ralentissent pas les autres pages.")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,57 @@
+"""
+Mesure du démarrage : chargement des pages et premier affichage.
+
+Les mesures sont propres au processus Streamlit (partagées entre sessions) :
+- `first_paint_s` : durée du premier passage du script (démarrage à froid,
+  de la première ligne d'`app.py` à la fin du rendu de la page) ;
+- par page : temps d'import du module (une fois) et temps de rendu.
+"""
+import importlib
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+STARTUP = {"first_paint_s": None, "first_page": None}
+PAGE_TIMINGS = {}
+
+
+def load_page(module_name):
+    """Module de page, importé (et chronométré) à la première demande"""
+    started = time.perf_counter()
+    already_loaded = module_name in sys.modules
+    module = importlib.import_module(module_name)
+    if not already_loaded:
+        import_s = time.perf_counter() - started
+        with _lock:
+            PAGE_TIMINGS.setdefault(module_name, {})["import_s"] = import_s
+        logger.info("Page %s chargée en %.3fs", module_name, import_s)
+    return module
+
+
+def render_page(module_name, run_started):
+    """Importe puis affiche la page ; `run_started` = début du passage du script"""
+    module = load_page(module_name)
+    started = time.perf_counter()
+    module.render()
+    ended = time.perf_counter()
+
+    with _lock:
+        timings = PAGE_TIMINGS.setdefault(module_name, {})
+        timings["last_render_s"] = ended - started
+        timings["renders"] = timings.get("renders", 0) + 1
+        timings.setdefault("first_render_s", ended - started)
+        if STARTUP["first_paint_s"] is None:
+            STARTUP["first_paint_s"] = ended - run_started
+            STARTUP["first_page"] = module_name
+            logger.info("Premier affichage (%s) en %.3fs", module_name, ended - run_started)
+    return ended - run_started
+
+
+def snapshot():
+    """(mesures de démarrage, mesures par page) — copies"""
+    with _lock:
+        return dict(STARTUP), {name: dict(t) for name, t in PAGE_TIMINGS.items()}